@@ -112,7 +112,7 @@ def news_summarize(
             title=art.title,
             text=art.summary or art.title,
             source_name=art.source_name,
-            tags=art.tags,
+            tags=list(art.tags),
             kb_context=kb_context,
         )
 
@@ -138,7 +138,7 @@ def news_summarize(
             source_url=art.url,
             source_name=art.source_name,
             source_article_id=art.id,
-            tags=result.suggested_tags or art.tags,
+            tags=result.suggested_tags or list(art.tags),
             ai_model=result.response.model if result.response else None,
             ai_provider=result.response.provider if result.response else None,
             input_tokens=result.response.input_tokens if result.response else 0,
@@ -18,7 +18,7 @@ from __future__ import annotations
 import datetime as dt
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import typer
 import yaml
@@ -111,6 +111,9 @@ def fetch_wiki(
     ),
     limit: int = typer.Option(500, "--limit", "-n", help="Max records to fetch per category"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Fetch but do not save to database"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always query Wikidata; bypass the cached SPARQL responses"
+    ),
 ) -> None:
     """
     Fetch historical data from Wikidata and store it in the database.
@@ -118,6 +121,7 @@ def fetch_wiki(
     No API key required. Uses the public Wikidata SPARQL endpoint.
     Types: stf | deputies | senators | presidents | governors | events | legislatures | all
     """
+    from src.sources.cache import get_cache
     from src.sources.wikidata import WikidataClient
 
     valid_types = {"stf", "deputies", "senators", "presidents", "governors", "events", "legislatures", "all"}
@@ -126,32 +130,48 @@ def fetch_wiki(
         raise typer.Exit(1)
 
     store = _store()
-    client = WikidataClient()
+    client = WikidataClient(cache=None if no_cache else get_cache())
     total_saved = 0
 
-    fetch_map = {
+    fetch_map: dict[str, tuple[str, Callable[[], list], None]] = {
         "stf": ("STF ministers", client.fetch_stf_ministers, None),
         "deputies": ("Federal Deputies", lambda: client.fetch_federal_deputies(limit=limit), None),
         "senators": ("Senators", lambda: client.fetch_senators(limit=limit), None),
         "presidents": ("Presidents", client.fetch_presidents, None),
         "governors": ("Governors", lambda: client.fetch_governors(limit=limit), None),
+        # Deputies, senators and presidents in one SPARQL round-trip (type=all only)
+        "positions": (
+            "Deputies, Senators & Presidents",
+            lambda: client.fetch_all_political_positions(limit=limit),
+            None,
+        ),
         "events": ("Political Events", lambda: client.fetch_political_events(limit=limit), None),
         "legislatures": ("Legislatures", client.fetch_legislatures, None),
     }
 
-    to_run = list(fetch_map.keys()) if type == "all" else [type]
+    prefetched: dict[str, list] = {}
+    if type == "all":
+        to_run = ["stf", "positions", "governors", "events", "legislatures"]
+        with console.status("Fetching all categories from Wikidata…"):
+            prefetched = client.fetch_all(limit=limit)
+    else:
+        to_run = [type]
 
     for key in to_run:
         label, fn, _ = fetch_map[key]
-        with console.status(f"Fetching {label} from Wikidata…"):
-            try:
-                records = fn()
-            except Exception as exc:
-                console.print(f"[red]  ✗ {label}: {exc}[/red]")
-                continue
+        if key in prefetched:
+            records = prefetched[key]
+        else:
+            # Single type, or a category that failed in fetch_all: run it on its own
+            with console.status(f"Fetching {label} from Wikidata…"):
+                try:
+                    records = fn()
+                except Exception as exc:
+                    console.print(f"[red]  ✗ {label}: {exc}[/red]")
+                    continue
 
         if not dry_run:
-            if key in ("stf", "deputies", "senators", "presidents", "governors"):
+            if key in ("stf", "deputies", "senators", "presidents", "governors", "positions"):
                 saved = store.upsert_politicians(records)
             elif key == "events":
                 saved = store.upsert_events(records)
@@ -5,8 +5,9 @@ Commands:
   anticorrupt sources status             → Show cache age per source
   anticorrupt sources refresh            → Force-refresh all API caches
   anticorrupt sources refresh --source camara
-  anticorrupt sources snapshot           → Export full cache to JSON dump
+  anticorrupt sources snapshot           → Export full cache to an ndjson dump
   anticorrupt sources import <file>      → Import a snapshot
+  anticorrupt sources maintenance        → ANALYZE + VACUUM the cache database
 """
 
 from __future__ import annotations
@@ -117,9 +118,9 @@ def refresh(
 
 @app.command()
 def snapshot(
-    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output .json.gz path"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output path (.jsonl.zst or .jsonl.gz)"),
 ):
-    """Export the full API cache to a compressed JSON snapshot for backup/portability."""
+    """Export the full API cache to a compressed ndjson snapshot for backup/portability."""
     cache = _get_cache()
     path = cache.export_snapshot(output_path=output)
     stats = cache.stats()
@@ -137,7 +138,7 @@ def snapshot(
 
 @app.command(name="import-snapshot")
 def import_snapshot(
-    file: Path = typer.Argument(..., help="Path to a .json.gz snapshot file"),
+    file: Path = typer.Argument(..., help="Path to a .jsonl.zst / .jsonl.gz (or legacy .json.gz) snapshot"),
 ):
     """Import a previously exported cache snapshot."""
     if not file.exists():
@@ -153,6 +154,21 @@ def import_snapshot(
     ))
 
 
+# ---------------------------------------------------------------------------
+# maintenance
+# ---------------------------------------------------------------------------
+
+@app.command()
+def maintenance():
+    """Refresh query-planner statistics and reclaim free space in the cache."""
+    with _get_cache() as cache:
+        vacuumed = cache.maintenance()
+    if vacuumed:
+        console.print("[green]✓[/green] Cache analyzed and vacuumed.")
+    else:
+        console.print("[green]✓[/green] Cache analyzed (no vacuum needed).")
+
+
 # ---------------------------------------------------------------------------
 # invalidate
 # ---------------------------------------------------------------------------
@@ -30,9 +30,7 @@ def load_institutions(data_dir: Path) -> dict[str, Institution]:
     inst_dir = data_dir / "institutions"
     if not inst_dir.exists():
         return institutions
-    for path in sorted(inst_dir.glob("*.yaml")):
-        if path.name.startswith("_"):
-            continue
+    for path in sorted(inst_dir.glob("[!_]*.yaml")):
         data = _load_yaml(path)
         inst = Institution.model_validate(data)
         institutions[inst.id] = inst
@@ -45,9 +43,7 @@ def load_figures(data_dir: Path) -> dict[str, PublicFigure]:
     fig_dir = data_dir / "figures"
     if not fig_dir.exists():
         return figures
-    for path in sorted(fig_dir.glob("*.yaml")):
-        if path.name.startswith("_"):
-            continue
+    for path in sorted(fig_dir.glob("[!_]*.yaml")):
         data = _load_yaml(path)
         fig = PublicFigure.model_validate(data)
         figures[fig.id] = fig
@@ -60,9 +56,7 @@ def load_events(data_dir: Path) -> dict[str, Event]:
     events_dir = data_dir / "events"
     if not events_dir.exists():
         return events
-    for path in sorted(events_dir.glob("*.yaml")):
-        if path.name.startswith("_"):
-            continue
+    for path in sorted(events_dir.glob("[!_]*.yaml")):
         data = _load_yaml(path)
         event = Event.model_validate(data)
         events[event.id] = event
@@ -80,9 +74,7 @@ def load_relationships(data_dir: Path) -> list[Relationship]:
     rel_dir = data_dir / "relationships"
     if not rel_dir.exists():
         return relationships
-    for path in sorted(rel_dir.glob("*.yaml")):
-        if path.name.startswith("_"):
-            continue
+    for path in sorted(rel_dir.glob("[!_]*.yaml")):
         data = _load_yaml(path)
         if isinstance(data, list):
             for item in data:
@@ -106,9 +98,7 @@ def load_glossary(data_dir: Path) -> dict[str, GlossaryTerm]:
     glossary_dir = data_dir / "glossary"
     if not glossary_dir.exists():
         return glossary
-    for path in sorted(glossary_dir.glob("*.yaml")):
-        if path.name.startswith("_"):
-            continue
+    for path in sorted(glossary_dir.glob("[!_]*.yaml")):
         data = _load_yaml(path)
         if isinstance(data, dict) and "terms" in data:
             terms_list = data["terms"]
@@ -197,9 +197,7 @@ def validate_knowledge_base(data_dir: Path) -> ValidationReport:
                 )
             )
             continue
-        for path in sorted(dir_path.glob("*.yaml")):
-            if path.name.startswith("_"):
-                continue
+        for path in sorted(dir_path.glob("[!_]*.yaml")):
             result = _validate_file(path, subdir, data_dir)
             report.results.append(result)
 
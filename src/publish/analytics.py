@@ -26,7 +26,9 @@ from pathlib import Path
 from typing import Optional
 
 import sqlite_utils
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, Field, computed_field
+
+from src.publish.db import ReadPool, tune_connection
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +46,7 @@ class MetricRecord(BaseModel):
     draft_id: str
     metric_name: str
     metric_value: float
-    fetched_at: dt.datetime = dt.datetime.now(dt.timezone.utc)
+    fetched_at: dt.datetime = Field(default_factory=lambda: dt.datetime.now(dt.timezone.utc))
 
     @computed_field  # type: ignore[misc]
     @property
@@ -76,10 +78,36 @@ class AnalyticsStore:
 
     TABLE = "metrics"
 
+    # True upsert: unlike INSERT OR REPLACE it updates the row in place
+    # instead of delete + insert, so unchanged index entries are not rewritten.
+    _UPSERT_SQL = f"""
+        INSERT INTO {TABLE}
+            (id, post_id, platform, draft_id, metric_name, metric_value, fetched_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            metric_value = excluded.metric_value,
+            fetched_at = excluded.fetched_at
+    """
+
+    # Read statements are fixed strings so SQLite's statement cache can reuse
+    # the compiled plan across calls.
+    _POST_SQL = f"SELECT metric_name, metric_value FROM {TABLE} WHERE post_id = ? AND platform = ?"
+    _TOP_SQL = f"""
+        SELECT post_id, draft_id, metric_value, fetched_at
+        FROM {TABLE}
+        WHERE platform = ? AND metric_name = ?
+        ORDER BY metric_value DESC
+        LIMIT ?
+    """
+    _SUMMARY_SQL = f"SELECT COUNT(*), COUNT(DISTINCT post_id) FROM {TABLE}"
+    _SUMMARY_PLATFORM_SQL = f"{_SUMMARY_SQL} WHERE platform = ?"
+
     def __init__(self, db_path: Path) -> None:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self._db = sqlite_utils.Database(db_path)
+        tune_connection(self._db)
         self._ensure_schema()
+        self._readers = ReadPool(self._db, db_path)
 
     # ------------------------------------------------------------------
     # Schema
@@ -99,10 +127,25 @@ class AnalyticsStore:
                 },
                 pk="id",
             )
-            self._db[self.TABLE].create_index(["post_id"])
-            self._db[self.TABLE].create_index(["draft_id"])
-            self._db[self.TABLE].create_index(["platform"])
-            self._db[self.TABLE].create_index(["metric_name"])
+        # Composite indexes matching the hot query shapes: top_posts walks
+        # (platform, metric_name) already ordered by value, get_post_metrics
+        # seeks on (post_id, platform) and get_draft_metrics reads
+        # (draft_id, platform, metric_name) already sorted.  They replace the
+        # old single-column indexes.
+        self._db.executescript(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_top
+                ON {self.TABLE} (platform, metric_name, metric_value DESC);
+            CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_post
+                ON {self.TABLE} (post_id, platform);
+            CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_draft
+                ON {self.TABLE} (draft_id, platform, metric_name);
+            DROP INDEX IF EXISTS idx_{self.TABLE}_post_id;
+            DROP INDEX IF EXISTS idx_{self.TABLE}_draft_id;
+            DROP INDEX IF EXISTS idx_{self.TABLE}_platform;
+            DROP INDEX IF EXISTS idx_{self.TABLE}_metric_name;
+            """
+        )
 
     # ------------------------------------------------------------------
     # Write
@@ -110,18 +153,19 @@ class AnalyticsStore:
 
     def store(self, record: MetricRecord) -> None:
         """Upsert a single metric record."""
-        self._db[self.TABLE].insert(
-            {
-                "id": record.id,
-                "post_id": record.post_id,
-                "platform": record.platform,
-                "draft_id": record.draft_id,
-                "metric_name": record.metric_name,
-                "metric_value": record.metric_value,
-                "fetched_at": record.fetched_at.isoformat(),
-            },
-            replace=True,
-        )
+        with self._db.conn:
+            self._db.conn.execute(
+                self._UPSERT_SQL,
+                (
+                    record.id,
+                    record.post_id,
+                    record.platform,
+                    record.draft_id,
+                    record.metric_name,
+                    record.metric_value,
+                    record.fetched_at.isoformat(),
+                ),
+            )
 
     def store_batch(
         self,
@@ -130,19 +174,23 @@ class AnalyticsStore:
         draft_id: str,
         metrics: dict[str, float],
     ) -> None:
-        """Store multiple metrics for a single post snapshot."""
-        now = dt.datetime.now(dt.timezone.utc)
-        for name, value in metrics.items():
-            self.store(
-                MetricRecord(
-                    post_id=post_id,
-                    platform=platform,
-                    draft_id=draft_id,
-                    metric_name=name,
-                    metric_value=float(value),
-                    fetched_at=now,
-                )
-            )
+        """
+        Store multiple metrics for a single post snapshot.
+
+        Rows are built directly rather than through ``MetricRecord`` — the
+        values come straight from the platform APIs, and validating a model
+        per metric only to dump it back to a dict is pure overhead.  Use
+        :meth:`store` when a validated record is needed.
+        """
+        now_iso = dt.datetime.now(dt.timezone.utc).isoformat()
+        # metric_value relies on the REAL column affinity to coerce ints
+        rows = [
+            (f"{platform}:{post_id}:{name}", post_id, platform, draft_id, name, value, now_iso)
+            for name, value in metrics.items()
+        ]
+        # One transaction for the whole snapshot instead of one commit per metric
+        with self._db.conn:
+            self._db.conn.executemany(self._UPSERT_SQL, rows)
         logger.info(
             "Stored %d metrics for %s/%s (draft=%s)",
             len(metrics),
@@ -151,30 +199,54 @@ class AnalyticsStore:
             draft_id,
         )
 
+    def prune(self, before: dt.datetime) -> int:
+        """
+        Delete metric rows last fetched before *before* (naive = UTC).
+
+        Each (platform, post, metric) keeps only its latest snapshot, so this
+        drops posts that are no longer being polled.  Freed pages are
+        returned to the filesystem.  Returns the number of rows deleted.
+
+        Files created before ``auto_vacuum=INCREMENTAL`` was part of the
+        connection PRAGMAs are switched over by the first prune, which runs
+        a one-off full ``VACUUM``.
+        """
+        if before.tzinfo is None:
+            before = before.replace(tzinfo=dt.timezone.utc)
+        cutoff = before.astimezone(dt.timezone.utc).isoformat()
+        with self._db.conn:
+            deleted = self._db.conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE fetched_at < ?", (cutoff,)
+            ).rowcount
+        if self._db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:  # INCREMENTAL
+            # The pragma frees one page per step, and sqlite3's execute()
+            # steps it only once (fetchall() does not resume it);
+            # executescript() runs it to completion.
+            self._db.conn.executescript("PRAGMA incremental_vacuum;")
+        else:
+            self._db.conn.executescript("PRAGMA auto_vacuum=INCREMENTAL; VACUUM;")
+        logger.info("Pruned %d metric rows fetched before %s", deleted, cutoff)
+        return deleted
+
     # ------------------------------------------------------------------
     # Read
     # ------------------------------------------------------------------
 
     def get_post_metrics(self, post_id: str, platform: str) -> dict[str, float]:
         """Return all metrics for a specific post as {name: value}."""
-        rows = list(
-            self._db[self.TABLE].rows_where(
-                "post_id = ? AND platform = ?",
-                [post_id, platform],
-            )
-        )
-        return {r["metric_name"]: r["metric_value"] for r in rows}
+        with self._readers.connection() as db:
+            return dict(db.conn.execute(self._POST_SQL, (post_id, platform)).fetchall())
 
     def get_draft_metrics(self, draft_id: str) -> list[dict]:
         """Return all metric rows associated with a draft (all platforms)."""
-        rows = list(
-            self._db[self.TABLE].rows_where(
-                "draft_id = ?",
-                [draft_id],
-                order_by="platform, metric_name",
+        with self._readers.connection() as db:
+            return list(
+                db[self.TABLE].rows_where(
+                    "draft_id = ?",
+                    [draft_id],
+                    order_by="platform, metric_name",
+                )
             )
-        )
-        return list(rows)
 
     def top_posts(
         self,
@@ -183,38 +255,26 @@ class AnalyticsStore:
         limit: int = 10,
     ) -> list[dict]:
         """Return top N posts by a given metric on a platform."""
-        rows = self._db.execute(
-            f"""
-            SELECT post_id, draft_id, metric_value, fetched_at
-            FROM {self.TABLE}
-            WHERE platform = ? AND metric_name = ?
-            ORDER BY metric_value DESC
-            LIMIT ?
-            """,
-            [platform, metric, limit],
-        ).fetchall()
+        with self._readers.connection() as db:
+            rows = db.conn.execute(self._TOP_SQL, (platform, metric, limit)).fetchall()
         return [
             {
-                "post_id": r[0],
-                "draft_id": r[1],
-                metric: r[2],
-                "fetched_at": r[3],
+                "post_id": post_id,
+                "draft_id": draft_id,
+                metric: value,
+                "fetched_at": fetched_at,
             }
-            for r in rows
+            for post_id, draft_id, value, fetched_at in rows
         ]
 
     def summary(self, platform: Optional[str] = None) -> dict:
         """Return aggregate stats: total posts, total metrics stored."""
-        where = "WHERE platform = ?" if platform else ""
-        params = [platform] if platform else []
-
-        total_metrics = self._db.execute(
-            f"SELECT COUNT(*) FROM {self.TABLE} {where}", params
-        ).fetchone()[0]
-
-        posts = self._db.execute(
-            f"SELECT COUNT(DISTINCT post_id) FROM {self.TABLE} {where}", params
-        ).fetchone()[0]
+        with self._readers.connection() as db:
+            if platform:
+                cur = db.conn.execute(self._SUMMARY_PLATFORM_SQL, (platform,))
+            else:
+                cur = db.conn.execute(self._SUMMARY_SQL)
+            total_metrics, posts = cur.fetchone()
 
         return {
             "platform": platform or "all",
@@ -227,6 +287,7 @@ class AnalyticsStore:
     # ------------------------------------------------------------------
 
     def close(self) -> None:
+        self._readers.close()
         self._db.close()
 
     def __enter__(self) -> "AnalyticsStore":
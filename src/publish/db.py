@@ -0,0 +1,88 @@
+"""
+SQLite connection helpers shared by the publishing stores.
+
+Both the scheduler and the analytics store write small rows very often
+(one per status change / metric snapshot).  With SQLite's defaults every
+one of those commits pays a full fsync and blocks readers, so we switch
+file-backed databases to WAL with relaxed syncing right after opening,
+and serve reads from a separate pool of read-only connections.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import sqlite_utils
+
+logger = logging.getLogger(__name__)
+
+# auto_vacuum only takes effect on a brand-new file, so it must come before
+# journal_mode (which writes the header); it lets prune() hand pages back
+# with ``PRAGMA incremental_vacuum``.  Existing files keep their mode until a
+# VACUUM (AnalyticsStore.prune does that once).
+_PRAGMAS = """
+PRAGMA auto_vacuum=INCREMENTAL;
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=5000;
+PRAGMA cache_size=-20000;
+PRAGMA temp_store=MEMORY;
+"""
+
+
+def tune_connection(db: sqlite_utils.Database) -> None:
+    """Apply WAL + performance PRAGMAs to a file-backed database."""
+    if db.memory:
+        return
+    db.conn.executescript(_PRAGMAS)
+    mode = db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    if mode != "wal":
+        logger.warning("Could not enable WAL mode (journal_mode=%s)", mode)
+
+
+class ReadPool:
+    """
+    Small pool of read-only connections to a WAL database.
+
+    Polling reads (``list_due``, ``top_posts`` …) borrow a connection from the
+    pool so they never queue behind the writer connection's transaction.
+    In-memory databases cannot be shared between connections, so for those
+    the pool simply hands out the writer.
+    """
+
+    def __init__(self, writer: sqlite_utils.Database, db_path: Path, size: int = 4) -> None:
+        self._writer = writer
+        self._pool: queue.Queue[sqlite_utils.Database] = queue.Queue()
+        self._conns: list[sqlite_utils.Database] = []
+        if writer.memory:
+            return
+        uri = f"{db_path.resolve().as_uri()}?mode=ro"
+        for _ in range(size):
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA query_only=1")
+            conn.execute("PRAGMA busy_timeout=5000")
+            db = sqlite_utils.Database(conn)
+            self._conns.append(db)
+            self._pool.put(db)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite_utils.Database]:
+        """Borrow a read-only connection for the duration of the block."""
+        if not self._conns:
+            yield self._writer
+            return
+        db = self._pool.get()
+        try:
+            yield db
+        finally:
+            self._pool.put(db)
+
+    def close(self) -> None:
+        for db in self._conns:
+            db.close()
+        self._conns.clear()
@@ -10,32 +10,138 @@ Required settings:
 
 Flow (single image):
   1. POST /{user_id}/media              → container_id
-  2. POST /{user_id}/media_publish      → post_id
+  2. GET  /{container_id}?fields=status_code until FINISHED
+  3. POST /{user_id}/media_publish      → post_id
 
 Flow (carousel — up to 10 images):
   1. POST /{user_id}/media for each image (is_carousel_item=true)  → child_ids
   2. POST /{user_id}/media with CAROUSEL + children=[child_ids]    → parent_id
-  3. POST /{user_id}/media_publish with creation_id=parent_id      → post_id
+  3. GET  /{parent_id}?fields=status_code until FINISHED
+  4. POST /{user_id}/media_publish with creation_id=parent_id      → post_id
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
 import time
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, cast
 
 import httpx
 
+from config.settings import settings
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to
+# HTTP/1.1 keep-alive when it is missing.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# orjson parses the nested insights payloads several times faster than
+# stdlib json; optional (``pip install anticorrupt[speedups]``).
+_loads: Callable[[bytes | str], Any]
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return cast(bytes, orjson.dumps(obj)).decode()
+
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 _GRAPH_BASE = "https://graph.facebook.com/v19.0"
+_DEFAULT_TIMEOUT = 30.0
 _CAROUSEL_MAX = 10
+_CAROUSEL_WORKERS = 5  # concurrent child-container requests per carousel
+_CONTAINER_LIMIT = 50  # media containers the Graph API accepts per account per hour
+_CONTAINER_WINDOW = 3600.0  # seconds
+_BATCH_MAX = 50  # Graph API limit on sub-requests per batch call
+_INSIGHT_METRICS = ("impressions", "reach", "likes", "comments", "saved", "shares")
+_STATUS_BACKOFF = (0.25, 0.5, 1.0, 2.0)  # seconds between status polls (last repeats)
 
 
 class InstagramError(Exception):
     """Raised when the Instagram Graph API returns an error response."""
 
 
+class _ContainerBudget:
+    """
+    Rolling one-hour count of media containers created, shared across threads.
+
+    A carousel needs one container per slide plus its parent, all created
+    in a burst; reserving them together up front means a post either fits
+    the hourly budget or fails before any request is sent, instead of
+    dying half-way when the API rejects a child.  Slots for containers
+    that were never created (a request failed) are handed back with
+    :meth:`release`.
+    """
+
+    def __init__(self, limit: int = _CONTAINER_LIMIT, window: float = _CONTAINER_WINDOW) -> None:
+        self._limit = limit
+        self._window = window
+        self._created: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def reserve(self, count: int) -> float:
+        """
+        Claim *count* containers, raising InstagramError if the hour's budget is short.
+
+        Returns the reservation's timestamp, to pass to :meth:`release`.
+        """
+        if count > self._limit:
+            raise InstagramError(
+                f"Container budget exceeded: need {count}, at most {self._limit} per hour"
+            )
+        with self._lock:
+            now = time.monotonic()
+            while self._created and now - self._created[0] >= self._window:
+                self._created.popleft()
+            available = self._limit - len(self._created)
+            if count > available:
+                wait = self._window - (now - self._created[0])
+                raise InstagramError(
+                    f"Container budget exhausted: need {count}, {available} left "
+                    f"this hour (next slot in {wait:.0f}s)"
+                )
+            self._created.extend([now] * count)
+            return now
+
+    def release(self, count: int, stamp: float) -> None:
+        """Hand back *count* unused slots of the reservation made at *stamp*."""
+        with self._lock:
+            for _ in range(count):
+                try:
+                    self._created.remove(stamp)
+                except ValueError:  # already aged out of the window
+                    break
+
+
+# The budget is per Instagram account, while callers build a fresh client
+# for every post, so budgets live here rather than on the client.
+_budgets: dict[str, _ContainerBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def _container_budget(account_id: str) -> _ContainerBudget:
+    """Return the process-wide container budget for *account_id*."""
+    with _budgets_lock:
+        budget = _budgets.get(account_id)
+        if budget is None:
+            budget = _budgets[account_id] = _ContainerBudget()
+        return budget
+
+
 class InstagramClient:
     """
     Thin wrapper around the Instagram Content Publishing API.
@@ -56,24 +162,35 @@ class InstagramClient:
         account_id: Optional[str] = None,
         *,
         base_url: str = _GRAPH_BASE,
-        timeout: float = 30.0,
+        timeout: float = _DEFAULT_TIMEOUT,
     ) -> None:
-        from config.settings import settings
-
         self.token = access_token or settings.instagram_access_token
         self.account_id = account_id or settings.instagram_business_account_id
-        self._http = httpx.Client(base_url=base_url, timeout=timeout)
+        # HTTP/2 lets concurrent carousel requests multiplex over one TLS
+        # connection; the pool keeps it warm between scheduler calls.
+        self._http = httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=20,
+                keepalive_expiry=60.0,
+            ),
+        )
+        self._containers = _container_budget(self.account_id)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _post(self, path: str, data: dict) -> dict:
+    def _post(self, path: str, data: dict) -> Any:
         """POST to the Graph API and return parsed JSON, raising on error."""
         data["access_token"] = self.token
         resp = self._http.post(path, data=data)
-        body = resp.json()
-        if "error" in body:
+        body = _loads(resp.content)
+        # Batch calls answer with a list of sub-responses
+        if isinstance(body, dict) and "error" in body:
             msg = body["error"].get("message", str(body["error"]))
             raise InstagramError(msg)
         return body
@@ -81,7 +198,7 @@ class InstagramClient:
     def _get(self, path: str, params: dict) -> dict:
         params["access_token"] = self.token
         resp = self._http.get(path, params=params)
-        body = resp.json()
+        body = _loads(resp.content)
         if "error" in body:
             msg = body["error"].get("message", str(body["error"]))
             raise InstagramError(msg)
@@ -134,6 +251,31 @@ class InstagramClient:
         logger.info("Created carousel container: %s (%d children)", container_id, len(children_ids))
         return container_id
 
+    def wait_until_ready(self, container_id: str, *, max_wait: float = 30.0) -> None:
+        """
+        Poll a container's ``status_code`` until Meta has processed it.
+
+        Backs off 0.25s → 0.5s → 1s → 2s between polls.  Raises
+        ``InstagramError`` if the container ends in ERROR/EXPIRED or is not
+        FINISHED within *max_wait* seconds.
+        """
+        deadline = time.monotonic() + max_wait
+        attempt = 0
+        while True:
+            body = self._get(f"/{container_id}", {"fields": "status_code"})
+            status = body.get("status_code")
+            if status == "FINISHED":
+                return
+            if status in ("ERROR", "EXPIRED"):
+                raise InstagramError(f"Container {container_id} status is {status}")
+            delay = _STATUS_BACKOFF[min(attempt, len(_STATUS_BACKOFF) - 1)]
+            if time.monotonic() + delay > deadline:
+                raise InstagramError(
+                    f"Container {container_id} not ready after {max_wait:.0f}s (status={status})"
+                )
+            time.sleep(delay)
+            attempt += 1
+
     def publish_container(self, container_id: str) -> str:
         """
         Publish a previously created media container.
@@ -157,15 +299,20 @@ class InstagramClient:
         image_url: str,
         caption: str,
         *,
-        delay_seconds: float = 1.0,
+        max_wait: float = 30.0,
     ) -> str:
         """
         Create and publish a single-image post in one call.
 
         Returns the post_id.
         """
-        container_id = self.create_image_container(image_url, caption)
-        time.sleep(delay_seconds)
+        stamp = self._containers.reserve(1)
+        try:
+            container_id = self.create_image_container(image_url, caption)
+        except BaseException:
+            self._containers.release(1, stamp)
+            raise
+        self.wait_until_ready(container_id, max_wait=max_wait)
         return self.publish_container(container_id)
 
     def post_carousel(
@@ -173,11 +320,21 @@ class InstagramClient:
         image_urls: list[str],
         caption: str,
         *,
-        delay_seconds: float = 1.0,
+        max_wait: float = 30.0,
     ) -> str:
         """
         Create and publish a carousel post (2–10 images).
 
+        Child containers are independent of each other, so they are created
+        concurrently (at most ``_CAROUSEL_WORKERS`` requests in flight).  The
+        parent container is polled until ready before publishing.
+
+        All containers (one per slide plus the parent) are reserved against
+        the hourly container budget before the first request; if they do
+        not fit, ``InstagramError`` is raised and nothing is created.  If
+        a container request fails, the slots of containers that were not
+        created are released.
+
         Returns the post_id.
         """
         if not image_urls:
@@ -188,31 +345,45 @@ class InstagramClient:
                 f"(got {len(image_urls)})."
             )
 
-        children: list[str] = []
-        for url in image_urls:
-            child_id = self.create_image_container(url, is_carousel_item=True)
-            children.append(child_id)
-            time.sleep(delay_seconds)
-
-        parent_id = self.create_carousel_container(children, caption)
-        time.sleep(delay_seconds)
+        reserved = len(image_urls) + 1
+        stamp = self._containers.reserve(reserved)
+        created = 0
+        try:
+            workers = min(_CAROUSEL_WORKERS, len(image_urls))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self.create_image_container, url, is_carousel_item=True)
+                    for url in image_urls
+                ]
+            # The pool has drained, so every child has either been created
+            # or failed; futures keep input order, so slides keep their position
+            created = sum(f.exception() is None for f in futures)
+            children = [f.result() for f in futures]
+            parent_id = self.create_carousel_container(children, caption)
+            created += 1
+        finally:
+            if created < reserved:
+                self._containers.release(reserved - created, stamp)
+
+        self.wait_until_ready(parent_id, max_wait=max_wait)
         return self.publish_container(parent_id)
 
     # ------------------------------------------------------------------
     # Insights / Analytics
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _parse_insights(body: dict) -> dict[str, int]:
+        result: dict[str, int] = {}
+        for item in body.get("data", []):
+            values = item.get("values") or [{}]
+            result[item["name"]] = values[0].get("value", 0)
+        return result
+
     def get_media_insights(
         self,
         media_id: str,
-        metrics: tuple[str, ...] = (
-            "impressions",
-            "reach",
-            "likes",
-            "comments",
-            "saved",
-            "shares",
-        ),
+        metrics: tuple[str, ...] = _INSIGHT_METRICS,
     ) -> dict[str, int]:
         """
         Fetch performance metrics for a published post.
@@ -223,11 +394,38 @@ class InstagramClient:
             f"/{media_id}/insights",
             {"metric": ",".join(metrics)},
         )
-        result: dict[str, int] = {}
-        for item in body.get("data", []):
-            values = item.get("values") or [{}]
-            result[item["name"]] = values[0].get("value", 0)
-        return result
+        return self._parse_insights(body)
+
+    def get_media_insights_batch(
+        self,
+        media_ids: list[str],
+        metrics: tuple[str, ...] = _INSIGHT_METRICS,
+    ) -> dict[str, dict[str, int]]:
+        """
+        Fetch metrics for many posts using the Graph API batch endpoint.
+
+        Up to ``_BATCH_MAX`` posts are folded into one round-trip; larger
+        inputs are split into several batch calls.  Posts whose sub-request
+        fails are logged and left out of the result.
+
+        Returns ``{media_id: {"impressions": 1200, ...}, ...}``.
+        """
+        relative = f"insights?metric={','.join(metrics)}"
+        results: dict[str, dict[str, int]] = {}
+        for start in range(0, len(media_ids), _BATCH_MAX):
+            chunk = media_ids[start : start + _BATCH_MAX]
+            subrequests = [
+                {"method": "GET", "relative_url": f"{mid}/{relative}"} for mid in chunk
+            ]
+            responses = self._post("/", {"batch": _dumps(subrequests)})
+            for mid, resp in zip(chunk, responses):
+                body = _loads(resp["body"]) if resp and resp.get("body") else {}
+                if not resp or resp.get("code") != 200 or "error" in body:
+                    error = body.get("error", {}).get("message") if body else None
+                    logger.warning("Insights batch failed for %s: %s", mid, error or resp)
+                    continue
+                results[mid] = self._parse_insights(body)
+        return results
 
     # ------------------------------------------------------------------
     # Context manager / cleanup
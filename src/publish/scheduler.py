@@ -25,13 +25,56 @@ import json
 import logging
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Optional, cast
 
 import sqlite_utils
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
+
+from src.publish.db import ReadPool, tune_connection
 
 logger = logging.getLogger(__name__)
 
+# msgspec decodes small JSON arrays several times faster than stdlib json;
+# it is an optional speedup (``pip install anticorrupt[speedups]``).
+try:
+    import msgspec
+
+    _URLS_ENCODER = msgspec.json.Encoder()
+    _URLS_DECODER = msgspec.json.Decoder(list[str])
+
+    def _dump_urls(urls: list[str]) -> str:
+        return cast(bytes, _URLS_ENCODER.encode(urls)).decode()
+
+    def _load_urls(raw: Optional[str]) -> list[str]:
+        return _URLS_DECODER.decode(raw) if raw else []
+
+except ImportError:
+
+    def _dump_urls(urls: list[str]) -> str:
+        return json.dumps(urls)
+
+    def _load_urls(raw: Optional[str]) -> list[str]:
+        return json.loads(raw) if raw else []
+
+
+_fromiso = dt.datetime.fromisoformat
+
+
+def _utc_iso(value: dt.datetime) -> str:
+    """
+    Canonical stored form of a UTC datetime: fixed-width, microsecond
+    precision and a '+00:00' suffix, so stored values compare as text.
+    """
+    return value.isoformat(timespec="microseconds")
+
+
+# len("2026-03-01T10:00:00.000000+00:00")
+_UTC_ISO_LEN = 32
+
+# PRAGMA user_version of a schedule file whose scheduled_at values are all
+# canonical; files below it get the one-time rewrite on open.
+_SCHEMA_VERSION = 1
+
 _VALID_PLATFORMS = {"instagram", "twitter"}
 _VALID_STATUSES = {"pending", "running", "done", "failed"}
 
@@ -49,7 +92,7 @@ class ScheduledPost(BaseModel):
     platform: str
     scheduled_at: dt.datetime
     status: str = "pending"
-    created_at: dt.datetime = dt.datetime.now(dt.timezone.utc)
+    created_at: dt.datetime = Field(default_factory=lambda: dt.datetime.now(dt.timezone.utc))
     executed_at: Optional[dt.datetime] = None
     error: Optional[str] = None
     image_urls: list[str] = []
@@ -66,6 +109,15 @@ class ScheduledPost(BaseModel):
             raise ValueError(f"platform must be one of {sorted(_VALID_PLATFORMS)}, got {v!r}")
         return v
 
+    @field_validator("scheduled_at")
+    @classmethod
+    def _to_utc(cls, v: dt.datetime) -> dt.datetime:
+        # Naive datetimes are taken as UTC; everything is stored in UTC so
+        # the ISO strings in the database compare correctly as text.
+        if v.tzinfo is None:
+            return v.replace(tzinfo=dt.timezone.utc)
+        return v.astimezone(dt.timezone.utc)
+
     @field_validator("status")
     @classmethod
     def _check_status(cls, v: str) -> str:
@@ -76,13 +128,7 @@ class ScheduledPost(BaseModel):
     @property
     def is_due(self) -> bool:
         """True if the post is pending and its scheduled time has passed."""
-        now = dt.datetime.now(dt.timezone.utc)
-        scheduled = (
-            self.scheduled_at.replace(tzinfo=dt.timezone.utc)
-            if self.scheduled_at.tzinfo is None
-            else self.scheduled_at
-        )
-        return self.status == "pending" and scheduled <= now
+        return self.status == "pending" and self.scheduled_at <= dt.datetime.now(dt.timezone.utc)
 
 
 # ---------------------------------------------------------------------------
@@ -109,17 +155,41 @@ class PostScheduler:
 
     TABLE = "schedule"
 
+    _COLUMNS = (
+        "id",
+        "draft_id",
+        "platform",
+        "scheduled_at",
+        "status",
+        "created_at",
+        "executed_at",
+        "error",
+        "image_urls",
+        "caption",
+    )
+    # True upsert: re-adding a post updates it in place rather than the
+    # delete + insert that INSERT OR REPLACE performs.
+    _UPSERT_SQL = (
+        f"INSERT INTO {TABLE} ({', '.join(_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in _COLUMNS)}) "
+        "ON CONFLICT(id) DO UPDATE SET "
+        + ", ".join(f"{c} = excluded.{c}" for c in _COLUMNS[1:])
+    )
+
     def __init__(self, db_path: Path) -> None:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self._db = sqlite_utils.Database(db_path)
+        tune_connection(self._db)
         self._ensure_schema()
+        self._readers = ReadPool(self._db, db_path)
 
     # ------------------------------------------------------------------
     # Schema
     # ------------------------------------------------------------------
 
     def _ensure_schema(self) -> None:
-        if self.TABLE not in self._db.table_names():
+        created = self.TABLE not in self._db.table_names()
+        if created:
             self._db[self.TABLE].create(
                 {
                     "id": str,
@@ -135,9 +205,51 @@ class PostScheduler:
                 },
                 pk="id",
             )
-            self._db[self.TABLE].create_index(["status"])
             self._db[self.TABLE].create_index(["scheduled_at"])
             self._db[self.TABLE].create_index(["draft_id"])
+        # list_due / list_pending filter on status and order by scheduled_at;
+        # the composite index serves both without a sort step and replaces
+        # the old single-column status index.
+        self._db.executescript(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_due
+                ON {self.TABLE} (status, scheduled_at);
+            DROP INDEX IF EXISTS idx_{self.TABLE}_status;
+            """
+        )
+        version = self._db.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            if not created:
+                self._canonicalise_scheduled_at()
+            self._db.conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _canonicalise_scheduled_at(self) -> None:
+        """
+        Rewrite scheduled_at values stored before the canonical UTC form.
+
+        Older rows may be naive, carry another offset or lack microseconds;
+        list_due compares the column as text and rows are hydrated without
+        validators, so they are normalised here (naive = UTC).  Runs once
+        per file: afterwards ``PRAGMA user_version`` records that the
+        column is canonical.
+        """
+        stale = self._db.conn.execute(
+            f"SELECT id, scheduled_at FROM {self.TABLE} "
+            "WHERE length(scheduled_at) != ? OR substr(scheduled_at, -6) != '+00:00'",
+            [_UTC_ISO_LEN],
+        ).fetchall()
+        if not stale:
+            return
+        with self._db.conn:
+            for post_id, raw in stale:
+                value = _fromiso(raw)
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=dt.timezone.utc)
+                self._db.conn.execute(
+                    f"UPDATE {self.TABLE} SET scheduled_at = ? WHERE id = ?",
+                    [_utc_iso(value.astimezone(dt.timezone.utc)), post_id],
+                )
+        logger.info("Normalised scheduled_at of %d stored post(s) to UTC", len(stale))
 
     # ------------------------------------------------------------------
     # CRUD
@@ -145,7 +257,9 @@ class PostScheduler:
 
     def add(self, post: ScheduledPost) -> ScheduledPost:
         """Persist a scheduled post and return it."""
-        self._db[self.TABLE].insert(self._to_row(post), replace=True)
+        row = self._to_row(post)
+        with self._db.conn:
+            self._db.conn.execute(self._UPSERT_SQL, [row[c] for c in self._COLUMNS])
         logger.info(
             "Scheduled post %s (draft=%s) at %s on %s",
             post.id,
@@ -157,11 +271,12 @@ class PostScheduler:
 
     def get(self, post_id: str) -> Optional[ScheduledPost]:
         """Return a ScheduledPost by id, or None if not found."""
-        try:
-            row = self._db[self.TABLE].get(post_id)
-            return self._from_row(row)
-        except sqlite_utils.db.NotFoundError:
-            return None
+        with self._readers.connection() as db:
+            try:
+                row = db[self.TABLE].get(post_id)
+            except sqlite_utils.db.NotFoundError:
+                return None
+        return self._from_row(row)
 
     def update_status(
         self,
@@ -192,43 +307,52 @@ class PostScheduler:
 
     def list_pending(self) -> list[ScheduledPost]:
         """Return all pending posts, sorted by scheduled_at ascending."""
-        rows = list(
-            self._db[self.TABLE].rows_where(
-                "status = 'pending'",
-                order_by="scheduled_at ASC",
+        with self._readers.connection() as db:
+            rows = list(
+                db[self.TABLE].rows_where(
+                    "status = 'pending'",
+                    order_by="scheduled_at ASC",
+                )
             )
-        )
         return [self._from_row(r) for r in rows]
 
     def list_due(self) -> list[ScheduledPost]:
-        """Return pending posts whose scheduled_at is now or in the past."""
-        now = dt.datetime.now(dt.timezone.utc).isoformat()
-        rows = list(
-            self._db[self.TABLE].rows_where(
-                "status = 'pending' AND scheduled_at <= ?",
-                [now],
-                order_by="scheduled_at ASC",
+        """
+        Return pending posts whose scheduled_at is now or in the past.
+
+        The due check happens entirely in SQL: scheduled_at is stored as a
+        canonical UTC string, so a text comparison against "now" is exact.
+        """
+        now = _utc_iso(dt.datetime.now(dt.timezone.utc))
+        with self._readers.connection() as db:
+            rows = list(
+                db[self.TABLE].rows_where(
+                    "status = 'pending' AND scheduled_at <= ?",
+                    [now],
+                    order_by="scheduled_at ASC",
+                )
             )
-        )
         return [self._from_row(r) for r in rows]
 
     def list_all(self, limit: int = 50) -> list[ScheduledPost]:
         """Return all posts (any status), most recently scheduled first."""
-        rows = list(
-            self._db[self.TABLE].rows_where(
-                order_by="scheduled_at DESC",
-                limit=limit,
+        with self._readers.connection() as db:
+            rows = list(
+                db[self.TABLE].rows_where(
+                    order_by="scheduled_at DESC",
+                    limit=limit,
+                )
             )
-        )
         return [self._from_row(r) for r in rows]
 
     def stats(self) -> dict[str, int]:
         """Return count per status."""
         result: dict[str, int] = {}
-        for row in self._db.execute(
-            f"SELECT status, COUNT(*) FROM {self.TABLE} GROUP BY status"
-        ).fetchall():
-            result[row[0]] = row[1]
+        with self._readers.connection() as db:
+            for row in db.execute(
+                f"SELECT status, COUNT(*) FROM {self.TABLE} GROUP BY status"
+            ).fetchall():
+                result[row[0]] = row[1]
         return result
 
     # ------------------------------------------------------------------
@@ -241,31 +365,29 @@ class PostScheduler:
             "id": post.id,
             "draft_id": post.draft_id,
             "platform": post.platform,
-            "scheduled_at": post.scheduled_at.isoformat(),
+            "scheduled_at": _utc_iso(post.scheduled_at),
             "status": post.status,
             "created_at": post.created_at.isoformat(),
             "executed_at": post.executed_at.isoformat() if post.executed_at else None,
             "error": post.error,
-            "image_urls": json.dumps(post.image_urls),
+            "image_urls": _dump_urls(post.image_urls),
             "caption": post.caption,
         }
 
     @staticmethod
     def _from_row(row: dict) -> ScheduledPost:
-        return ScheduledPost(
+        # Rows were validated on the way in, so skip validators on read —
+        # list_due/list_pending hydrate every pending row on each cron tick.
+        return ScheduledPost.model_construct(
             id=row["id"],
             draft_id=row["draft_id"],
             platform=row["platform"],
-            scheduled_at=dt.datetime.fromisoformat(row["scheduled_at"]),
+            scheduled_at=_fromiso(row["scheduled_at"]),
             status=row["status"],
-            created_at=dt.datetime.fromisoformat(row["created_at"]),
-            executed_at=(
-                dt.datetime.fromisoformat(row["executed_at"])
-                if row["executed_at"]
-                else None
-            ),
+            created_at=_fromiso(row["created_at"]),
+            executed_at=_fromiso(row["executed_at"]) if row["executed_at"] else None,
             error=row["error"],
-            image_urls=json.loads(row["image_urls"] or "[]"),
+            image_urls=_load_urls(row["image_urls"]),
             caption=row["caption"] or "",
         )
 
@@ -274,6 +396,7 @@ class PostScheduler:
     # ------------------------------------------------------------------
 
     def close(self) -> None:
+        self._readers.close()
         self._db.close()
 
     def __enter__(self) -> "PostScheduler":
@@ -18,12 +18,31 @@ Note: Media upload still requires Twitter API v1.1 (tweepy.API).
 from __future__ import annotations
 
 import logging
+import mimetypes
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 logger = logging.getLogger(__name__)
 
+_UPLOAD_WORKERS = 4  # a tweet carries at most 4 images
+_LOOKUP_MAX = 100  # ids per GET /2/tweets lookup
+_STATUS_URL = "https://x.com/i/web/status/{}".format
+_CHUNKED_MIN = 4 * 1024 * 1024  # files above this use the resumable upload
+_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Client-side request budgets per endpoint: (requests, window seconds).
+# These are starting points — the x-rate-limit-* headers of every response
+# re-sync them to what the API actually reports for this account.
+_RATE_LIMITS = {
+    "create_tweet": (100, 900.0),
+    "lookup": (300, 900.0),
+    "media_upload": (415, 900.0),
+}
+
 # ---------------------------------------------------------------------------
 # Optional tweepy import — publishing degrades gracefully if not installed
 # ---------------------------------------------------------------------------
@@ -36,6 +55,7 @@ except ImportError:
     _TWEEPY_AVAILABLE = False
 
 if TYPE_CHECKING:
+    import requests
     import tweepy
 
 
@@ -63,6 +83,57 @@ class TwitterError(Exception):
     """Raised when the X/Twitter API returns an error."""
 
 
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class _RateLimiter:
+    """
+    Fixed-window request budget for one endpoint, shared across threads.
+
+    Tweepy's ``wait_on_rate_limit`` only reacts after a 429; this blocks
+    locally once the budget is spent so bursts never reach the network.
+    """
+
+    def __init__(self, limit: int, window: float) -> None:
+        self._limit = limit
+        self._window = window
+        self._remaining = limit
+        self._reset_at = time.monotonic() + window
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one request slot, sleeping until the window resets if needed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._reset_at:
+                    self._remaining = self._limit
+                    self._reset_at = now + self._window
+                if self._remaining > 0:
+                    self._remaining -= 1
+                    return
+                wait = self._reset_at - now
+            logger.warning("Rate limit budget exhausted — waiting %.0fs", wait)
+            time.sleep(wait)
+
+    def sync(self, remaining: int, reset_epoch: float) -> None:
+        """Align the budget with the x-rate-limit-* headers of a response."""
+        with self._lock:
+            self._remaining = remaining
+            self._reset_at = time.monotonic() + max(0.0, reset_epoch - time.time())
+
+
+def _endpoint_for(method: str, url: str) -> Optional[str]:
+    """Map a request to its _RATE_LIMITS key (None if not tracked)."""
+    if "media/upload" in url:
+        return "media_upload"
+    if "/2/tweets" in url:
+        return "create_tweet" if method == "POST" else "lookup"
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Client
 # ---------------------------------------------------------------------------
@@ -96,12 +167,45 @@ class TwitterClient:
         self._bearer_token = bearer_token or settings.twitter_bearer_token
 
         self._client: Optional["tweepy.Client"] = None
-        self._v1_api: Optional["tweepy.API"] = None
+        self._v1 = threading.local()  # one tweepy.API per uploading thread
+        self._session: Optional["requests.Session"] = None
+        self._limits = {name: _RateLimiter(*cfg) for name, cfg in _RATE_LIMITS.items()}
 
     # ------------------------------------------------------------------
     # Lazy API initialisation
     # ------------------------------------------------------------------
 
+    def _get_session(self) -> "requests.Session":
+        """
+        Return the pooled HTTP session used by the v2 Tweepy client.
+
+        ``tweepy.API`` closes its session after every v1.1 request, which
+        would drop this pool's keep-alive connections mid-flight, so the
+        v1.1 API keeps its own session and only shares the rate-limit hook.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._session = requests.Session()
+            self._session.mount(
+                "https://", HTTPAdapter(pool_connections=10, pool_maxsize=10)
+            )
+            self._session.hooks["response"].append(self._sync_rate_limit)
+        return self._session
+
+    def _sync_rate_limit(self, response: "requests.Response", *_: object, **__: object) -> None:
+        """requests response hook: re-sync the local budget from headers."""
+        remaining = response.headers.get("x-rate-limit-remaining")
+        reset = response.headers.get("x-rate-limit-reset")
+        endpoint = _endpoint_for(response.request.method or "", response.request.url or "")
+        if endpoint is None or remaining is None or reset is None:
+            return
+        try:
+            self._limits[endpoint].sync(int(remaining), float(reset))
+        except ValueError:
+            pass
+
     def _get_client(self) -> "tweepy.Client":
         """Return (or create) the Tweepy v2 Client."""
         if not _TWEEPY_AVAILABLE:
@@ -119,15 +223,23 @@ class TwitterClient:
                 bearer_token=self._bearer_token,
                 wait_on_rate_limit=True,
             )
+            self._client.session = self._get_session()
         return self._client
 
     def _get_v1_api(self) -> "tweepy.API":
-        """Return (or create) the Tweepy v1.1 API (needed for media uploads)."""
+        """
+        Return (or create) this thread's Tweepy v1.1 API (needed for media uploads).
+
+        ``tweepy.API`` closes its session after every request, so concurrent
+        uploads each get their own API and session instead of closing one
+        shared pool under each other.
+        """
         if not _TWEEPY_AVAILABLE:
             raise TwitterError(
                 "tweepy is not installed. Run: uv add tweepy"
             )
-        if self._v1_api is None:
+        api: Optional["tweepy.API"] = getattr(self._v1, "api", None)
+        if api is None:
             import tweepy
 
             auth = tweepy.OAuth1UserHandler(
@@ -136,8 +248,10 @@ class TwitterClient:
                 self._access_token,
                 self._access_secret,
             )
-            self._v1_api = tweepy.API(auth, wait_on_rate_limit=True)
-        return self._v1_api
+            api = tweepy.API(auth, wait_on_rate_limit=True)
+            api.session.hooks["response"].append(self._sync_rate_limit)
+            self._v1.api = api
+        return api
 
     # ------------------------------------------------------------------
     # Media upload
@@ -145,19 +259,43 @@ class TwitterClient:
 
     def upload_media(self, image_path: Path) -> str:
         """
-        Upload an image file via the v1.1 media endpoint.
+        Upload a media file via the v1.1 media endpoint.
+
+        Files over 4 MB, GIFs and videos go through the chunked
+        INIT/APPEND/FINALIZE upload in 4 MB segments, so a transport error
+        only costs one segment and the file is never held in memory whole.
+        Small images use the simple one-shot upload.
 
         Returns the media_id_string to attach to a tweet.
         """
         api = self._get_v1_api()
+        kwargs: dict = {}
+        mime = mimetypes.guess_type(image_path.name)[0] or ""
         try:
-            media = api.media_upload(str(image_path))
+            if mime == "image/gif":
+                kwargs["media_category"] = "tweet_gif"
+            elif mime.startswith("video/"):
+                kwargs["media_category"] = "tweet_video"
+            elif image_path.stat().st_size > _CHUNKED_MIN:
+                kwargs["media_category"] = "tweet_image"
+            if kwargs:
+                kwargs.update(chunked=True, chunk_size=_CHUNK_SIZE, wait_for_async_finalize=True)
+            self._limits["media_upload"].acquire()
+            media = api.media_upload(str(image_path), **kwargs)
             media_id: str = media.media_id_string
             logger.info("Uploaded media %s → %s", image_path.name, media_id)
             return media_id
         except Exception as exc:
             raise TwitterError(f"Media upload failed: {exc}") from exc
 
+    def _upload_all(self, media_paths: list[Path]) -> list[str]:
+        """Upload several files concurrently, returning ids in input order."""
+        if len(media_paths) == 1:
+            return [self.upload_media(media_paths[0])]
+        workers = min(_UPLOAD_WORKERS, len(media_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.upload_media, media_paths))
+
     # ------------------------------------------------------------------
     # Tweet / thread
     # ------------------------------------------------------------------
@@ -179,11 +317,19 @@ class TwitterClient:
         Returns:
             TweetResult with tweet_id, url, and attached media_ids.
         """
-        client = self._get_client()
-
         media_ids: list[str] = []
         if media_paths:
-            media_ids = [self.upload_media(p) for p in media_paths]
+            media_ids = self._upload_all(media_paths)
+        return self._create_tweet(text, media_ids, reply_to_id)
+
+    def _create_tweet(
+        self,
+        text: str,
+        media_ids: list[str],
+        reply_to_id: Optional[str],
+    ) -> TweetResult:
+        """Create a tweet from already-uploaded media."""
+        client = self._get_client()
 
         kwargs: dict = {"text": text}
         if media_ids:
@@ -191,12 +337,14 @@ class TwitterClient:
         if reply_to_id:
             kwargs["in_reply_to_tweet_id"] = reply_to_id
 
+        self._limits["create_tweet"].acquire()
         try:
             response = client.create_tweet(**kwargs)
             tweet_id = str(response.data["id"])
-            url = f"https://x.com/i/web/status/{tweet_id}"
             logger.info("Posted tweet %s", tweet_id)
-            return TweetResult(tweet_id=tweet_id, text=text, url=url, media_ids=media_ids)
+            return TweetResult(
+                tweet_id=tweet_id, text=text, url=_STATUS_URL(tweet_id), media_ids=media_ids
+            )
         except Exception as exc:
             raise TwitterError(f"Tweet creation failed: {exc}") from exc
 
@@ -213,6 +361,10 @@ class TwitterClient:
             media_paths:  Per-tweet optional list of image paths.
                           e.g. [[Path("img1.jpg")], None, [Path("img3.jpg")]]
 
+        Media uploads only depend on local files, not on the previous
+        tweet's id, so they run in the background one tweet after another
+        while the thread's ``create_tweet`` calls go out.
+
         Returns:
             List of TweetResult in posting order.
         """
@@ -222,14 +374,21 @@ class TwitterClient:
         results: list[TweetResult] = []
         reply_to: Optional[str] = None
 
-        for i, text in enumerate(tweets):
-            paths: Optional[list[Path]] = None
-            if media_paths and i < len(media_paths):
-                paths = media_paths[i]
-
-            result = self.post_tweet(text, media_paths=paths, reply_to_id=reply_to)
-            results.append(result)
-            reply_to = result.tweet_id
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            uploads = []
+            for i in range(len(tweets)):
+                paths = media_paths[i] if media_paths and i < len(media_paths) else None
+                uploads.append(pool.submit(self._upload_all, paths) if paths else None)
+
+            for text, upload in zip(tweets, uploads):
+                media_ids = upload.result() if upload else []
+                result = self._create_tweet(text, media_ids, reply_to)
+                results.append(result)
+                reply_to = result.tweet_id
+        finally:
+            # Don't start uploads for tweets that will never be posted
+            pool.shutdown(cancel_futures=True)
 
         logger.info("Posted thread: %d tweets, root=%s", len(results), results[0].tweet_id)
         return results
@@ -245,14 +404,52 @@ class TwitterClient:
         Returns a dict like ``{"like_count": 42, "retweet_count": 10, ...}``.
         """
         client = self._get_client()
+        self._limits["lookup"].acquire()
         try:
             response = client.get_tweet(
                 tweet_id,
                 tweet_fields=["public_metrics", "created_at"],
             )
             if response.data:
-                metrics = response.data.get("public_metrics") or {}
-                return {k: int(v) for k, v in metrics.items()}
+                # The API already returns integer counts
+                return dict(response.data.get("public_metrics") or {})
         except Exception as exc:
             raise TwitterError(f"Failed to fetch metrics for {tweet_id}: {exc}") from exc
         return {}
+
+    def get_tweets_metrics(self, tweet_ids: list[str]) -> dict[str, dict[str, int]]:
+        """
+        Fetch public metrics for many tweets with the bulk lookup endpoint.
+
+        Up to 100 ids go in each request, so a whole thread costs a single
+        call.  Deleted or unavailable tweets are simply absent from the result.
+
+        Returns ``{tweet_id: {"like_count": 42, ...}, ...}``.
+        """
+        client = self._get_client()
+        result: dict[str, dict[str, int]] = {}
+        for start in range(0, len(tweet_ids), _LOOKUP_MAX):
+            chunk = tweet_ids[start : start + _LOOKUP_MAX]
+            self._limits["lookup"].acquire()
+            try:
+                response = client.get_tweets(ids=chunk, tweet_fields=["public_metrics"])
+            except Exception as exc:
+                raise TwitterError(f"Failed to fetch metrics for {len(chunk)} tweets: {exc}") from exc
+            for tweet in response.data or []:
+                result[str(tweet["id"])] = dict(tweet.get("public_metrics") or {})
+        return result
+
+    # ------------------------------------------------------------------
+    # Context manager / cleanup
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "TwitterClient":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
@@ -6,23 +6,68 @@ Design:
   - On read: if the record is fresher than TTL → return cached value.
   - On read: if stale AND network available → re-fetch, update cache, return.
   - On read: if stale AND network unavailable → return stale with warning (offline mode).
-  - Snapshots: full JSON export of the cache for portability/backup.
+  - Payloads of 1 KiB or more are stored zlib-compressed (BLOB); smaller
+    ones stay plain JSON text, which compression would only grow.
+  - Snapshots: newline-delimited JSON export of the cache for
+    portability/backup, zstd-compressed when ``zstandard`` is installed
+    and gzip otherwise.
+  - Each entry counts how many refreshes in a row returned an identical
+    payload; the effective TTL doubles with every unchanged refresh (up to
+    16x) and drops back to the base TTL as soon as the payload changes.
+  - The database runs in WAL mode with memory-mapped reads, so readers in
+    other threads or processes never block on a writer; writes from several
+    processes are still serialised by SQLite.
 """
 
 from __future__ import annotations
 
 import datetime as dt
 import gzip
+import hashlib
+import io
+import itertools
 import json
 import logging
 import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Callable, Iterator, Optional, cast
 
 import sqlite_utils
 
 logger = logging.getLogger(__name__)
 
+# orjson serialises payloads several times faster than stdlib json and
+# emits UTF-8 bytes directly; optional (``pip install anticorrupt[speedups]``).
+_loads: Callable[[bytes | str], Any]
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        # Non-str keys are coerced like json.dumps does instead of raising
+        return cast(bytes, orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+# zstd compresses snapshots several times faster than gzip and smaller;
+# optional (``pip install anticorrupt[speedups]``).
+try:
+    import zstandard
+
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    _ZSTD_AVAILABLE = False
+
 # Default TTLs (seconds)
 DEFAULT_TTL = {
     "camara_deputados": 86_400,      # 24 hours — deputy info changes rarely
@@ -32,15 +77,86 @@ DEFAULT_TTL = {
     "senado_votos": 3_600,           # 1 hour
     "tse_candidatos": 604_800,       # 1 week — election data is historical
     "rss": 1_800,                    # 30 min — news refreshes often
+    "wikidata": 604_800,             # 1 week — SPARQL results change slowly
     "default": 3_600,                # 1 hour fallback
 }
 
 _CACHE_DB_PATH = Path(os.getenv("OUTPUT_DIR", "output")) / "api_cache.db"
 _TABLE = "api_cache"
+_COMPRESS_MIN = 1024  # bytes of JSON before a payload is worth compressing
+_MEM_MAXSIZE = 2048  # entries kept in the in-process LRU in front of SQLite
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_TTL_MAX_DOUBLINGS = 4  # adaptive TTL grows to at most 2**4 = 16x the base
+
+# WAL avoids an fsync of a rollback journal on every set(); mmap serves hot
+# pages without a pread() per lookup.
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA mmap_size=268435456;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+"""
+
+
+def _encode_payload(data: Any) -> str | bytes:
+    """Serialise a payload for the data_json column (compressed if large)."""
+    return _pack_payload(_dumps(data))
+
+
+def _pack_payload(raw: bytes) -> str | bytes:
+    """Store serialised JSON as text, or zlib-compressed if large."""
+    if len(raw) < _COMPRESS_MIN:
+        return raw.decode("utf-8")
+    return zlib.compress(raw, 6)
+
+
+def _payload_text(stored: str | bytes) -> str:
+    """Return the JSON text of a data_json value, inflating compressed BLOBs."""
+    if isinstance(stored, bytes):
+        return zlib.decompress(stored).decode("utf-8")
+    return stored
+
+
+def _decode_payload(stored: str | bytes) -> Any:
+    """Parse a data_json value; compressed BLOBs are parsed as UTF-8 bytes."""
+    if isinstance(stored, bytes):
+        return _loads(zlib.decompress(stored))
+    return _loads(stored)
+
+
+def _snapshot_writer(path: Path) -> BinaryIO:
+    """Open a compressed snapshot for writing; ``.zst`` paths use zstd."""
+    if path.suffix == ".zst":
+        if not _ZSTD_AVAILABLE:
+            raise RuntimeError("Writing .zst snapshots requires the 'zstandard' package.")
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+        return cast(BinaryIO, cctx.stream_writer(open(path, "wb")))
+    return gzip.open(str(path), "wb", compresslevel=1)  # type: ignore[return-value]
+
+
+def _snapshot_reader(path: Path) -> BinaryIO:
+    """Open a snapshot for line-by-line reading, detecting zstd vs gzip."""
+    with open(path, "rb") as fh:
+        magic = fh.read(4)
+    if magic == _ZSTD_MAGIC:
+        if not _ZSTD_AVAILABLE:
+            raise RuntimeError("Reading .zst snapshots requires the 'zstandard' package.")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+        return io.BufferedReader(reader)  # type: ignore[arg-type]
+    return gzip.open(str(path), "rb")  # type: ignore[return-value]
+
+
+_UNSET: Any = object()
 
 
 class CacheEntry:
-    """Represents a single cached API response."""
+    """
+    Represents a single cached API response.
+
+    Entries loaded from the database keep the stored payload and only decode
+    it when ``data`` is first read, so freshness checks stay cheap.
+    """
 
     def __init__(
         self,
@@ -49,12 +165,21 @@ class CacheEntry:
         data: Any,
         fetched_at: dt.datetime,
         schema_version: str = "1",
+        unchanged_count: int = 0,
     ):
         self.key = key
         self.source = source
-        self.data = data
+        self._data = data
+        self._stored: str | bytes | None = None
         self.fetched_at = fetched_at
         self.schema_version = schema_version
+        self.unchanged_count = unchanged_count  # refreshes in a row with the same payload
+
+    @property
+    def data(self) -> Any:
+        if self._data is _UNSET:
+            self._data = _decode_payload(self._stored)  # type: ignore[arg-type]
+        return self._data
 
     @property
     def age_seconds(self) -> float:
@@ -70,24 +195,50 @@ class CacheEntry:
             ttl_seconds = DEFAULT_TTL.get("default", 3_600)
         return self.age_seconds < ttl_seconds
 
+    def adaptive_ttl(self, base_ttl: int) -> int:
+        """*base_ttl* doubled for each unchanged refresh, capped at 16x."""
+        return base_ttl << min(self.unchanged_count, _TTL_MAX_DOUBLINGS)
+
+    def is_swr_eligible(self, ttl_seconds: int, swr_window: float) -> bool:
+        """True if stale by less than *swr_window* seconds (serve, then revalidate)."""
+        return self.age_seconds < ttl_seconds + swr_window
+
     def to_dict(self) -> dict:
         return {
             "key": self.key,
             "source": self.source,
-            "data_json": json.dumps(self.data, ensure_ascii=False),
+            "data_json": (
+                self._stored if self._data is _UNSET else _encode_payload(self._data)
+            ),
             "fetched_at": self.fetched_at.isoformat(),
             "schema_version": self.schema_version,
         }
 
     @classmethod
     def from_row(cls, row: dict) -> "CacheEntry":
-        return cls(
+        entry = cls(
             key=row["key"],
             source=row["source"],
-            data=json.loads(row["data_json"]),
+            data=_UNSET,
             fetched_at=dt.datetime.fromisoformat(row["fetched_at"]),
             schema_version=row.get("schema_version", "1"),
+            unchanged_count=row.get("unchanged_count") or 0,
+        )
+        entry._stored = row["data_json"]
+        return entry
+
+    def _detached(self) -> "CacheEntry":
+        """A copy sharing only the stored payload; its ``data`` decodes anew."""
+        entry = CacheEntry(
+            key=self.key,
+            source=self.source,
+            data=_UNSET,
+            fetched_at=self.fetched_at,
+            schema_version=self.schema_version,
+            unchanged_count=self.unchanged_count,
         )
+        entry._stored = self._stored
+        return entry
 
 
 class APICache:
@@ -103,13 +254,56 @@ class APICache:
         cache.set("camara/deputados/12345", data=response, source="camara_deputados")
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    # A real UPSERT updates the row in place; sqlite-utils' replace=True
+    # deletes and re-inserts it, touching every index twice.  It also bumps
+    # unchanged_count when the payload hash matches the stored one.
+    _UPSERT_SQL = f"""
+        INSERT INTO {_TABLE}
+            (key, source, data_json, fetched_at, schema_version, fetched_at_epoch,
+             payload_hash, unchanged_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+        ON CONFLICT(key) DO UPDATE SET
+            source = excluded.source,
+            data_json = excluded.data_json,
+            fetched_at = excluded.fetched_at,
+            schema_version = excluded.schema_version,
+            fetched_at_epoch = excluded.fetched_at_epoch,
+            payload_hash = excluded.payload_hash,
+            unchanged_count = CASE
+                WHEN {_TABLE}.payload_hash = excluded.payload_hash
+                THEN COALESCE({_TABLE}.unchanged_count, 0) + 1
+                ELSE 0
+            END
+    """
+    # Read back in the same transaction rather than with RETURNING, which
+    # needs SQLite 3.35+.
+    _UNCHANGED_SQL = f"SELECT unchanged_count FROM {_TABLE} WHERE key = ?"
+    # Fixed strings on the raw connection skip sqlite-utils' per-call table
+    # introspection and let SQLite's statement cache reuse the plan.
+    _GET_COLUMNS = (
+        "key", "source", "data_json", "fetched_at", "schema_version", "unchanged_count"
+    )
+    _GET_SQL = f"SELECT {', '.join(_GET_COLUMNS)} FROM {_TABLE} WHERE key = ?"
+    _DELETE_SQL = f"DELETE FROM {_TABLE} WHERE key = ?"
+
+    def __init__(self, db_path: Optional[Path] = None, mem_maxsize: int = _MEM_MAXSIZE):
         self._db_path = db_path or _CACHE_DB_PATH
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._db = sqlite_utils.Database(str(self._db_path))
+        # API clients read and write from worker threads (parallel page
+        # fetches, background refreshes), so the connection is shared across
+        # threads and the CRUD/query methods serialise on self._lock.
+        self._db = sqlite_utils.Database(
+            sqlite3.connect(str(self._db_path), check_same_thread=False)
+        )
+        self._lock = threading.RLock()
+        # Hot keys are re-read by several report generators within seconds;
+        # serve those from memory instead of SQLite + JSON decode.
+        self._mem: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._mem_maxsize = mem_maxsize
         self._ensure_table()
 
     def _ensure_table(self) -> None:
+        self._db.conn.executescript(_PRAGMAS)
         if _TABLE not in self._db.table_names():
             self._db[_TABLE].create(
                 {
@@ -118,23 +312,85 @@ class APICache:
                     "data_json": str,
                     "fetched_at": str,
                     "schema_version": str,
+                    "fetched_at_epoch": int,
+                    "payload_hash": str,
+                    "unchanged_count": int,
                 },
                 pk="key",
             )
-            self._db[_TABLE].create_index(["source"], if_not_exists=True)
-            self._db[_TABLE].create_index(["fetched_at"], if_not_exists=True)
+        else:
+            # Migrate caches created before these columns existed
+            columns = self._db[_TABLE].columns_dict
+            if "fetched_at_epoch" not in columns:
+                self._db[_TABLE].add_column("fetched_at_epoch", int)
+                self._backfill_epochs()
+            if "payload_hash" not in columns:
+                self._db[_TABLE].add_column("payload_hash", str)
+                self._db[_TABLE].add_column("unchanged_count", int)
+        # One composite index serves list_by_source, stats' GROUP BY and
+        # stale_keys (index-only: key is part of it).  It replaces the old
+        # single-column indexes.
+        self._db.executescript(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{_TABLE}_src_fetched
+                ON {_TABLE} (source, fetched_at_epoch, key);
+            DROP INDEX IF EXISTS idx_{_TABLE}_source;
+            DROP INDEX IF EXISTS idx_{_TABLE}_fetched_at;
+            DROP INDEX IF EXISTS idx_{_TABLE}_fetched_at_epoch;
+            """
+        )
+
+    def _backfill_epochs(self) -> None:
+        """Derive fetched_at_epoch from the ISO timestamp where it is missing."""
+        with self._db.conn:
+            self._db.conn.execute(
+                f"""
+                UPDATE {_TABLE}
+                SET fetched_at_epoch = CAST(strftime('%s', fetched_at) AS INTEGER)
+                WHERE fetched_at_epoch IS NULL
+                """
+            )
+
+    def _remember(self, entry: CacheEntry) -> None:
+        """
+        Put an entry at the front of the in-memory LRU, evicting the oldest.
+
+        Remembered entries keep the stored (serialised) payload and are never
+        handed out themselves: get() returns a detached copy, so no decoded
+        object is shared between callers.
+        """
+        self._mem[entry.key] = entry
+        self._mem.move_to_end(entry.key)
+        if len(self._mem) > self._mem_maxsize:
+            self._mem.popitem(last=False)
 
     # ------------------------------------------------------------------
     # Core CRUD
     # ------------------------------------------------------------------
 
     def get(self, key: str) -> Optional[CacheEntry]:
-        """Return a cached entry by key, or None if not found."""
-        try:
-            row = self._db[_TABLE].get(key)
-            return CacheEntry.from_row(dict(row))
-        except Exception:
-            return None
+        """
+        Return a cached entry by key, or None if not found.
+
+        Entries still within their source's (adaptive) TTL are served from
+        memory; stale ones are re-read from SQLite in case another process
+        refreshed them.  Each call returns a new entry whose ``data`` is
+        decoded from the stored payload, so callers may mutate it freely.
+        """
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                ttl = DEFAULT_TTL.get(entry.source, DEFAULT_TTL["default"])
+                if entry.is_fresh(entry.adaptive_ttl(ttl)):
+                    self._mem.move_to_end(key)
+                    return entry._detached()
+            row = self._db.conn.execute(self._GET_SQL, (key,)).fetchone()
+            if row is None:
+                self._mem.pop(key, None)
+                return None
+            entry = CacheEntry.from_row(dict(zip(self._GET_COLUMNS, row)))
+            self._remember(entry)
+            return entry._detached()
 
     def set(
         self,
@@ -143,7 +399,12 @@ class APICache:
         source: str,
         schema_version: str = "1",
     ) -> CacheEntry:
-        """Store a response in the cache. Overwrites any existing entry."""
+        """
+        Store a response in the cache. Overwrites any existing entry.
+
+        If *data* is identical to the payload it replaces, the returned
+        entry's ``unchanged_count`` is one higher than before; otherwise 0.
+        """
         entry = CacheEntry(
             key=key,
             source=source,
@@ -151,51 +412,107 @@ class APICache:
             fetched_at=dt.datetime.now(dt.timezone.utc),
             schema_version=schema_version,
         )
-        self._db[_TABLE].insert(entry.to_dict(), replace=True)
+        raw = _dumps(data)
+        entry._stored = _pack_payload(raw)
+        params = (
+            key,
+            source,
+            entry._stored,
+            entry.fetched_at.isoformat(),
+            schema_version,
+            int(entry.fetched_at.timestamp()),
+            hashlib.blake2b(raw, digest_size=8).hexdigest(),
+        )
+        with self._lock:
+            with self._db.conn:
+                self._db.conn.execute(self._UPSERT_SQL, params)
+                entry.unchanged_count = self._db.conn.execute(
+                    self._UNCHANGED_SQL, (key,)
+                ).fetchone()[0]
+            self._remember(entry._detached())
         return entry
 
     def delete(self, key: str) -> None:
         """Remove a single entry."""
-        try:
-            self._db[_TABLE].delete(key)
-        except Exception:
-            pass
+        with self._lock, self._db.conn:
+            self._mem.pop(key, None)
+            self._db.conn.execute(self._DELETE_SQL, (key,))
 
     def invalidate_source(self, source: str) -> int:
         """Delete all cached entries for a given source. Returns count deleted."""
-        rows = list(self._db[_TABLE].rows_where("source = ?", [source]))
-        for row in rows:
-            self._db[_TABLE].delete(row["key"])
-        return len(rows)
+        with self._lock:
+            with self._db.conn:
+                cursor = self._db.conn.execute(f"DELETE FROM {_TABLE} WHERE source = ?", [source])
+            for key in [k for k, e in self._mem.items() if e.source == source]:
+                del self._mem[key]
+        return cursor.rowcount
 
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
 
     def list_by_source(self, source: str) -> list[CacheEntry]:
-        rows = self._db[_TABLE].rows_where("source = ?", [source])
-        return [CacheEntry.from_row(dict(r)) for r in rows]
+        with self._lock:
+            rows = list(self._db[_TABLE].rows_where("source = ?", [source]))
+        return [CacheEntry.from_row(r) for r in rows]
 
     def stats(self) -> dict[str, dict]:
         """Return per-source stats: count, oldest, newest."""
-        result: dict[str, dict] = {}
-        for row in self._db[_TABLE].rows:
-            src = row["source"]
-            if src not in result:
-                result[src] = {"count": 0, "oldest": row["fetched_at"], "newest": row["fetched_at"]}
-            result[src]["count"] += 1
-            if row["fetched_at"] < result[src]["oldest"]:
-                result[src]["oldest"] = row["fetched_at"]
-            if row["fetched_at"] > result[src]["newest"]:
-                result[src]["newest"] = row["fetched_at"]
-        return result
+        with self._lock:
+            rows = self._db.execute(
+                f"""
+                SELECT source, COUNT(*), MIN(fetched_at), MAX(fetched_at)
+                FROM {_TABLE}
+                GROUP BY source
+                """
+            ).fetchall()
+        return {
+            src: {"count": count, "oldest": oldest, "newest": newest}
+            for src, count, oldest, newest in rows
+        }
 
     def stale_keys(self, source: str, ttl_seconds: Optional[int] = None) -> list[str]:
         """Return keys that are older than TTL for a given source."""
         if ttl_seconds is None:
             ttl_seconds = DEFAULT_TTL.get(source, DEFAULT_TTL["default"])
-        entries = self.list_by_source(source)
-        return [e.key for e in entries if not e.is_fresh(ttl_seconds)]
+        cutoff = int(time.time()) - ttl_seconds
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT key FROM {_TABLE} WHERE source = ? AND fetched_at_epoch <= ?",
+                [source, cutoff],
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def maintenance(self) -> bool:
+        """
+        Refresh planner statistics and reclaim space after large purges.
+
+        Runs ``ANALYZE`` plus ``PRAGMA optimize``, and ``VACUUM`` when more
+        than a quarter of the file is free pages (typically after a big
+        ``invalidate_source``).  Meant to be run occasionally — e.g. monthly
+        via ``anticorrupt sources maintenance``.  Returns True if the
+        database was vacuumed.
+        """
+        with self._lock:
+            self._db.execute("ANALYZE")
+            self._db.execute("PRAGMA optimize")
+            freelist = self._db.execute("PRAGMA freelist_count").fetchone()[0]
+            pages = self._db.execute("PRAGMA page_count").fetchone()[0]
+            if freelist <= pages // 4:
+                return False
+            self._db.vacuum()
+        logger.info("Cache vacuumed: reclaimed %d of %d pages", freelist, pages)
+        return True
+
+    def close(self) -> None:
+        """Record planner hints for this session and close the connection."""
+        with self._lock:
+            self._db.execute("PRAGMA optimize")
+            self._db.close()
 
     # ------------------------------------------------------------------
     # Snapshot (backup/export)
@@ -203,42 +520,77 @@ class APICache:
 
     def export_snapshot(self, output_path: Optional[Path] = None) -> Path:
         """
-        Export the full cache to a gzipped JSON file.
-        Default path: output/snapshots/cache_YYYYMMDD_HHMMSS.json.gz
+        Export the full cache as newline-delimited JSON, one record per line.
+
+        Paths ending in ``.zst`` are zstd-compressed, anything else gzip.
+        Default path: output/snapshots/cache_YYYYMMDD_HHMMSS.jsonl.zst
+        (``.jsonl.gz`` when zstandard is not installed).
         """
         if output_path is None:
             snapshots_dir = self._db_path.parent / "snapshots"
             snapshots_dir.mkdir(parents=True, exist_ok=True)
             ts = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d_%H%M%S")
-            output_path = snapshots_dir / f"cache_{ts}.json.gz"
-
-        all_rows = list(self._db[_TABLE].rows)
-        payload = {
-            "exported_at": dt.datetime.now(dt.timezone.utc).isoformat(),
-            "total_records": len(all_rows),
-            "records": all_rows,
-        }
-        with gzip.open(str(output_path), "wt", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-
-        logger.info("Cache snapshot exported: %s (%d records)", output_path, len(all_rows))
+            ext = ".jsonl.zst" if _ZSTD_AVAILABLE else ".jsonl.gz"
+            output_path = snapshots_dir / f"cache_{ts}{ext}"
+
+        # Stream rows straight into the compressor so memory stays flat no
+        # matter how large the cache is.
+        total = 0
+        with self._lock, _snapshot_writer(output_path) as f:
+            for row in self._db[_TABLE].rows:
+                # Snapshots stay plain JSON so they can be inspected and
+                # re-imported anywhere
+                row["data_json"] = _payload_text(row["data_json"])
+                f.write(_dumps(row) + b"\n")
+                total += 1
+
+        logger.info("Cache snapshot exported: %s (%d records)", output_path, total)
         return output_path
 
     def import_snapshot(self, snapshot_path: Path) -> int:
         """
         Import a previously exported snapshot into the cache.
+
+        Reads newline-delimited snapshots (zstd or gzip) record by record,
+        and still accepts the older single-document ``.json.gz`` format.
         Existing records with the same key are overwritten.
         Returns number of records imported.
         """
-        with gzip.open(str(snapshot_path), "rt", encoding="utf-8") as f:
-            payload = json.load(f)
-
-        records = payload.get("records", [])
-        for row in records:
-            self._db[_TABLE].insert(row, replace=True)
-
-        logger.info("Cache snapshot imported: %d records from %s", len(records), snapshot_path)
-        return len(records)
+        imported = 0
+
+        def _counted(records: Iterator[dict]) -> Iterator[dict]:
+            nonlocal imported
+            for record in records:
+                imported += 1
+                yield record
+
+        with _snapshot_reader(snapshot_path) as f:
+            first = f.readline()
+            try:
+                head = _loads(first) if first.strip() else None
+            except ValueError:
+                head = None  # first line of a pretty-printed legacy document
+            if head is None and not first.strip():
+                records: Iterator[dict] = iter(())
+            elif isinstance(head, dict) and "key" in head:
+                records = itertools.chain(
+                    [head], (_loads(line) for line in f if line.strip())
+                )
+            else:
+                # Legacy {"exported_at", "records": [...]} envelope
+                records = iter(_loads(first + f.read()).get("records", []))
+
+            # One transaction for the whole import instead of a commit per record
+            with self._lock:
+                with self._db.conn:
+                    self._db[_TABLE].insert_all(
+                        _counted(records), replace=True, batch_size=1000, alter=True
+                    )
+                self._backfill_epochs()
+                self._mem.clear()
+
+        logger.info("Cache snapshot imported: %d records from %s", imported, snapshot_path)
+        return imported
 
     # ------------------------------------------------------------------
     # Context manager
@@ -248,7 +600,7 @@ class APICache:
         return self
 
     def __exit__(self, *_) -> None:
-        pass  # sqlite-utils handles connection cleanup
+        self.close()
 
 
 # ---------------------------------------------------------------------------
@@ -19,8 +19,12 @@ Endpoints used:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from typing import Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
 
 import httpx
 
@@ -31,6 +35,62 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
 _SOURCE = "camara"
 _TIMEOUT = 15.0  # seconds
+_PAGE_WINDOW = 4  # pages requested concurrently once page 1 comes back full
+_SWR_WINDOW = 300.0  # seconds past TTL that stale data is served while refreshing
+_BULK_CONCURRENCY = 8  # requests in flight for the *_bulk helpers
+_LOADER_WINDOW = 0.005  # seconds a BatchLoader waits to collect ids
+_LOADER_WORKERS = 8
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to
+# HTTP/1.1 keep-alive when it is missing.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Pooled clients shared by every CamaraAPI instance, keyed by timeout, so
+# short-lived instances (one per CLI command) keep their keep-alive sockets.
+_CLIENTS: dict[float, httpx.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_client(timeout: float) -> httpx.Client:
+    """Return the shared client for *timeout*, creating it on first use."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(timeout)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                base_url=BASE_URL,
+                headers={"Accept": "application/json"},
+                timeout=timeout,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=90.0),
+            )
+            _CLIENTS[timeout] = client
+        return client
+
+
+# Background revalidation for stale-while-revalidate hits; _REFRESHING keeps
+# a burst of reads of the same stale key down to one refresh.
+_BG_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="camara-swr")
+_REFRESHING: set[str] = set()
+_REFRESHING_LOCK = threading.Lock()
+
+
+# Endpoint path segment -> cache source (checked in order; first match wins)
+_PREFIX_MAP = {
+    "deputados": "camara_deputados",
+    "votacoes": "camara_votos",
+    "proposicoes": "camara_proposicoes",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _source_name(endpoint: str) -> str:
+    """Map endpoint prefix to a source key for TTL lookup."""
+    return next((src for part, src in _PREFIX_MAP.items() if part in endpoint), _SOURCE)
 
 
 class CamaraAPIError(Exception):
@@ -43,16 +103,24 @@ class CamaraAPI:
 
     All methods accept a `force_refresh` parameter. If True, the cache is
     bypassed and data is fetched live (useful for manual refresh commands).
+
+    The HTTP connection pool is shared between instances and outlives them;
+    call ``CamaraAPI.shutdown()`` to close it explicitly.
+
+    Entries stale by less than *stale_while_revalidate* seconds are returned
+    immediately while a background thread refreshes them.
     """
 
-    def __init__(self, cache: Optional[APICache] = None, timeout: float = _TIMEOUT):
+    def __init__(
+        self,
+        cache: Optional[APICache] = None,
+        timeout: float = _TIMEOUT,
+        stale_while_revalidate: float = _SWR_WINDOW,
+    ):
         self._cache = cache or get_cache()
         self._timeout = timeout
-        self._client = httpx.Client(
-            base_url=BASE_URL,
-            headers={"Accept": "application/json"},
-            timeout=timeout,
-        )
+        self._client = _get_client(timeout)
+        self._swr_window = stale_while_revalidate
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -65,48 +133,46 @@ class CamaraAPI:
             key = f"{key}?{param_str}"
         return key
 
-    def _source_name(self, endpoint: str) -> str:
-        """Map endpoint prefix to a source key for TTL lookup."""
-        if "deputados" in endpoint:
-            return "camara_deputados"
-        if "votacoes" in endpoint or "votacoes" in endpoint:
-            return "camara_votos"
-        if "proposicoes" in endpoint:
-            return "camara_proposicoes"
-        return _SOURCE
-
     def _fetch(
         self,
         endpoint: str,
         params: Optional[dict] = None,
         force_refresh: bool = False,
+        key: Optional[str] = None,
     ) -> Any:
         """
         Fetch data with cache-first strategy.
 
+        *key* overrides the cache key derived from endpoint and params (for
+        callers that have already built it).
+
         1. Check cache → if fresh, return immediately.
-        2. Try live API → store in cache → return.
-        3. If API fails → return stale cache with warning.
-        4. If API fails and no cache → raise CamaraAPIError.
+        2. If stale within the SWR window → return it, refresh in background.
+        3. Try live API → store in cache → return.
+        4. If API fails → return stale cache with warning.
+        5. If API fails and no cache → raise CamaraAPIError.
         """
-        key = self._cache_key(endpoint, params)
-        source = self._source_name(endpoint)
+        key = key or self._cache_key(endpoint, params)
+        source = _source_name(endpoint)
         ttl = DEFAULT_TTL.get(source, DEFAULT_TTL["default"])
 
-        # Step 1: Check cache
+        # Steps 1–2: Check cache
         if not force_refresh:
             entry = self._cache.get(key)
+            if entry:
+                # Payloads that keep coming back unchanged earn a longer TTL
+                ttl = entry.adaptive_ttl(ttl)
             if entry and entry.is_fresh(ttl):
                 logger.debug("Cache HIT (fresh): %s", key)
                 return entry.data
+            if entry and entry.is_swr_eligible(ttl, self._swr_window):
+                logger.debug("Cache HIT (stale, revalidating): %s", key)
+                self._revalidate(key, endpoint, params, source)
+                return entry.data
 
-        # Step 2: Fetch from API
+        # Step 3: Fetch from API
         try:
-            response = self._client.get(endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
-            # Câmara API wraps responses in {"dados": [...], "links": [...]}
-            payload = data.get("dados", data)
+            payload = self._request(endpoint, params)
             self._cache.set(key, payload, source=source)
             logger.debug("Fetched and cached: %s", key)
             return payload
@@ -128,6 +194,121 @@ class CamaraAPI:
                 f"Câmara API request failed and no cached data available: {endpoint}"
             ) from exc
 
+    def _request(self, endpoint: str, params: Optional[dict]) -> Any:
+        """GET *endpoint* from the live API and unwrap the payload."""
+        response = self._client.get(endpoint, params=params)
+        response.raise_for_status()
+        return self._unwrap(response.json())
+
+    @staticmethod
+    def _unwrap(data: Any) -> Any:
+        # Câmara API wraps responses in {"dados": [...], "links": [...]}
+        return data.get("dados", data)
+
+    async def _afetch(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: Optional[dict] = None,
+    ) -> Any:
+        """
+        Async counterpart of _fetch's network steps (3–5).
+
+        Callers check the cache first; this fetches, caches, and falls back
+        to stale data or raises CamaraAPIError exactly like _fetch.
+        """
+        key = self._cache_key(endpoint, params)
+        source = _source_name(endpoint)
+        try:
+            response = await client.get(endpoint, params=params)
+            response.raise_for_status()
+            payload = self._unwrap(response.json())
+        except httpx.HTTPError as exc:
+            stale = self._cache.get(key)
+            if stale:
+                logger.warning(
+                    "Câmara API unreachable (%s). Using stale cache (%.1fh old): %s",
+                    exc,
+                    stale.age_seconds / 3600,
+                    key,
+                )
+                return stale.data
+            raise CamaraAPIError(
+                f"Câmara API request failed and no cached data available: {endpoint}"
+            ) from exc
+        self._cache.set(key, payload, source=source)
+        return payload
+
+    def _revalidate(
+        self, key: str, endpoint: str, params: Optional[dict], source: str
+    ) -> None:
+        """Refresh *key* on the background executor unless already in flight."""
+        with _REFRESHING_LOCK:
+            if key in _REFRESHING:
+                return
+            _REFRESHING.add(key)
+        _BG_EXEC.submit(self._refresh, key, endpoint, params, source)
+
+    def _refresh(
+        self, key: str, endpoint: str, params: Optional[dict], source: str
+    ) -> None:
+        try:
+            self._cache.set(key, self._request(endpoint, params), source=source)
+            logger.debug("Revalidated: %s", key)
+        except Exception as exc:
+            # The stale copy stays in place; the next read will retry
+            logger.debug("Background refresh failed for %s: %s", key, exc)
+        finally:
+            with _REFRESHING_LOCK:
+                _REFRESHING.discard(key)
+
+    def _fetch_pages(
+        self,
+        endpoint: str,
+        params: dict,
+        force_refresh: bool = False,
+    ) -> list[dict]:
+        """
+        Fetch every page of a paginated list endpoint.
+
+        Page 1 is fetched alone; if it comes back full, the following pages
+        are requested ``_PAGE_WINDOW`` at a time in parallel until one comes
+        back short.  Records are returned in page order.
+        """
+        page_size = params["itens"]
+        # Only "pagina" changes between pages: build the sorted key once and
+        # splice the page number in (same layout as _cache_key)
+        prefix, suffix = self._cache_key(endpoint, {**params, "pagina": "\0"}).split("\0")
+
+        def fetch_page(page: int) -> Any:
+            return self._fetch(
+                endpoint,
+                params={**params, "pagina": page},
+                force_refresh=force_refresh,
+                key=f"{prefix}{page}{suffix}",
+            )
+
+        first = fetch_page(1)
+        # page_data can be a list (from "dados" extraction)
+        if not isinstance(first, list):
+            return []
+        results = list(first)
+        if len(first) < page_size:
+            return results
+
+        next_page = 2
+        with ThreadPoolExecutor(max_workers=_PAGE_WINDOW) as pool:
+            while True:
+                window = range(next_page, next_page + _PAGE_WINDOW)
+                # map() yields in page order and only raises for pages we reach
+                for page_data in pool.map(fetch_page, window):
+                    if not page_data or not isinstance(page_data, list):
+                        return results
+                    results.extend(page_data)
+                    if len(page_data) < page_size:
+                        return results
+                next_page += _PAGE_WINDOW
+
     # ------------------------------------------------------------------
     # Deputies
     # ------------------------------------------------------------------
@@ -151,23 +332,7 @@ class CamaraAPI:
         if state:
             params["siglaUf"] = state
 
-        results = []
-        page = 1
-        while True:
-            params["pagina"] = page
-            page_data = self._fetch("/deputados", params=dict(params), force_refresh=force_refresh)
-            if not page_data:
-                break
-            # page_data can be a list (from "dados" extraction)
-            if isinstance(page_data, list):
-                results.extend(page_data)
-                if len(page_data) < 100:
-                    break
-            else:
-                break
-            page += 1
-
-        return results
+        return self._fetch_pages("/deputados", params, force_refresh=force_refresh)
 
     def get_deputy(self, deputy_id: int, force_refresh: bool = False) -> dict:
         """Get full detail for a single deputy."""
@@ -305,26 +470,9 @@ class CamaraAPI:
         if month:
             params["mes"] = month
 
-        results = []
-        page = 1
-        while True:
-            params["pagina"] = page
-            page_data = self._fetch(
-                f"/deputados/{deputy_id}/despesas",
-                params=dict(params),
-                force_refresh=force_refresh,
-            )
-            if not page_data:
-                break
-            if isinstance(page_data, list):
-                results.extend(page_data)
-                if len(page_data) < 200:
-                    break
-            else:
-                break
-            page += 1
-
-        return results
+        return self._fetch_pages(
+            f"/deputados/{deputy_id}/despesas", params, force_refresh=force_refresh
+        )
 
     # ------------------------------------------------------------------
     # Voting session individual votes
@@ -348,6 +496,71 @@ class CamaraAPI:
             or []
         )
 
+    def get_session_votes_bulk(
+        self, session_ids: list[str], force_refresh: bool = False
+    ) -> dict[str, list[dict]]:
+        """
+        Synchronous wrapper around :meth:`get_session_votes_bulk_async`.
+
+        Inside a running event loop it raises ``RuntimeError``; await
+        :meth:`get_session_votes_bulk_async` there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "get_session_votes_bulk() cannot be called from a running event loop; "
+                "await get_session_votes_bulk_async() instead."
+            )
+        return asyncio.run(
+            self.get_session_votes_bulk_async(session_ids, force_refresh=force_refresh)
+        )
+
+    async def get_session_votes_bulk_async(
+        self,
+        session_ids: list[str],
+        force_refresh: bool = False,
+        concurrency: int = _BULK_CONCURRENCY,
+    ) -> dict[str, list[dict]]:
+        """
+        Get individual votes for many voting sessions at once.
+
+        Fresh cache entries are served directly; the remaining sessions are
+        fetched concurrently (at most *concurrency* requests in flight).
+        Returns ``{session_id: votes}`` in the order of *session_ids*.
+        """
+        ttl = DEFAULT_TTL["camara_votos"]
+        results: dict[str, list[dict]] = {}
+        missing: list[str] = []
+        for session_id in dict.fromkeys(session_ids):
+            if not force_refresh:
+                entry = self._cache.get(self._cache_key(f"/votacoes/{session_id}/votos"))
+                if entry and entry.is_fresh(entry.adaptive_ttl(ttl)):
+                    results[session_id] = entry.data or []
+                    continue
+            missing.append(session_id)
+
+        if missing:
+            sem = asyncio.Semaphore(concurrency)
+            async with httpx.AsyncClient(
+                base_url=BASE_URL,
+                headers={"Accept": "application/json"},
+                timeout=self._timeout,
+                http2=_HTTP2_AVAILABLE,
+            ) as client:
+
+                async def fetch_one(session_id: str) -> tuple[str, Any]:
+                    async with sem:
+                        data = await self._afetch(client, f"/votacoes/{session_id}/votos")
+                    return session_id, data
+
+                for session_id, data in await asyncio.gather(*(fetch_one(s) for s in missing)):
+                    results[session_id] = data or []
+
+        return {session_id: results[session_id] for session_id in session_ids}
+
     # ------------------------------------------------------------------
     # Bulk refresh
     # ------------------------------------------------------------------
@@ -377,4 +590,114 @@ class CamaraAPI:
         return self
 
     def __exit__(self, *_) -> None:
-        self._client.close()
+        pass  # the shared client stays open for the next instance
+
+    @staticmethod
+    def shutdown() -> None:
+        """Close every shared HTTP client (they are recreated on next use)."""
+        with _CLIENTS_LOCK:
+            for client in _CLIENTS.values():
+                client.close()
+            _CLIENTS.clear()
+
+
+class BatchLoader:
+    """
+    DataLoader-style coalescing of single-id lookups.
+
+    ``load(id)`` returns a Future.  Ids requested within *window* seconds of
+    each other are deduplicated and resolved concurrently with *fetch*.
+    Resolved values are not kept: a later ``load`` of the same id calls
+    *fetch* again, so the APICache's freshness rules apply and every
+    caller gets its own result object.
+
+    Usage::
+
+        with DeputyLoader(api) as loader:
+            futures = [loader.load(dep_id) for dep_id in ids]
+            deputies = [f.result() for f in futures]
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Any], Any],
+        window: float = _LOADER_WINDOW,
+        max_workers: int = _LOADER_WORKERS,
+    ):
+        self._fetch = fetch
+        self._window = window
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="camara-loader")
+        self._lock = threading.Lock()
+        self._futures: dict[Hashable, Future] = {}  # queued or in flight
+        self._batch: list[Hashable] = []
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def load(self, key: Hashable) -> Future:
+        """Schedule *key* for the next batch; repeat keys share one Future."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BatchLoader is closed")
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = Future()
+                self._batch.append(key)
+                if self._timer is None:
+                    self._timer = threading.Timer(self._window, self._dispatch)
+                    self._timer.daemon = True
+                    self._timer.start()
+            return future
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            batch, self._batch, self._timer = self._batch, [], None
+            futures = [(key, self._futures[key]) for key in batch]
+        for key, future in futures:
+            try:
+                self._pool.submit(self._resolve, key, future)
+            except RuntimeError as exc:  # pool already shut down
+                with self._lock:
+                    self._futures.pop(key, None)
+                future.set_exception(exc)
+
+    def _resolve(self, key: Hashable, future: Future) -> None:
+        try:
+            result = self._fetch(key)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                self._futures.pop(key, None)
+
+    def close(self) -> None:
+        """Resolve anything still queued, then stop the worker threads."""
+        with self._lock:
+            self._closed = True
+            timer = self._timer
+        if timer is not None:
+            timer.cancel()
+            timer.join()  # a timer already inside _dispatch finishes submitting
+        self._dispatch()
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "BatchLoader":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class DeputyLoader(BatchLoader):
+    """BatchLoader over :meth:`CamaraAPI.get_deputy`."""
+
+    def __init__(self, api: Optional[CamaraAPI] = None, **kwargs: Any):
+        super().__init__((api or CamaraAPI()).get_deputy, **kwargs)
+
+
+class VoteSessionLoader(BatchLoader):
+    """BatchLoader over :meth:`CamaraAPI.get_vote_session`."""
+
+    def __init__(self, api: Optional[CamaraAPI] = None, **kwargs: Any):
+        super().__init__((api or CamaraAPI()).get_vote_session, **kwargs)
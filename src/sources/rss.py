@@ -4,86 +4,170 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from dataclasses import dataclass, field
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import feedparser
 import httpx
 
+from src.sources.cache import APICache, get_cache
+
+# feedparser is imported on first fetch; CLI commands that never read feeds
+# skip its import cost.
+if TYPE_CHECKING:
+    import feedparser
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to
+# HTTP/1.1 keep-alive when it is missing.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_FETCH_WORKERS = 16  # feeds downloaded concurrently by fetch_all
+_UTC = timezone.utc
+
+# One pooled client shared by every RSSFetcher, so periodic refreshes reuse
+# the TCP/TLS sessions opened by the previous run instead of re-handshaking.
+_RSS_CLIENT: Optional[httpx.Client] = None
+_RSS_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared feed client, creating it on first use."""
+    global _RSS_CLIENT
+    with _RSS_CLIENT_LOCK:
+        if _RSS_CLIENT is None or _RSS_CLIENT.is_closed:
+            _RSS_CLIENT = httpx.Client(
+                timeout=15,
+                follow_redirects=True,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=40,
+                    keepalive_expiry=300.0,
+                ),
+            )
+        return _RSS_CLIENT
+
 # ---------------------------------------------------------------------------
 # Feed registry — curated Brazilian political / institutional news sources
 # ---------------------------------------------------------------------------
 
-FEEDS: dict[str, dict] = {
+@dataclass(frozen=True, slots=True)
+class FeedSpec:
+    """Static description of one feed in the registry."""
+
+    key: str
+    url: str
+    source_name: str
+    language: str
+    tags: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Every article from this feed points at these same string objects
+        object.__setattr__(self, "source_name", sys.intern(self.source_name))
+        object.__setattr__(self, "language", sys.intern(self.language))
+        object.__setattr__(self, "tags", tuple(sys.intern(t) for t in self.tags))
+
+    @classmethod
+    def from_dict(cls, key: str, meta: dict) -> "FeedSpec":
+        """Build a spec from a plain ``{"url", "source_name", ...}`` mapping."""
+        return cls(
+            key=key,
+            url=meta["url"],
+            source_name=meta["source_name"],
+            language=meta["language"],
+            tags=tuple(meta.get("tags", ())),
+        )
+
+
+_FEED_SPECS: tuple[FeedSpec, ...] = (
     # Generalist / politics
-    "folha_poder": {
-        "url": "https://feeds.folha.uol.com.br/poder/rss091.xml",
-        "source_name": "Folha de S.Paulo — Poder",
-        "language": "pt-BR",
-        "tags": ["política", "governo"],
-    },
-    "g1_politica": {
-        "url": "https://g1.globo.com/rss/g1/politica/",
-        "source_name": "G1 — Política",
-        "language": "pt-BR",
-        "tags": ["política"],
-    },
-    "estadao_politica": {
-        "url": "https://www.estadao.com.br/rss/politica.xml",
-        "source_name": "Estadão — Política",
-        "language": "pt-BR",
-        "tags": ["política", "governo"],
-    },
+    FeedSpec(
+        key="folha_poder",
+        url="https://feeds.folha.uol.com.br/poder/rss091.xml",
+        source_name="Folha de S.Paulo — Poder",
+        language="pt-BR",
+        tags=("política", "governo"),
+    ),
+    FeedSpec(
+        key="g1_politica",
+        url="https://g1.globo.com/rss/g1/politica/",
+        source_name="G1 — Política",
+        language="pt-BR",
+        tags=("política",),
+    ),
+    FeedSpec(
+        key="estadao_politica",
+        url="https://www.estadao.com.br/rss/politica.xml",
+        source_name="Estadão — Política",
+        language="pt-BR",
+        tags=("política", "governo"),
+    ),
     # Institutional / congress
-    "congresso_em_foco": {
-        "url": "https://congressoemfoco.uol.com.br/feed/",
-        "source_name": "Congresso em Foco",
-        "language": "pt-BR",
-        "tags": ["congresso", "legislativo"],
-    },
+    FeedSpec(
+        key="congresso_em_foco",
+        url="https://congressoemfoco.uol.com.br/feed/",
+        source_name="Congresso em Foco",
+        language="pt-BR",
+        tags=("congresso", "legislativo"),
+    ),
     # Official
-    "agencia_brasil": {
-        "url": "https://agenciabrasil.ebc.com.br/rss/politica/feed.xml",
-        "source_name": "Agência Brasil",
-        "language": "pt-BR",
-        "tags": ["governo", "oficial"],
-    },
-    "agencia_senado": {
-        "url": "https://www12.senado.leg.br/noticias/rss/noticias-do-dia.xml",
-        "source_name": "Agência Senado",
-        "language": "pt-BR",
-        "tags": ["senado", "legislativo"],
-    },
-    "agencia_camara": {
-        "url": "https://www.camara.leg.br/noticias/rss",
-        "source_name": "Agência Câmara",
-        "language": "pt-BR",
-        "tags": ["câmara", "legislativo"],
-    },
+    FeedSpec(
+        key="agencia_brasil",
+        url="https://agenciabrasil.ebc.com.br/rss/politica/feed.xml",
+        source_name="Agência Brasil",
+        language="pt-BR",
+        tags=("governo", "oficial"),
+    ),
+    FeedSpec(
+        key="agencia_senado",
+        url="https://www12.senado.leg.br/noticias/rss/noticias-do-dia.xml",
+        source_name="Agência Senado",
+        language="pt-BR",
+        tags=("senado", "legislativo"),
+    ),
+    FeedSpec(
+        key="agencia_camara",
+        url="https://www.camara.leg.br/noticias/rss",
+        source_name="Agência Câmara",
+        language="pt-BR",
+        tags=("câmara", "legislativo"),
+    ),
     # Justice / STF
-    "stf_noticias": {
-        "url": "https://portal.stf.jus.br/noticias/rss.asp",
-        "source_name": "STF — Notícias",
-        "language": "pt-BR",
-        "tags": ["judiciário", "stf"],
-    },
-    "jota": {
-        "url": "https://www.jota.info/feed",
-        "source_name": "JOTA",
-        "language": "pt-BR",
-        "tags": ["judiciário", "direito"],
-    },
+    FeedSpec(
+        key="stf_noticias",
+        url="https://portal.stf.jus.br/noticias/rss.asp",
+        source_name="STF — Notícias",
+        language="pt-BR",
+        tags=("judiciário", "stf"),
+    ),
+    FeedSpec(
+        key="jota",
+        url="https://www.jota.info/feed",
+        source_name="JOTA",
+        language="pt-BR",
+        tags=("judiciário", "direito"),
+    ),
     # Anti-corruption / transparency
-    "transparencia_internacional": {
-        "url": "https://www.transparency.org/en/news/rss",
-        "source_name": "Transparência Internacional",
-        "language": "en",
-        "tags": ["corrupção", "transparência"],
-    },
-}
+    FeedSpec(
+        key="transparencia_internacional",
+        url="https://www.transparency.org/en/news/rss",
+        source_name="Transparência Internacional",
+        language="en",
+        tags=("corrupção", "transparência"),
+    ),
+)
+
+FEEDS: dict[str, FeedSpec] = {spec.key: spec for spec in _FEED_SPECS}
 
 
 # ---------------------------------------------------------------------------
@@ -91,11 +175,11 @@ FEEDS: dict[str, dict] = {
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedArticle:
     """A single article fetched from an RSS feed."""
 
-    id: str  # sha256 of url
+    id: str  # 64-bit blake2b of url (16 hex chars)
     url: str
     title: str
     summary: str
@@ -103,26 +187,25 @@ class FeedArticle:
     source_key: str
     source_name: str
     language: str
-    tags: list[str] = field(default_factory=list)
+    tags: tuple[str, ...] = ()  # shared with the FeedSpec
     full_text: Optional[str] = None  # populated by scraper later
 
     @classmethod
     def from_entry(
         cls,
         entry: feedparser.FeedParserDict,
-        source_key: str,
-        source_meta: dict,
+        spec: FeedSpec,
     ) -> "FeedArticle":
         url = entry.get("link", "")
-        article_id = hashlib.sha256(url.encode()).hexdigest()[:16]
+        # Short stable id; blake2b with an 8-byte digest is cheaper than
+        # truncating a full sha256 and gives the same 16 hex chars.
+        article_id = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
 
         # Parse date
         published_at: Optional[datetime] = None
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
-            try:
-                published_at = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            except Exception:
-                pass
+        p = getattr(entry, "published_parsed", None)
+        if p and len(p) >= 6:
+            published_at = datetime(p[0], p[1], p[2], p[3], p[4], p[5], tzinfo=_UTC)
 
         # Summary — prefer content > summary > title
         summary = ""
@@ -137,10 +220,24 @@ class FeedArticle:
             title=entry.get("title", "").strip(),
             summary=summary.strip(),
             published_at=published_at,
-            source_key=source_key,
-            source_name=source_meta["source_name"],
-            language=source_meta["language"],
-            tags=list(source_meta.get("tags", [])),
+            source_key=spec.key,
+            source_name=spec.source_name,
+            language=spec.language,
+            tags=spec.tags,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FeedArticle":
+        """Rebuild an article from :meth:`to_dict` output."""
+        published = data.get("published_at")
+        return cls(
+            **{
+                **data,
+                "published_at": datetime.fromisoformat(published) if published else None,
+                "source_name": sys.intern(data["source_name"]),
+                "language": sys.intern(data["language"]),
+                "tags": tuple(sys.intern(t) for t in data.get("tags") or ()),
+            }
         )
 
     def to_dict(self) -> dict:
@@ -153,7 +250,7 @@ class FeedArticle:
             "source_key": self.source_key,
             "source_name": self.source_name,
             "language": self.language,
-            "tags": self.tags,
+            "tags": list(self.tags),
             "full_text": self.full_text,
         }
 
@@ -164,75 +261,152 @@ class FeedArticle:
 
 
 class RSSFetcher:
-    """Fetch and parse one or more RSS feeds."""
+    """
+    Fetch and parse one or more RSS feeds.
+
+    Uses a pooled ``httpx.Client`` shared with every other fetcher, so
+    TCP/TLS sessions are reused across feeds, fetch_all workers and
+    successive runs; call ``RSSFetcher.shutdown()`` to close it.
+
+    With a *cache*, each feed's ETag / Last-Modified and parsed articles
+    are stored under ``rss:<source_key>`` and sent back as conditional GET
+    headers, so an unchanged feed costs a bodiless ``304 Not Modified``.
+    """
 
     def __init__(
         self,
-        feeds: dict[str, dict] | None = None,
+        feeds: dict[str, FeedSpec | dict] | None = None,
         timeout: int = 15,
         max_articles_per_feed: int = 20,
+        cache: Optional[APICache] = None,
     ) -> None:
-        self.feeds = feeds or FEEDS
+        # Plain dict entries are accepted for ad-hoc feeds
+        self.feeds: dict[str, FeedSpec] = {
+            key: spec if isinstance(spec, FeedSpec) else FeedSpec.from_dict(key, spec)
+            for key, spec in (feeds or FEEDS).items()
+        }
+        self._cache = cache
         self.timeout = timeout
         self.max_articles_per_feed = max_articles_per_feed
+        self._client = _get_client()
 
     def fetch_feed(self, source_key: str) -> list[FeedArticle]:
         """Fetch a single feed by its registry key."""
         if source_key not in self.feeds:
             raise KeyError(f"Unknown feed key: {source_key!r}")
-        meta = self.feeds[source_key]
-        return self._parse_feed(source_key, meta)
+        return self._parse_feed(self.feeds[source_key])
 
     def fetch_all(
         self,
         source_keys: list[str] | None = None,
         language_filter: str | None = None,
     ) -> list[FeedArticle]:
-        """Fetch all (or specified) feeds; optionally filter by language."""
+        """
+        Fetch all (or specified) feeds; optionally filter by language.
+
+        Feeds are downloaded concurrently, so the total time is bounded by
+        the slowest feed rather than the sum.  Articles keep feed order.
+        """
         keys = source_keys or list(self.feeds.keys())
-        articles: list[FeedArticle] = []
+        selected: list[FeedSpec] = []
         for key in keys:
-            meta = self.feeds.get(key)
-            if not meta:
+            spec = self.feeds.get(key)
+            if not spec:
                 logger.warning("Feed key not found: %s", key)
                 continue
-            if language_filter and meta.get("language") != language_filter:
+            if language_filter and spec.language != language_filter:
                 continue
-            try:
-                batch = self._parse_feed(key, meta)
-                articles.extend(batch)
-                logger.info("✓ %s — %d articles", key, len(batch))
-            except Exception as exc:
-                logger.warning("✗ Failed to fetch %s: %s", key, exc)
+            selected.append(spec)
+        if not selected:
+            return []
+
+        articles: list[FeedArticle] = []
+        with ThreadPoolExecutor(max_workers=min(len(selected), _FETCH_WORKERS)) as pool:
+            futures = [(spec.key, pool.submit(self._parse_feed, spec)) for spec in selected]
+            for key, future in futures:
+                try:
+                    batch = future.result()
+                    articles.extend(batch)
+                    logger.info("✓ %s — %d articles", key, len(batch))
+                except Exception as exc:
+                    logger.warning("✗ Failed to fetch %s: %s", key, exc)
         return articles
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _parse_feed(self, source_key: str, meta: dict) -> list[FeedArticle]:
-        url = meta["url"]
+    def _parse_feed(self, spec: FeedSpec) -> list[FeedArticle]:
+        import feedparser
+
+        source_key, url = spec.key, spec.url
+        cache_key = f"rss:{source_key}"
+        cached = self._cache.get(cache_key) if self._cache else None
+        headers: dict[str, str] = {}
+        if cached:
+            if cached.data.get("etag"):
+                headers["If-None-Match"] = cached.data["etag"]
+            if cached.data.get("last_modified"):
+                headers["If-Modified-Since"] = cached.data["last_modified"]
+
+        response: Optional[httpx.Response] = None
         try:
             # Use httpx to fetch raw bytes (better redirect/timeout handling)
-            response = httpx.get(url, timeout=self.timeout, follow_redirects=True)
+            response = self._client.get(url, headers=headers, timeout=self.timeout)
+            if cached and response.status_code == 304:
+                logger.debug("Feed not modified: %s", source_key)
+                articles = cached.data.get("articles", [])[: self.max_articles_per_feed]
+                return [FeedArticle.from_dict(a) for a in articles]
             response.raise_for_status()
             parsed = feedparser.parse(response.content)
         except httpx.HTTPError as exc:
             # Fallback: let feedparser try directly
             logger.debug("httpx failed for %s, falling back to feedparser: %s", source_key, exc)
+            response = None
             parsed = feedparser.parse(url)
 
         entries = parsed.get("entries", [])[: self.max_articles_per_feed]
         articles = []
         for entry in entries:
             try:
-                article = FeedArticle.from_entry(entry, source_key, meta)
+                article = FeedArticle.from_entry(entry, spec)
                 if article.url and article.title:
                     articles.append(article)
             except Exception as exc:
                 logger.debug("Could not parse entry from %s: %s", source_key, exc)
+
+        if self._cache and response is not None:
+            self._cache.set(
+                cache_key,
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "articles": [a.to_dict() for a in articles],
+                },
+                source="rss",
+            )
         return articles
 
+    # ------------------------------------------------------------------
+    # Context manager / cleanup
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        pass  # the shared client stays open for the next fetcher
+
+    def __enter__(self) -> "RSSFetcher":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @staticmethod
+    def shutdown() -> None:
+        """Close the shared HTTP client (it is recreated on next use)."""
+        with _RSS_CLIENT_LOCK:
+            if _RSS_CLIENT is not None:
+                _RSS_CLIENT.close()
+
 
 # ---------------------------------------------------------------------------
 # Convenience function
@@ -245,5 +419,5 @@ def scan_news(
     max_per_feed: int = 20,
 ) -> list[FeedArticle]:
     """High-level: fetch all Brazilian news feeds, return articles list."""
-    fetcher = RSSFetcher(max_articles_per_feed=max_per_feed)
-    return fetcher.fetch_all(source_keys=source_keys, language_filter=language_filter)
+    with RSSFetcher(max_articles_per_feed=max_per_feed, cache=get_cache()) as fetcher:
+        return fetcher.fetch_all(source_keys=source_keys, language_filter=language_filter)
@@ -22,21 +22,47 @@ Note: The full result files (votacao_candidato_munzona) are 100MB–1GB+.
 
 from __future__ import annotations
 
+import asyncio
 import csv
+import functools
 import io
 import logging
+import os
+import struct
+import sys
+import tempfile
 import zipfile
+import zlib
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterator, Optional
+from types import ModuleType
+from typing import IO, BinaryIO, Iterator, Optional, Sequence, Union
 
 import httpx
 
 from src.history.models import ElectionResult
 
+_fast_zlib: Optional[ModuleType]
+try:  # optional: ISA-L inflates DEFLATE members 2-3x faster than stdlib zlib
+    import isal.isal_zlib
+
+    _fast_zlib = isal.isal_zlib
+except ImportError:
+    _fast_zlib = None
+
 logger = logging.getLogger(__name__)
 
 _CDN_BASE = "https://cdn.tse.jus.br/estatistica/sead/odsele"
 _TIMEOUT = 180.0  # large files — be generous
+_CHUNK_SIZE = 1 << 20  # bytes read from the socket per write
+_SPOOL_MAX = 32 << 20  # uncached downloads spill from memory to disk past this
+_RANGE_PART = 8 << 20  # target size of each byte-range request
+_RANGE_MIN_PARTS = 4  # files smaller than this many parts use a single GET
+_RANGE_CONNECTIONS = 8  # concurrent range requests
+
+# A downloaded archive: a path under cache_dir, or an open temporary file
+ZipSource = Union[Path, BinaryIO]
 
 # All election years for which TSE has data
 ELECTION_YEARS = [
@@ -61,19 +87,164 @@ POSITION_MAP: dict[str, str] = {
 }
 
 # TSE "elected" status codes that appear in DS_SIT_TOT_TURNO
-_ELECTED_TERMS = {"ELEITO", "ELEITA", "ELEITO POR MÉDIA", "ELEITO POR QP", "ELEITA POR QP"}
+_ELECTED_TERMS = frozenset(
+    {"ELEITO", "ELEITA", "ELEITO POR MÉDIA", "ELEITO POR QP", "ELEITA POR QP"}
+)
+
+# Columns read by fetch_candidates, in unpacking order.  Each entry lists the
+# header names used across election years; the first non-empty one wins.
+_CANDIDATE_COLUMNS: tuple[tuple[str, ...], ...] = (
+    ("SG_UF", "UF_CANDIDATO"),
+    ("DS_CARGO", "NM_CARGO"),
+    ("NM_CANDIDATO", "NM_URNA_CANDIDATO"),
+    ("SG_PARTIDO", "NM_PARTIDO"),
+    ("DS_SIT_TOT_TURNO", "CD_SIT_TOT_TURNO"),
+    ("NR_CANDIDATO",),
+    ("NR_CPF_CANDIDATO",),
+    ("SQ_CANDIDATO",),
+)
 
 
 class TSEError(Exception):
     """Raised when TSE data download or parsing fails."""
 
 
+def _largest_csv(zf: zipfile.ZipFile) -> str:
+    """Name of the largest CSV member — usually the main data file."""
+    csv_files = [n for n in zf.namelist() if n.lower().endswith(".csv")]
+    if not csv_files:
+        raise TSEError("No CSV files found in the downloaded ZIP archive.")
+    return max(csv_files, key=lambda n: zf.getinfo(n).file_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _open_zip(path: Path, mtime_ns: int, size: int) -> tuple[zipfile.ZipFile, str]:
+    """
+    Open a cached archive once and remember its CSV member.
+
+    Repeated fetches from the same year (e.g. one per state) then skip
+    re-reading the central directory.  *mtime_ns* and *size* tie the entry
+    to the file's current contents; an evicted ZipFile is closed when it is
+    garbage collected.
+    """
+    zf = zipfile.ZipFile(path)
+    try:
+        return zf, _largest_csv(zf)
+    except BaseException:
+        zf.close()
+        raise
+
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")  # ZIP local file header, 30 bytes
+
+
+class _InflateReader(io.RawIOBase):
+    """
+    Raw stream over a DEFLATE member, inflated with ISA-L.
+
+    The member's local header is located from ``ZipInfo.header_offset`` and
+    its compressed bytes are fed through ``isal_zlib.decompressobj(-15)``,
+    so no ``zipfile`` internals are touched.  Size and CRC-32 are checked
+    against the central directory once the member is exhausted.
+    """
+
+    def __init__(self, fileobj: IO[bytes], info: zipfile.ZipInfo, owns_file: bool) -> None:
+        super().__init__()
+        self._file = fileobj
+        self._owns_file = owns_file
+        self._info = info
+        fileobj.seek(info.header_offset)
+        header = fileobj.read(_LOCAL_HEADER.size)
+        if len(header) != _LOCAL_HEADER.size or header[:4] != b"PK\x03\x04":
+            raise TSEError(f"Bad local header for {info.filename!r} in the ZIP archive.")
+        *_, name_len, extra_len = _LOCAL_HEADER.unpack(header)
+        fileobj.seek(name_len + extra_len, os.SEEK_CUR)
+        self._left = info.compress_size
+        assert _fast_zlib is not None  # _open_member only uses this reader with ISA-L
+        self._inflate = _fast_zlib.decompressobj(-15)
+        self._flushed = False
+        self._block = memoryview(b"")
+        self._crc = 0
+        self._size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        while not self._block:
+            if self._left:
+                chunk = self._file.read(min(_CHUNK_SIZE, self._left))
+                if not chunk:
+                    raise TSEError(f"ZIP member {self._info.filename!r} is truncated.")
+                self._left -= len(chunk)
+                data = self._inflate.decompress(chunk)
+            elif not self._flushed:
+                self._flushed = True
+                data = self._inflate.flush()
+            else:
+                if self._size != self._info.file_size or self._crc != self._info.CRC:
+                    raise TSEError(f"ZIP member {self._info.filename!r} failed its CRC check.")
+                return 0
+            self._crc = zlib.crc32(data, self._crc)
+            self._size += len(data)
+            self._block = memoryview(data)
+        n = min(len(buffer), len(self._block))
+        buffer[:n] = self._block[:n]
+        self._block = self._block[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed and self._owns_file:
+            self._file.close()
+        super().close()
+
+
+def _open_member(zf: zipfile.ZipFile, name: str, archive: ZipSource) -> IO[bytes]:
+    """
+    Open a ZIP member of *archive* for reading, inflating it with ISA-L when installed.
+
+    The fast path reads the member's compressed bytes itself (from its own
+    handle for cached archives) instead of patching the stdlib reader;
+    stored, encrypted or non-DEFLATE members use ``zf.open`` as usual.
+    """
+    info = zf.getinfo(name)
+    if (
+        _fast_zlib is None
+        or info.compress_type != zipfile.ZIP_DEFLATED
+        or info.flag_bits & 0x1  # encrypted
+    ):
+        return zf.open(name)
+    if isinstance(archive, Path):
+        fileobj = archive.open("rb")
+        try:
+            raw = _InflateReader(fileobj, info, owns_file=True)
+        except BaseException:
+            fileobj.close()
+            raise
+    else:
+        raw = _InflateReader(archive, info, owns_file=False)
+    return io.BufferedReader(raw, buffer_size=_CHUNK_SIZE)
+
+
+class _RangeNotHonouredError(Exception):
+    """The server answered a range request with the full body (or a new file)."""
+
+
+def _loop_running() -> bool:
+    """True if called from a thread with a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class TSEClient:
     """
     Client for TSE open electoral data.
 
-    Downloads ZIP files from the TSE CDN, extracts CSVs in memory, and
-    parses them into ElectionResult records.
+    Streams ZIP files from the TSE CDN to disk (or a spooled temporary
+    file), then reads the CSV inside row by row into ElectionResult records.
 
     Args:
         timeout:   HTTP timeout in seconds (large files — use 120+)
@@ -96,45 +267,215 @@ class TSEClient:
     # Low-level download + parse
     # ------------------------------------------------------------------
 
-    def _download(self, url: str, local_name: str) -> bytes:
-        """Download a file, using cache_dir as a local disk cache if set."""
+    @contextmanager
+    def _download_to_path(self, url: str, local_name: str) -> Iterator[ZipSource]:
+        """
+        Download a file without holding it in memory, yielding where it landed.
+
+        With cache_dir the file is streamed to a temporary name there and
+        atomically renamed to *local_name* (so an interrupted download never
+        leaves a truncated cache entry); without it, into a spooled temporary
+        file that is discarded on exit.
+        """
         if self._cache_dir:
             cached = self._cache_dir / local_name
             if cached.exists():
                 logger.info("TSE cache hit: %s", cached)
-                return cached.read_bytes()
+                yield cached
+                return
+            tmp = tempfile.NamedTemporaryFile(
+                dir=self._cache_dir, prefix=f".{local_name}.", suffix=".part", delete=False
+            )
+            try:
+                with tmp:
+                    self._stream_into(url, tmp)
+                os.replace(tmp.name, cached)
+            except BaseException:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
+            yield cached
+            return
+
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX) as buf:
+            self._stream_into(url, buf)
+            buf.seek(0)
+            yield buf  # type: ignore[misc]
+
+    def _stream_into(self, url: str, out: IO[bytes]) -> None:
+        """
+        Write the body of *url* to *out*.
 
+        Large files on servers that accept byte ranges (the TSE CDN does) are
+        fetched as concurrent ranges; anything else is a single streamed GET.
+        The ranged path runs its own event loop, so inside a running loop
+        (a synchronous call from async code) the single GET is used.
+        """
         logger.info("Downloading TSE file: %s", url)
         try:
-            response = self._client.get(url)
-            response.raise_for_status()
+            length, etag = self._probe_ranges(url)
+            if length and _loop_running():
+                logger.info("Event loop already running; downloading %s with a single GET", url)
+                length = 0
+            if length:
+                try:
+                    asyncio.run(self._download_ranges(url, out, length, etag))
+                    total = length
+                except _RangeNotHonouredError:
+                    logger.info("Range requests not honoured for %s; using a single GET", url)
+                    out.seek(0)
+                    out.truncate(0)
+                    total = self._download_single(url, out)
+            else:
+                total = self._download_single(url, out)
         except httpx.HTTPError as exc:
             raise TSEError(f"Download failed for {url}: {exc}") from exc
+        logger.info("Downloaded %.1f MB", total / 1_048_576)
 
-        content = response.content
-        logger.info("Downloaded %.1f MB", len(content) / 1_048_576)
+    def _probe_ranges(self, url: str) -> tuple[int, Optional[str]]:
+        """Return (content length, ETag) if *url* is worth a ranged download, else (0, None)."""
+        try:
+            head = self._client.head(url)
+            head.raise_for_status()
+        except httpx.HTTPStatusError:
+            return 0, None  # some servers refuse HEAD; a plain GET still works
+        if head.headers.get("accept-ranges", "").lower() != "bytes":
+            return 0, None
+        length = int(head.headers.get("content-length") or 0)
+        if length < _RANGE_PART * _RANGE_MIN_PARTS:
+            return 0, None
+        return length, head.headers.get("etag")
+
+    def _download_single(self, url: str, out: IO[bytes]) -> int:
+        total = 0
+        with self._client.stream("GET", url) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes(chunk_size=_CHUNK_SIZE):
+                out.write(chunk)
+                total += len(chunk)
+        return total
+
+    async def _download_ranges(
+        self, url: str, out: IO[bytes], length: int, etag: Optional[str]
+    ) -> None:
+        """
+        Fetch ``[0, length)`` as ~8 MB ranges over up to 8 connections.
 
-        if self._cache_dir:
-            (self._cache_dir / local_name).write_bytes(content)
+        Each part is written at its own offset of the pre-sized *out*; the
+        first failing part cancels the rest.
+        ``If-Range`` pins every part to the ETag seen by HEAD, so a file
+        replaced mid-download comes back as a 200 and is refetched whole
+        instead of being stitched from two versions.
+        """
+        part = -(-length // max(_RANGE_MIN_PARTS, length // _RANGE_PART))
+        out.truncate(length)
+        sem = asyncio.Semaphore(_RANGE_CONNECTIONS)
+        extra = {"If-Range": etag} if etag else {}
 
-        return content
+        async with httpx.AsyncClient(
+            timeout=self._timeout,
+            follow_redirects=True,
+            headers=self._client.headers,
+            limits=httpx.Limits(max_connections=_RANGE_CONNECTIONS),
+        ) as client:
+
+            async def fetch(start: int) -> None:
+                end = min(start + part, length) - 1
+                headers = {"Range": f"bytes={start}-{end}", **extra}
+                async with sem, client.stream("GET", url, headers=headers) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise _RangeNotHonouredError(url)
+                    pos = start
+                    async for chunk in response.aiter_bytes(chunk_size=_CHUNK_SIZE):
+                        # No await between seek and write, so parts never interleave
+                        out.seek(pos)
+                        out.write(chunk)
+                        pos += len(chunk)
 
-    def _iter_csv_rows(self, zip_bytes: bytes, encoding: str = "latin-1") -> Iterator[dict]:
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for start in range(0, length, part):
+                        tg.create_task(fetch(start))
+            except ExceptionGroup as group:
+                # The group has already cancelled the other parts; re-raise a
+                # single error so callers can fall back or report it as usual.
+                refused = group.subgroup(_RangeNotHonouredError)
+                raise (refused or group).exceptions[0] from None
+
+    @contextmanager
+    def _open_csv(self, archive: ZipSource, encoding: str = "latin-1") -> Iterator[IO[str]]:
+        """
+        Open the largest CSV in a ZIP archive as a text stream.
+
+        The CSV is decoded as it is read, so memory stays flat however large
+        the member is.  Archives in cache_dir stay open between calls.
+        """
+        if isinstance(archive, Path):
+            stat = archive.stat()
+            zf, csv_name = _open_zip(archive, stat.st_mtime_ns, stat.st_size)
+            logger.info("Parsing TSE CSV: %s", csv_name)
+            with _open_member(zf, csv_name, archive) as raw:
+                yield io.TextIOWrapper(raw, encoding=encoding, errors="replace", newline="")
+            return
+
+        with zipfile.ZipFile(archive) as zf:
+            csv_name = _largest_csv(zf)
+            logger.info("Parsing TSE CSV: %s", csv_name)
+            with _open_member(zf, csv_name, archive) as raw:
+                yield io.TextIOWrapper(raw, encoding=encoding, errors="replace", newline="")
+
+    def _iter_csv_rows(self, archive: ZipSource, encoding: str = "latin-1") -> Iterator[dict]:
         """
         Extract the largest CSV from a ZIP archive and yield each row as a dict.
         Handles both semicolon and comma delimiters (TSE uses semicolons).
         """
-        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
-            csv_files = [n for n in zf.namelist() if n.lower().endswith(".csv")]
-            if not csv_files:
-                raise TSEError("No CSV files found in the downloaded ZIP archive.")
-            # Pick the largest CSV — usually the main data file
-            csv_name = max(csv_files, key=lambda n: zf.getinfo(n).file_size)
-            logger.info("Parsing TSE CSV: %s", csv_name)
-            with zf.open(csv_name) as f:
-                text = f.read().decode(encoding, errors="replace")
-                reader = csv.DictReader(io.StringIO(text), delimiter=";")
-                yield from reader
+        with self._open_csv(archive, encoding) as text:
+            yield from csv.DictReader(text, delimiter=";")
+
+    def _iter_columns(
+        self,
+        archive: ZipSource,
+        columns: Sequence[tuple[str, ...]],
+        encoding: str = "latin-1",
+    ) -> Iterator[Sequence[str]]:
+        """
+        Yield one value per entry of *columns* for every CSV row.
+
+        Column positions are resolved once from the header and picked with
+        ``itemgetter``, so no per-row dict is built for the dozens of TSE
+        columns that are never read.  A column missing from the header reads
+        as ``""``; alternatives are only consulted where the first is empty.
+        """
+        with self._open_csv(archive, encoding) as text:
+            reader = csv.reader(text, delimiter=";")
+            header = next(reader, [])
+            index: dict[str, int] = {}
+            for i, name in enumerate(header):
+                index.setdefault(name, i)
+            width = len(header)
+            blank = width  # index of an extra "" cell for absent columns
+            present = [[index[c] for c in alts if c in index] for alts in columns]
+            primary = [idxs[0] if idxs else blank for idxs in present]
+            fallbacks = [(pos, idxs[1:]) for pos, idxs in enumerate(present) if len(idxs) > 1]
+            pick = itemgetter(*primary)
+            pad = [""] * (width + 1)
+
+            for row in reader:
+                # Every row becomes exactly width + 1 cells so ``blank`` is
+                # always the padding "": short rows are padded, and cells past
+                # the header (trailing ";" or ragged rows) are dropped.
+                if len(row) <= width:
+                    row.extend(pad[len(row):])
+                else:
+                    del row[width:]
+                    row.append("")
+                values = pick(row)
+                if fallbacks:
+                    values = list(values)
+                    for pos, alts in fallbacks:
+                        if not values[pos]:
+                            values[pos] = next((row[i] for i in alts if row[i]), "")
+                yield values
 
     # ------------------------------------------------------------------
     # Public API
@@ -168,69 +509,93 @@ class TSEClient:
             )
 
         url = f"{_CDN_BASE}/consulta_cand/consulta_cand_{year}.zip"
-        zip_bytes = self._download(url, f"tse_cand_{year}.zip")
-
         results: list[ElectionResult] = []
         count = 0
-
-        for row in self._iter_csv_rows(zip_bytes):
-            if count >= limit:
-                break
-
-            # State filter — try multiple column name variants across years
-            uf = (row.get("SG_UF") or row.get("UF_CANDIDATO") or "").strip().upper()
-            if state and uf != state.upper():
-                continue
-
-            # Position
-            pos_raw = (row.get("DS_CARGO") or row.get("NM_CARGO") or "").strip().upper()
-            if position and position.upper() not in pos_raw:
-                continue
-            pos = POSITION_MAP.get(pos_raw, pos_raw)
-
-            # Candidate name
-            name = (
-                row.get("NM_CANDIDATO")
-                or row.get("NM_URNA_CANDIDATO")
-                or ""
-            ).strip()
-            party = (row.get("SG_PARTIDO") or row.get("NM_PARTIDO") or "").strip()
-            if not name or not party:
-                continue
-
-            # Election result status — use exact set membership to avoid
-            # "NÃO ELEITO" matching "ELEITO" as a substring
-            status_raw = (
-                row.get("DS_SIT_TOT_TURNO")
-                or row.get("CD_SIT_TOT_TURNO")
-                or ""
-            ).strip().upper()
-            elected = status_raw in _ELECTED_TERMS
-
-            # Optional fields
-            number = (row.get("NR_CANDIDATO") or "").strip()
-            cpf_raw = (row.get("NR_CPF_CANDIDATO") or "").strip()
-            cpf = cpf_raw if len(cpf_raw) >= 11 else None
-            seq = (row.get("SQ_CANDIDATO") or "").strip()
-
-            try:
-                result = ElectionResult(
-                    year=year,
-                    state=uf or (state or "BR"),
-                    position=pos,
-                    candidate_name=name,
-                    candidate_number=number or None,
-                    candidate_cpf=cpf,
-                    party=party,
-                    votes=0,          # vote counts require a separate (heavier) file
-                    elected=elected,
-                    round=1,
-                    tse_seq_candidate=seq or None,
+        # Filter operands are normalised once, not per row
+        state_filter = state.upper() if state else None
+        position_filter = position.upper() if position else None
+        # UF, position, party and status repeat a few dozen raw values across
+        # hundreds of thousands of rows: normalise each distinct value once
+        # and share the resulting string between all results.
+        ufs: dict[str, str] = {}
+        positions: dict[str, tuple[str, bool]] = {}  # raw -> (mapped, kept)
+        parties: dict[str, str] = {}
+        statuses: dict[str, bool] = {}  # raw -> elected
+
+        with self._download_to_path(url, f"tse_cand_{year}.zip") as archive:
+            for (
+                uf,
+                pos_raw,
+                name,
+                party,
+                status_raw,
+                number,
+                cpf_raw,
+                seq,
+            ) in self._iter_columns(archive, _CANDIDATE_COLUMNS):
+                if count >= limit:
+                    break
+
+                # State filter — column names vary across years
+                uf_norm = ufs.get(uf)
+                if uf_norm is None:
+                    uf_norm = ufs[uf] = sys.intern(uf.strip().upper())
+                if state_filter and uf_norm != state_filter:
+                    continue
+
+                # Position — the filter verdict is cached with the mapping, so
+                # rows of an already-seen raw value skip the substring scan
+                pos_entry = positions.get(pos_raw)
+                if pos_entry is None:
+                    normalised = sys.intern(pos_raw.strip().upper())
+                    pos_entry = positions[pos_raw] = (
+                        POSITION_MAP.get(normalised, normalised),
+                        not position_filter or position_filter in normalised,
+                    )
+                pos, kept = pos_entry
+                if not kept:
+                    continue
+
+                # Candidate name
+                name = name.strip()
+                party_norm = parties.get(party)
+                if party_norm is None:
+                    party_norm = parties[party] = sys.intern(party.strip())
+                if not name or not party_norm:
+                    continue
+
+                # Election result status — use exact set membership to avoid
+                # "NÃO ELEITO" matching "ELEITO" as a substring
+                elected = statuses.get(status_raw)
+                if elected is None:
+                    elected = statuses[status_raw] = (
+                        status_raw.strip().upper() in _ELECTED_TERMS
+                    )
+
+                # Optional fields
+                number = number.strip()
+                cpf_raw = cpf_raw.strip()
+                cpf = cpf_raw if len(cpf_raw) >= 11 else None
+                seq = seq.strip()
+
+                # Every field is already a normalised str/int/bool, so
+                # validation cannot reject the row here
+                results.append(
+                    ElectionResult(
+                        year=year,
+                        state=uf_norm or (state or "BR"),
+                        position=pos,
+                        candidate_name=name,
+                        candidate_number=number or None,
+                        candidate_cpf=cpf,
+                        party=party_norm,
+                        votes=0,          # vote counts require a separate (heavier) file
+                        elected=elected,
+                        round=1,
+                        tse_seq_candidate=seq or None,
+                    )
                 )
-                results.append(result)
                 count += 1
-            except Exception as exc:
-                logger.debug("Skipping TSE row: %s — %s", row.get("NM_CANDIDATO"), exc)
 
         logger.info("Parsed %d candidates for year %d", len(results), year)
         return results
@@ -14,18 +14,24 @@ Key Wikidata entity QIDs used:
   Q5055441   — Governor (Governador de estado brasileiro)
   Q15238777  — legislature (generic — used to find legislative terms)
 
-Rate limit: ~5–10 req/s. All methods sleep briefly between requests.
+Rate limit: ~5–10 req/s. At most five queries are in flight per client, and
+query starts are paced by a token bucket at five per second.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple, Optional, Sequence, cast
 
 import httpx
 
 from src.history.models import HistoricalEvent, Legislature, Politician, PoliticianRole
+from src.sources.cache import DEFAULT_TTL, APICache
 
 logger = logging.getLogger(__name__)
 
@@ -36,65 +42,351 @@ _HEADERS = {
     "User-Agent": "AntiCorrupt/1.0 (https://github.com/nandorv/anti_corrupt) Python/httpx",
 }
 _TIMEOUT = 90.0  # seconds — complex Wikidata SPARQL queries can take 60–80s
-_SLEEP = 0.5  # seconds between requests
+_RATE = 5.0  # query starts per second, sustained
+_MAX_IN_FLIGHT = 5  # concurrent queries per client (also the rate burst)
+_KEEPALIVE_EXPIRY = 120.0  # seconds an idle connection stays pooled
+
+# orjson decodes the nested SPARQL results JSON several times faster than
+# stdlib json; optional (``pip install anticorrupt[speedups]``).
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to
+# HTTP/1.1 keep-alive when it is missing.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+class PositionSpec(NamedTuple):
+    """Role metadata attached to one P39 position in a batched query."""
+
+    role_name: str
+    institution: str
+    tags: tuple[str, ...]
+    since_year: Optional[int] = None  # only terms starting on/after this year
+
+
+# Positions fetched together by WikidataClient.fetch_all_political_positions.
+# Governors are absent: each state has its own position entity, so they are
+# matched by label in fetch_governors instead.
+POLITICAL_POSITIONS: dict[str, PositionSpec] = {
+    "Q21609546": PositionSpec(
+        "Deputado Federal", "camara-deputados",
+        ("câmara", "deputado-federal", "legislativo"), since_year=2019,
+    ),
+    "Q18611017": PositionSpec(
+        "Senador Federal", "senado-federal",
+        ("senado", "senador", "legislativo"), since_year=2019,
+    ),
+    "Q35137": PositionSpec(
+        "Presidente da República", "presidencia-da-republica",
+        ("presidente", "executivo"),
+    ),
+}
+
+
+# Event sub-queries run by fetch_political_events: (type, P31 values)
+_EVENT_GROUPS: tuple[tuple[str, str], ...] = (
+    # Scandals, crises, police operations, investigations
+    ("scandal", "wd:Q2334719 wd:Q3307126 wd:Q1358461 wd:Q2101636 wd:Q16943273 wd:Q162875"),
+    # Elections (all types)
+    ("election", "wd:Q40231 wd:Q189760 wd:Q15275719 wd:Q1076105 wd:Q3544124"),
+    # Social movements, protests, strikes
+    ("movement", "wd:Q1371582 wd:Q49773 wd:Q273120 wd:Q114953 wd:Q175331 wd:Q2726259"),
+    # Legislation, constitutional events, coups
+    ("legislation", "wd:Q3387717 wd:Q93288 wd:Q131569 wd:Q7283 wd:Q180684"),
+)
+
 
 class WikidataError(Exception):
     """Raised when a Wikidata SPARQL request fails."""
 
 
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class _RateLimiter:
+    """
+    Token bucket pacing query starts, shared across threads.
+
+    A fixed pause after every response also delays the query that follows
+    a minute-long one; this only blocks when queries start faster than
+    *rate* per second on average, allowing bursts of up to *burst*.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one has accrued if needed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+# ---------------------------------------------------------------------------
+# SPARQL binding accessors
+# ---------------------------------------------------------------------------
+
+
+def _val(binding: dict, key: str) -> Optional[str]:
+    """Safely extract the string value from a SPARQL binding."""
+    return (binding.get(key) or {}).get("value")
+
+
+def _wid(uri: str) -> Optional[str]:
+    """Extract the QID (e.g. Q12345) from a Wikidata entity URI."""
+    if not uri:
+        return None
+    return uri.rpartition("/")[2] or None
+
+
+def _date(raw: Optional[str]) -> Optional[str]:
+    """Trim a Wikidata date string to YYYY-MM-DD."""
+    return raw[:10] if raw else None
+
+
+def _is_qid(label: str) -> bool:
+    """Return True if the label is just a bare QID fallback (e.g. 'Q12345')."""
+    return bool(label) and label[0] == "Q" and label[1:].isdigit()
+
+
+def _is_unlabelled(label: Optional[str]) -> bool:
+    """No pt/en label: unbound, or the bare-QID placeholder of older results."""
+    return not label or _is_qid(label)
+
+
+def _label_clause(var: str, indent: int = 10) -> str:
+    """SPARQL binding ``?<var>Label`` to the pt label of ``?<var>``, else the en one."""
+    pad = " " * indent
+    return (
+        f'OPTIONAL {{ ?{var} rdfs:label ?{var}Pt FILTER(LANG(?{var}Pt) = "pt") }}\n'
+        f'{pad}OPTIONAL {{ ?{var} rdfs:label ?{var}En FILTER(LANG(?{var}En) = "en") }}\n'
+        f"{pad}BIND(COALESCE(?{var}Pt, ?{var}En) AS ?{var}Label)"
+    )
+
+
+# Plain rdfs:label joins instead of the SERVICE wikibase:label call, which
+# runs after the query proper and is the slowest step on large results.  Labels
+# of optional entities are joined inside that entity's OPTIONAL block so an
+# unbound ?birthPlace / ?party cannot match every label in the graph.
+_PERSON_LABEL = _label_clause("person")
+_BIRTH_PLACE = f"""OPTIONAL {{
+            ?person wdt:P19 ?birthPlace .
+            {_label_clause("birthPlace", indent=12)}
+          }}"""
+_EVENT_LABEL = _label_clause("event")
+_PARTY = f"""OPTIONAL {{
+            ?person wdt:P102 ?party .
+            {_label_clause("party", indent=12)}
+          }}"""
+
+
+_POSITION_VARS = (
+    "?pos ?person ?personLabel ?birthDate ?birthPlaceLabel ?partyLabel ?startDate ?endDate ?description"
+)
+
+
+def _per_position(head: str, rows: Sequence[str], body: str, limit: Optional[int]) -> str:
+    """
+    WHERE-clause contents matching *body* against ``VALUES`` *head* *rows*.
+
+    Without a *limit* every row shares one ``VALUES`` block.  With one, each
+    row gets its own sub-select under that LIMIT, joined by UNION: a single
+    LIMIT over the combined result is filled by whichever position has the
+    most rows (deputies, with a row per term and party) and cuts the others
+    off.
+    """
+    if not limit:
+        return f"VALUES {head} {{ {' '.join(rows)} }}\n{body}"
+    return "\n          UNION\n".join(
+        f"""          {{
+            SELECT DISTINCT {_POSITION_VARS}
+            WHERE {{
+              VALUES {head} {{ {row} }}
+              {body}
+            }}
+            ORDER BY ?personLabel
+            LIMIT {limit}
+          }}"""
+        for row in rows
+    ).lstrip()
+
+
 class WikidataClient:
     """
     Client for querying the Wikidata SPARQL endpoint.
 
     All public methods return parsed model objects ready to be saved
-    to the HistoryStore.
+    to the HistoryStore.  The client is thread-safe: queries from several
+    threads share one HTTP/2 connection (see :meth:`fetch_all`).
+
+    With a *cache*, query results are stored under a hash of the SPARQL
+    text and reused for a week without touching the endpoint; a stale copy
+    is returned if the endpoint is unreachable.
     """
 
-    def __init__(self, timeout: float = _TIMEOUT):
-        self._client = httpx.Client(headers=_HEADERS, timeout=timeout)
+    def __init__(self, timeout: float = _TIMEOUT, cache: Optional[APICache] = None):
+        self._cache = cache
+        # Passing a transport makes httpx ignore Client(http2=, limits=), so
+        # the pool is configured on the transport itself.  Connections idle
+        # for up to _KEEPALIVE_EXPIRY survive the gaps between fetchers
+        # (httpx's default is 5 s); retries cover connect failures only.
+        self._client = httpx.Client(
+            headers=_HEADERS,
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=_MAX_IN_FLIGHT,
+                    max_keepalive_connections=_MAX_IN_FLIGHT,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY,
+                ),
+                retries=2,
+            ),
+        )
+        self._slots = threading.BoundedSemaphore(_MAX_IN_FLIGHT)
+        self._limiter = _RateLimiter(_RATE, burst=_MAX_IN_FLIGHT)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _query(self, sparql: str) -> list[dict]:
-        """Execute SPARQL and return the results bindings as a list of dicts."""
-        try:
-            response = self._client.get(
-                SPARQL_ENDPOINT,
-                params={"query": sparql, "format": "json"},
-            )
-            response.raise_for_status()
-            return response.json().get("results", {}).get("bindings", [])
-        except httpx.HTTPError as exc:
-            raise WikidataError(f"Wikidata SPARQL request failed: {exc}") from exc
+        """
+        Execute SPARQL and return the results bindings as a list of dicts.
 
-    @staticmethod
-    def _val(binding: dict, key: str) -> Optional[str]:
-        """Safely extract the string value from a SPARQL binding."""
-        entry = binding.get(key)
-        if entry is None:
-            return None
-        return entry.get("value")
+        Each query holds one of ``_MAX_IN_FLIGHT`` slots while in flight and
+        takes a token from the client's rate limiter before it is sent, which
+        keeps concurrent callers within the endpoint's limits.  Fresh cache
+        hits skip both.
+        """
+        key = self._cache_key(sparql)
+        cached = self._cache.get(key) if self._cache is not None else None
+        if cached is not None and cached.is_fresh(
+            cached.adaptive_ttl(DEFAULT_TTL["wikidata"])
+        ):
+            return cast(list[dict], cached.data)
+
+        with self._slots:
+            self._limiter.acquire()
+            try:
+                response = self._client.get(
+                    SPARQL_ENDPOINT,
+                    params={"query": sparql, "format": "json"},
+                )
+                response.raise_for_status()
+                bindings: list[dict] = (
+                    _json_loads(response.content).get("results", {}).get("bindings", [])
+                )
+            except httpx.HTTPError as exc:
+                if cached is not None:
+                    logger.warning(
+                        "Wikidata unreachable (%s). Using stale cache (%.1fh old)",
+                        exc,
+                        cached.age_seconds / 3600,
+                    )
+                    return cast(list[dict], cached.data)
+                raise WikidataError(f"Wikidata SPARQL request failed: {exc}") from exc
 
-    @staticmethod
-    def _wid(uri: str) -> Optional[str]:
-        """Extract the QID (e.g. Q12345) from a Wikidata entity URI."""
-        if not uri:
-            return None
-        return uri.split("/")[-1] or None
+        if self._cache is not None:
+            self._cache.set(key, bindings, source="wikidata")
+        return bindings
 
     @staticmethod
-    def _date(raw: Optional[str]) -> Optional[str]:
-        """Trim a Wikidata date string to YYYY-MM-DD."""
-        if not raw:
-            return None
-        return raw[:10]
+    def _cache_key(sparql: str) -> str:
+        digest = hashlib.blake2b(sparql.encode(), digest_size=16).hexdigest()
+        return f"wikidata:{digest}"
+
+    # Binding accessors live at module level so the row loops call plain
+    # functions; the aliases keep WikidataClient._val & co. working.
+    _val = staticmethod(_val)
+    _wid = staticmethod(_wid)
+    _date = staticmethod(_date)
+    _is_qid = staticmethod(_is_qid)
+
+    def _group_by_person(self, bindings: list[dict]) -> dict[str, list[dict]]:
+        """
+        Group bindings by person QID, in first-seen order.
 
-    @staticmethod
-    def _is_qid(label: str) -> bool:
-        """Return True if the label is just a bare QID fallback (e.g. 'Q12345')."""
-        return bool(label) and label.startswith("Q") and label[1:].isdigit()
+        People without a pt/en label are dropped.
+        """
+        groups: dict[str, list[dict]] = {}
+        for b in bindings:
+            wid = _wid(_val(b, "person") or "")
+            if not wid:
+                continue
+            group = groups.get(wid)
+            if group is None:
+                groups[wid] = [b]
+            else:
+                group.append(b)
+        return {
+            wid: group
+            for wid, group in groups.items()
+            if not _is_unlabelled(_val(group[0], "personLabel"))
+        }
+
+    def _person_from_group(
+        self,
+        wid: str,
+        group: list[dict],
+        roles: list[PoliticianRole],
+        tags: list[str],
+    ) -> Politician:
+        """Build a Politician; bio fields repeat across a group, so read the first row."""
+        b = group[0]
+        return Politician(
+            wikidata_id=wid,
+            name=_val(b, "personLabel") or "",
+            birth_date=_date(_val(b, "birthDate")),
+            birth_place=_val(b, "birthPlaceLabel"),
+            party=_val(b, "partyLabel"),
+            roles=roles,
+            tags=list(tags),
+            sources=[f"https://www.wikidata.org/wiki/{wid}"],
+            summary=_val(b, "description"),
+        )
+
+    def _term_roles(
+        self, group: list[dict], role_name: str, institution: str
+    ) -> list[PoliticianRole]:
+        """One role per distinct term start date in *group*, in first-seen order."""
+        roles: dict[Optional[str], PoliticianRole] = {}
+        for b in group:
+            start = _date(_val(b, "startDate"))
+            if start not in roles:
+                roles[start] = PoliticianRole(
+                    role=role_name,
+                    institution=institution,
+                    start_date=start,
+                    end_date=_date(_val(b, "endDate")),
+                )
+        return list(roles.values())
 
     # ------------------------------------------------------------------
     # Specific position fetchers
@@ -102,47 +394,38 @@ class WikidataClient:
 
     def fetch_stf_ministers(self) -> list[Politician]:
         """Fetch all STF ministers (current and historical) from Wikidata."""
-        sparql = """
+        sparql = f"""
         SELECT DISTINCT ?person ?personLabel ?birthDate ?birthPlaceLabel
-                        ?description
-        WHERE {
-          { ?person wdt:P39 wd:Q10302614 }
+                        ?startDate ?endDate ?description
+        WHERE {{
+          {{ ?person wdt:P39 wd:Q10302614 }}
           UNION
-          { ?person p:P39 ?stmt . ?stmt ps:P39 wd:Q10302614 }
-          OPTIONAL { ?person wdt:P569 ?birthDate }
-          OPTIONAL { ?person wdt:P19 ?birthPlace }
-          OPTIONAL {
+          {{
+            ?person p:P39 ?stmt . ?stmt ps:P39 wd:Q10302614 .
+            OPTIONAL {{ ?stmt pq:P580 ?startDate }}
+            OPTIONAL {{ ?stmt pq:P582 ?endDate }}
+          }}
+          OPTIONAL {{ ?person wdt:P569 ?birthDate }}
+          {_BIRTH_PLACE}
+          OPTIONAL {{
             ?person schema:description ?description
             FILTER(LANG(?description) = "pt")
-          }
-          SERVICE wikibase:label { bd:serviceParam wikibase:language "pt,en" }
-        }
+          }}
+          {_PERSON_LABEL}
+        }}
         ORDER BY ?personLabel
         """
         bindings = self._query(sparql)
         politicians: dict[str, Politician] = {}
 
-        for b in bindings:
-            wid = self._wid(self._val(b, "person") or "")
-            if not wid:
-                continue
-            name = self._val(b, "personLabel") or ""
-            if self._is_qid(name):
-                continue
-
-            if wid not in politicians:
-                politicians[wid] = Politician(
-                    wikidata_id=wid,
-                    name=name,
-                    birth_date=self._date(self._val(b, "birthDate")),
-                    birth_place=self._val(b, "birthPlaceLabel"),
-                    roles=[PoliticianRole(role="Ministro do STF", institution="stf")],
-                    tags=["stf", "judiciário", "ministro"],
-                    sources=[f"https://www.wikidata.org/wiki/{wid}"],
-                    summary=self._val(b, "description"),
-                )
-
-        time.sleep(_SLEEP)
+        for wid, group in self._group_by_person(bindings).items():
+            roles = self._term_roles(group, "Ministro do STF", "stf")
+            # The wdt:P39 branch repeats each person without qualifiers; keep
+            # that undated role only when no dated term was found.
+            roles = [r for r in roles if r.start_date] or roles
+            politicians[wid] = self._person_from_group(
+                wid, group, roles, ["stf", "judiciário", "ministro"]
+            )
 
         # Fallback: QID might be wrong — use description-based search
         if not politicians:
@@ -181,89 +464,88 @@ class WikidataClient:
                            after this year (e.g. 2017 = last two mandates).
                            People with no recorded start date are always included.
         """
+        return self.fetch_politicians_by_positions(
+            (position_qid,), role_name, institution, tags, limit=limit, since_year=since_year
+        )
+
+    def fetch_politicians_by_positions(
+        self,
+        position_qids: Sequence[str],
+        role_name: str,
+        institution: str,
+        tags: list[str],
+        limit: int = 500,
+        since_year: Optional[int] = None,
+    ) -> list[Politician]:
+        """
+        Fetch holders of the first of several alternative QIDs for one position.
+
+        Some offices are modelled by more than one Wikidata item.  All
+        candidates go into one ``VALUES`` block, so this is a single round
+        trip; rows are dispatched back by ``?pos`` and the first QID, in the
+        given order, that yields anyone wins — as if each had been tried in
+        turn.  Each candidate gets its own row limit.  Other arguments are as
+        for :meth:`fetch_politicians_by_position`.
+        """
         date_filter = (
             f'FILTER(!BOUND(?startDate) || ?startDate >= "{since_year}-01-01"^^xsd:dateTime)'
             if since_year else ""
         )
-        sparql = f"""
-        SELECT DISTINCT ?person ?personLabel ?birthDate ?birthPlaceLabel
-                        ?partyLabel ?startDate ?endDate ?description
-        WHERE {{
-          ?person p:P39 ?stmt .
-          ?stmt ps:P39 wd:{position_qid} .
+        body = f"""?person p:P39 ?stmt .
+          ?stmt ps:P39 ?pos .
           OPTIONAL {{ ?stmt pq:P580 ?startDate }}
           OPTIONAL {{ ?stmt pq:P582 ?endDate }}
           {date_filter}
           OPTIONAL {{ ?person wdt:P569 ?birthDate }}
-          OPTIONAL {{ ?person wdt:P19 ?birthPlace }}
-          OPTIONAL {{ ?person wdt:P102 ?party }}
+          {_BIRTH_PLACE}
+          {_PARTY}
           OPTIONAL {{
             ?person schema:description ?description
             FILTER(LANG(?description) = "pt")
           }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "pt,en" }}
+          {_PERSON_LABEL}"""
+        where = _per_position("?pos", [f"wd:{qid}" for qid in position_qids], body, limit)
+        sparql = f"""
+        SELECT DISTINCT {_POSITION_VARS}
+        WHERE {{
+          {where}
         }}
         ORDER BY ?personLabel
-        LIMIT {limit}
         """
-        bindings = self._query(sparql)
-        politicians: dict[str, Politician] = {}
-
-        for b in bindings:
-            wid = self._wid(self._val(b, "person") or "")
-            if not wid:
-                continue
-            name = self._val(b, "personLabel") or ""
-            if self._is_qid(name):
-                continue
-
-            if wid not in politicians:
-                politicians[wid] = Politician(
-                    wikidata_id=wid,
-                    name=name,
-                    birth_date=self._date(self._val(b, "birthDate")),
-                    birth_place=self._val(b, "birthPlaceLabel"),
-                    party=self._val(b, "partyLabel"),
-                    roles=[],
-                    tags=list(tags),
-                    sources=[f"https://www.wikidata.org/wiki/{wid}"],
-                    summary=self._val(b, "description"),
-                )
-
-            start = self._date(self._val(b, "startDate"))
-            end = self._date(self._val(b, "endDate"))
-            # Avoid duplicate role entries for the same term
-            existing = {(r.start_date, r.institution) for r in politicians[wid].roles}
-            if (start, institution) not in existing:
-                politicians[wid].roles.append(
-                    PoliticianRole(
-                        role=role_name,
-                        institution=institution,
-                        start_date=start,
-                        end_date=end,
-                    )
+        by_pos: dict[str, list[dict]] = {qid: [] for qid in position_qids}
+        for b in self._query(sparql):
+            rows = by_pos.get(_wid(_val(b, "pos") or "") or "")
+            if rows is not None:
+                rows.append(b)
+
+        for rows in by_pos.values():
+            politicians = [
+                self._person_from_group(
+                    wid, group, self._term_roles(group, role_name, institution), tags
                 )
-
-        time.sleep(_SLEEP)
-        return list(politicians.values())
-
-    def fetch_federal_deputies(self, limit: int = 600, since_year: int = 2019) -> list[Politician]:
+                for wid, group in self._group_by_person(rows).items()
+            ]
+            if politicians:
+                return politicians
+        return []
+
+    def fetch_federal_deputies(
+        self, limit: int = 600, since_year: Optional[int] = 2019
+    ) -> list[Politician]:
         """
         Fetch Brazilian Federal Deputies.
         Defaults to since_year=2019 (last two mandates: 56th + 57th legislatura).
         Pass since_year=None for all historical deputies.
         """
-        seen: dict[str, Politician] = {}
-        for qid in ("Q21609546", "Q23903549", "Q25028988"):
-            results = self.fetch_politicians_by_position(
-                qid, "Deputado Federal", "camara-deputados",
+        seen: dict[str, Politician] = {
+            p.id: p
+            for p in self.fetch_politicians_by_positions(
+                ("Q21609546", "Q23903549", "Q25028988"),
+                "Deputado Federal", "camara-deputados",
                 ["câmara", "deputado-federal", "legislativo"],
                 limit=limit, since_year=since_year,
             )
-            for p in results:
-                seen.setdefault(p.id, p)
-            if seen:
-                break
+        }
         if not seen:
             broad = self._fetch_politicians_by_occupation(
                 extra_filter='?person wdt:P27 wd:Q155 .',
@@ -276,23 +558,21 @@ class WikidataClient:
                 seen.setdefault(p.id, p)
         return list(seen.values())
 
-    def fetch_senators(self, limit: int = 300, since_year: int = 2019) -> list[Politician]:
+    def fetch_senators(self, limit: int = 300, since_year: Optional[int] = 2019) -> list[Politician]:
         """
         Fetch Brazilian Senators.
         Defaults to since_year=2019 (last two election cycles).
         Pass since_year=None for all historical senators.
         """
-        seen: dict[str, Politician] = {}
-        for qid in ("Q18611017", "Q23903561", "Q25028990"):
-            results = self.fetch_politicians_by_position(
-                qid, "Senador Federal", "senado-federal",
+        seen: dict[str, Politician] = {
+            p.id: p
+            for p in self.fetch_politicians_by_positions(
+                ("Q18611017", "Q23903561", "Q25028990"),
+                "Senador Federal", "senado-federal",
                 ["senado", "senador", "legislativo"],
                 limit=limit, since_year=since_year,
             )
-            for p in results:
-                seen.setdefault(p.id, p)
-            if seen:
-                break
+        }
         if not seen:
             broad = self._fetch_politicians_by_occupation(
                 extra_filter='?person wdt:P27 wd:Q155 .',
@@ -307,16 +587,14 @@ class WikidataClient:
 
     def fetch_presidents(self) -> list[Politician]:
         """Fetch all Presidents of Brazil (all time)."""
-        seen: dict[str, Politician] = {}
-        for qid in ("Q35137", "Q2801132", "Q148863"):
-            results = self.fetch_politicians_by_position(
-                qid, "Presidente da República", "presidencia-da-republica",
+        seen: dict[str, Politician] = {
+            p.id: p
+            for p in self.fetch_politicians_by_positions(
+                ("Q35137", "Q2801132", "Q148863"),
+                "Presidente da República", "presidencia-da-republica",
                 ["presidente", "executivo"], limit=50,
             )
-            for p in results:
-                seen.setdefault(p.id, p)
-            if seen:
-                break
+        }
         # Fallback: description-based
         if not seen:
             logger.info("Presidents QID returned 0 — using description fallback")
@@ -331,6 +609,104 @@ class WikidataClient:
                 seen.setdefault(p.id, p)
         return list(seen.values())
 
+    def fetch_all_political_positions(
+        self,
+        mapping: Optional[dict[str, PositionSpec]] = None,
+        limit: Optional[int] = None,
+    ) -> list[Politician]:
+        """
+        Fetch several positions in a single SPARQL round-trip.
+
+        *mapping* maps position QIDs to their :class:`PositionSpec` (default:
+        :data:`POLITICAL_POSITIONS`).  The positions go into one ``VALUES``
+        block, so the endpoint plans the query once and resolves labels once
+        for every position.  Each binding is dispatched back to its spec by
+        ``?pos``.  Someone who held more than one of the positions becomes a
+        single Politician carrying all of their roles and tags.  *limit*
+        is per position, as for :meth:`fetch_politicians_by_positions`.
+
+        A deputy, senator or president position that returns nothing falls
+        back to its own fetcher (alternate QIDs, then occupation or
+        description matching); any other empty position is only logged.
+        """
+        specs = {
+            qid: PositionSpec(*spec) for qid, spec in (mapping or POLITICAL_POSITIONS).items()
+        }
+        values = [
+            f"(wd:{qid} {self._since_literal(spec.since_year)})" for qid, spec in specs.items()
+        ]
+        body = f"""?person p:P39 ?stmt .
+          ?stmt ps:P39 ?pos .
+          OPTIONAL {{ ?stmt pq:P580 ?startDate }}
+          OPTIONAL {{ ?stmt pq:P582 ?endDate }}
+          FILTER(!BOUND(?since) || !BOUND(?startDate) || ?startDate >= ?since)
+          OPTIONAL {{ ?person wdt:P569 ?birthDate }}
+          {_BIRTH_PLACE}
+          {_PARTY}
+          OPTIONAL {{
+            ?person schema:description ?description
+            FILTER(LANG(?description) = "pt")
+          }}
+          {_PERSON_LABEL}"""
+        where = _per_position("(?pos ?since)", values, body, limit)
+        sparql = f"""
+        SELECT DISTINCT {_POSITION_VARS}
+        WHERE {{
+          {where}
+        }}
+        ORDER BY ?personLabel
+        """
+        bindings = self._query(sparql)
+        politicians: list[Politician] = []
+        found: set[str] = set()
+
+        for wid, group in self._group_by_person(bindings).items():
+            by_spec: dict[PositionSpec, list[dict]] = {}
+            for b in group:
+                spec = specs.get(_wid(_val(b, "pos") or "") or "")
+                if spec is not None:
+                    by_spec.setdefault(spec, []).append(b)
+            if not by_spec:
+                continue
+            roles: list[PoliticianRole] = []
+            tags: list[str] = []
+            for spec, rows in by_spec.items():
+                found.add(spec.institution)
+                roles += self._term_roles(rows, spec.role_name, spec.institution)
+                tags += [t for t in spec.tags if t not in tags]
+            politicians.append(self._person_from_group(wid, group, roles, tags))
+
+        by_limit = {"limit": limit} if limit else {}
+        fallbacks: dict[str, Callable[[PositionSpec], list[Politician]]] = {
+            "Q21609546": lambda spec: self.fetch_federal_deputies(
+                since_year=spec.since_year, **by_limit
+            ),
+            "Q18611017": lambda spec: self.fetch_senators(since_year=spec.since_year, **by_limit),
+            "Q35137": lambda spec: self.fetch_presidents(),
+        }
+        by_id = {p.id: p for p in politicians}
+        for qid, spec in specs.items():
+            if spec.institution in found:
+                continue
+            logger.info("%s: batched position query returned 0 rows", spec.role_name)
+            fallback = fallbacks.get(qid)
+            if fallback is None:
+                continue
+            for p in fallback(spec):
+                merged = by_id.get(p.id)
+                if merged is None:
+                    by_id[p.id] = p
+                    politicians.append(p)
+                else:
+                    merged.roles += p.roles
+                    merged.tags += [t for t in p.tags if t not in merged.tags]
+        return politicians
+
+    @staticmethod
+    def _since_literal(since_year: Optional[int]) -> str:
+        """SPARQL term for a VALUES start-date bound (UNDEF = no bound)."""
+        return f'"{since_year}-01-01"^^xsd:dateTime' if since_year else "UNDEF"
+
     def _fetch_by_position_label(
         self,
         label_regex: str,
@@ -373,54 +749,24 @@ class WikidataClient:
           OPTIONAL {{ ?stmt pq:P582 ?endDate }}
           {date_filter}
           OPTIONAL {{ ?person wdt:P569 ?birthDate }}
-          OPTIONAL {{ ?person wdt:P19 ?birthPlace }}
-          OPTIONAL {{ ?person wdt:P102 ?party }}
+          {_BIRTH_PLACE}
+          {_PARTY}
           OPTIONAL {{
             ?person schema:description ?description
             FILTER(LANG(?description) = "pt")
           }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "pt,en" }}
+          {_PERSON_LABEL}
         }}
         ORDER BY ?personLabel
         LIMIT {limit}
         """
         bindings = self._query(sparql)
-        politicians: dict[str, Politician] = {}
-
-        for b in bindings:
-            wid = self._wid(self._val(b, "person") or "")
-            if not wid:
-                continue
-            name = self._val(b, "personLabel") or ""
-            if self._is_qid(name):
-                continue
-            if wid not in politicians:
-                politicians[wid] = Politician(
-                    wikidata_id=wid,
-                    name=name,
-                    birth_date=self._date(self._val(b, "birthDate")),
-                    birth_place=self._val(b, "birthPlaceLabel"),
-                    party=self._val(b, "partyLabel"),
-                    roles=[],
-                    tags=list(tags),
-                    sources=[f"https://www.wikidata.org/wiki/{wid}"],
-                    summary=self._val(b, "description"),
-                )
-            start = self._date(self._val(b, "startDate"))
-            end = self._date(self._val(b, "endDate"))
-            existing = {(r.start_date, r.institution) for r in politicians[wid].roles}
-            if (start, institution) not in existing:
-                politicians[wid].roles.append(
-                    PoliticianRole(
-                        role=role_name,
-                        institution=institution,
-                        start_date=start,
-                        end_date=end,
-                    )
-                )
-
-        time.sleep(_SLEEP)
-        return list(politicians.values())
+        return [
+            self._person_from_group(
+                wid, group, self._term_roles(group, role_name, institution), tags
+            )
+            for wid, group in self._group_by_person(bindings).items()
+        ]
 
     def fetch_governors(self, limit: int = 300, since_year: Optional[int] = None) -> list[Politician]:
         """
@@ -475,13 +821,13 @@ class WikidataClient:
           OPTIONAL {{ ?stmt pq:P580 ?startDate }}
           OPTIONAL {{ ?stmt pq:P582 ?endDate }}
           OPTIONAL {{ ?person wdt:P569 ?birthDate }}
-          OPTIONAL {{ ?person wdt:P19 ?birthPlace }}
-          OPTIONAL {{ ?person wdt:P102 ?party }}
+          {_BIRTH_PLACE}
+          {_PARTY}
           OPTIONAL {{
             ?person schema:description ?description
             FILTER(LANG(?description) = "pt")
           }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "pt,en" }}
+          {_PERSON_LABEL}
         }}
         ORDER BY ?personLabel
         LIMIT {limit}
@@ -489,40 +835,12 @@ class WikidataClient:
         bindings = self._query(sparql)
         institution = "governo-federal"
         tags = ["ministro", "executivo", "governo-federal"]
-        politicians: dict[str, "Politician"] = {}
-        for b in bindings:
-            wid = self._wid(self._val(b, "person") or "")
-            if not wid:
-                continue
-            name = self._val(b, "personLabel") or ""
-            if self._is_qid(name):
-                continue
-            if wid not in politicians:
-                politicians[wid] = Politician(
-                    wikidata_id=wid,
-                    name=name,
-                    birth_date=self._date(self._val(b, "birthDate")),
-                    birth_place=self._val(b, "birthPlaceLabel"),
-                    party=self._val(b, "partyLabel"),
-                    roles=[],
-                    tags=list(tags),
-                    sources=[f"https://www.wikidata.org/wiki/{wid}"],
-                    summary=self._val(b, "description"),
-                )
-            start = self._date(self._val(b, "startDate"))
-            end = self._date(self._val(b, "endDate"))
-            existing = {(r.start_date, r.institution) for r in politicians[wid].roles}
-            if (start, institution) not in existing:
-                politicians[wid].roles.append(
-                    PoliticianRole(
-                        role="Ministro de Estado",
-                        institution=institution,
-                        start_date=start,
-                        end_date=end,
-                    )
-                )
-        time.sleep(_SLEEP)
-        return list(politicians.values())
+        return [
+            self._person_from_group(
+                wid, group, self._term_roles(group, "Ministro de Estado", institution), tags
+            )
+            for wid, group in self._group_by_person(bindings).items()
+        ]
 
     def fetch_tcu_ministers(self, limit: int = 200) -> list[Politician]:
         """
@@ -558,45 +876,24 @@ class WikidataClient:
                   wdt:P106 wd:Q82955 .
           {extra_filter}
           OPTIONAL {{ ?person wdt:P569 ?birthDate }}
-          OPTIONAL {{ ?person wdt:P19 ?birthPlace }}
-          OPTIONAL {{ ?person wdt:P102 ?party }}
+          {_BIRTH_PLACE}
+          {_PARTY}
           OPTIONAL {{
             ?person schema:description ?description
             FILTER(LANG(?description) = "pt")
           }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "pt,en" }}
+          {_PERSON_LABEL}
         }}
         ORDER BY ?personLabel
         LIMIT {limit}
         """
         bindings = self._query(sparql)
-        politicians: dict[str, Politician] = {}
-        for b in bindings:
-            wid = self._wid(self._val(b, "person") or "")
-            if not wid:
-                continue
-            name_label = self._val(b, "personLabel") or ""
-            if self._is_qid(name_label):
-                continue
-            if wid not in politicians:
-                politicians[wid] = Politician(
-                    wikidata_id=wid,
-                    name=name_label,
-                    birth_date=self._date(self._val(b, "birthDate")),
-                    birth_place=self._val(b, "birthPlaceLabel"),
-                    party=self._val(b, "partyLabel"),
-                    roles=[
-                        PoliticianRole(
-                            role=role_name,
-                            institution=institution,
-                        )
-                    ],
-                    tags=list(tags or []),
-                    sources=[f"https://www.wikidata.org/wiki/{wid}"],
-                    summary=self._val(b, "description"),
-                )
-        time.sleep(_SLEEP)
-        return list(politicians.values())
+        return [
+            self._person_from_group(
+                wid, group, [PoliticianRole(role=role_name, institution=institution)], tags or []
+            )
+            for wid, group in self._group_by_person(bindings).items()
+        ]
 
     def _fetch_by_description_filter(
         self,
@@ -618,35 +915,19 @@ class WikidataClient:
           ?person schema:description ?description .
           FILTER(LANG(?description) = "pt" && REGEX(?description, "{filter_regex}", "i"))
           OPTIONAL {{ ?person wdt:P569 ?birthDate }}
-          OPTIONAL {{ ?person wdt:P19 ?birthPlace }}
-          OPTIONAL {{ ?person wdt:P102 ?party }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "pt,en" }}
+          {_BIRTH_PLACE}
+          {_PARTY}
+          {_PERSON_LABEL}
         }}
         LIMIT {limit}
         """
         bindings = self._query(sparql)
-        politicians: dict[str, Politician] = {}
-        for b in bindings:
-            wid = self._wid(self._val(b, "person") or "")
-            if not wid:
-                continue
-            name = self._val(b, "personLabel") or ""
-            if self._is_qid(name):
-                continue
-            if wid not in politicians:
-                politicians[wid] = Politician(
-                    wikidata_id=wid,
-                    name=name,
-                    birth_date=self._date(self._val(b, "birthDate")),
-                    birth_place=self._val(b, "birthPlaceLabel"),
-                    party=self._val(b, "partyLabel"),
-                    roles=[PoliticianRole(role=role_name, institution=institution)],
-                    tags=list(tags),
-                    sources=[f"https://www.wikidata.org/wiki/{wid}"],
-                    summary=self._val(b, "description"),
-                )
-        time.sleep(_SLEEP)
-        return list(politicians.values())
+        return [
+            self._person_from_group(
+                wid, group, [PoliticianRole(role=role_name, institution=institution)], tags
+            )
+            for wid, group in self._group_by_person(bindings).items()
+        ]
 
     def fetch_politicians_broad(self, limit: int = 2000) -> list[Politician]:
         """
@@ -678,13 +959,13 @@ class WikidataClient:
           ?person wdt:P31 wd:Q5 ;
                   wdt:P27 wd:Q155 .
           OPTIONAL {{ ?person wdt:P569 ?birthDate }}
-          OPTIONAL {{ ?person wdt:P19 ?birthPlace }}
-          OPTIONAL {{ ?person wdt:P102 ?party }}
+          {_BIRTH_PLACE}
+          {_PARTY}
           OPTIONAL {{
             ?person schema:description ?description
             FILTER(LANG(?description) = "pt")
           }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "pt,en" }}
+          {_PERSON_LABEL}
           FILTER(CONTAINS(LCASE(STR(?personLabel)), LCASE("{safe_name}")))
         }}
         LIMIT {limit}
@@ -692,44 +973,34 @@ class WikidataClient:
         bindings = self._query(sparql)
         politicians = []
         for b in bindings:
-            wid = self._wid(self._val(b, "person") or "")
+            wid = _wid(_val(b, "person") or "")
             if not wid:
                 continue
-            name_label = self._val(b, "personLabel") or ""
-            if self._is_qid(name_label):
+            name_label = _val(b, "personLabel") or ""
+            if _is_unlabelled(name_label):
                 continue
-            birth = self._val(b, "birthDate")
+            birth = _val(b, "birthDate")
             politicians.append(
                 Politician(
                     wikidata_id=wid,
                     name=name_label,
-                    birth_date=self._date(birth),
-                    birth_place=self._val(b, "birthPlaceLabel"),
-                    party=self._val(b, "partyLabel"),
+                    birth_date=_date(birth),
+                    birth_place=_val(b, "birthPlaceLabel"),
+                    party=_val(b, "partyLabel"),
                     sources=[f"https://www.wikidata.org/wiki/{wid}"],
-                    summary=self._val(b, "description"),
+                    summary=_val(b, "description"),
                 )
             )
-        time.sleep(_SLEEP)
         return politicians
 
-    # ------------------------------------------------------------------
-    # Historical events
-    # ------------------------------------------------------------------
-
     # ------------------------------------------------------------------
     # Historical events — sub-query helpers
     # ------------------------------------------------------------------
 
-    def _event_query(
-        self,
-        type_values: str,
-        seen: set[str],
-        event_type: str = "event",
-        limit: int = 2000,
-    ) -> list[HistoricalEvent]:
-        """Run one SPARQL event sub-query and return deduplicated HistoricalEvent objects."""
-        sparql = f"""
+    @staticmethod
+    def _event_sparql(type_values: str, limit: int = 2000) -> str:
+        """SPARQL for Brazilian events whose P31 is one of *type_values*."""
+        return f"""
         SELECT DISTINCT ?event ?eventLabel ?date ?endDate ?description
         WHERE {{
           ?event wdt:P17 wd:Q155 .
@@ -741,35 +1012,50 @@ class WikidataClient:
             ?event schema:description ?description
             FILTER(LANG(?description) = "pt")
           }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "pt,en" }}
+          {_EVENT_LABEL}
         }}
         ORDER BY DESC(?date)
         LIMIT {limit}
         """
-        bindings = self._query(sparql)
+
+    @staticmethod
+    def _events_from_bindings(
+        bindings: list[dict], seen: set[str], event_type: str
+    ) -> list[HistoricalEvent]:
+        """Build HistoricalEvent objects, skipping events already in *seen*."""
         results: list[HistoricalEvent] = []
         for b in bindings:
-            wid = self._wid(self._val(b, "event") or "")
+            wid = _wid(_val(b, "event") or "")
             if not wid or wid in seen:
                 continue
             seen.add(wid)
-            title = self._val(b, "eventLabel") or ""
-            if self._is_qid(title):
+            title = _val(b, "eventLabel") or ""
+            if _is_unlabelled(title):
                 continue
             results.append(
                 HistoricalEvent(
                     wikidata_id=wid,
                     title=title,
-                    date=self._date(self._val(b, "date")),
-                    end_date=self._date(self._val(b, "endDate")),
+                    date=_date(_val(b, "date")),
+                    end_date=_date(_val(b, "endDate")),
                     type=event_type,
-                    summary=self._val(b, "description") or "",
+                    summary=_val(b, "description") or "",
                     sources=[f"https://www.wikidata.org/wiki/{wid}"],
                 )
             )
-        time.sleep(_SLEEP)
         return results
 
+    def _event_query(
+        self,
+        type_values: str,
+        seen: set[str],
+        event_type: str = "event",
+        limit: int = 2000,
+    ) -> list[HistoricalEvent]:
+        """Run one SPARQL event sub-query and return deduplicated HistoricalEvent objects."""
+        bindings = self._query(self._event_sparql(type_values, limit))
+        return self._events_from_bindings(bindings, seen, event_type)
+
     def fetch_political_events(self, limit: int = 2000) -> list[HistoricalEvent]:
         """
         Fetch major Brazilian political events from Wikidata.
@@ -780,41 +1066,22 @@ class WikidataClient:
           3. Social movements, protests, strikes
           4. Legislation, referendums, constitutional amendments
 
+        The sub-queries run concurrently (within the client's slot limit);
+        results are merged in the order above, so an event matching several
+        groups keeps the type of the first.
+
         No API key required. Default limit applies per sub-query.
         """
-        seen: set[str] = set()
-        all_events: list[HistoricalEvent] = []
-
         sub_limit = min(limit, 2000)
+        sparqls = [self._event_sparql(values, sub_limit) for _, values in _EVENT_GROUPS]
+        with ThreadPoolExecutor(max_workers=len(sparqls)) as pool:
+            batches = list(pool.map(self._query, sparqls))
 
-        # 1 — Scandals, crises, police operations, investigations
-        all_events += self._event_query(
-            "wd:Q2334719 wd:Q3307126 wd:Q1358461 wd:Q2101636 wd:Q16943273 wd:Q162875",
-            seen, event_type="scandal", limit=sub_limit,
-        )
-        logger.info("Events after scandals/crises: %d", len(all_events))
-
-        # 2 — Elections (all types)
-        all_events += self._event_query(
-            "wd:Q40231 wd:Q189760 wd:Q15275719 wd:Q1076105 wd:Q3544124",
-            seen, event_type="election", limit=sub_limit,
-        )
-        logger.info("Events after elections: %d", len(all_events))
-
-        # 3 — Social movements, protests, strikes
-        all_events += self._event_query(
-            "wd:Q1371582 wd:Q49773 wd:Q273120 wd:Q114953 wd:Q175331 wd:Q2726259",
-            seen, event_type="movement", limit=sub_limit,
-        )
-        logger.info("Events after movements/protests: %d", len(all_events))
-
-        # 4 — Legislation, constitutional events, coups
-        all_events += self._event_query(
-            "wd:Q3387717 wd:Q93288 wd:Q131569 wd:Q7283 wd:Q180684",
-            seen, event_type="legislation", limit=sub_limit,
-        )
-        logger.info("Events after legislation/other: %d", len(all_events))
-
+        seen: set[str] = set()
+        all_events: list[HistoricalEvent] = []
+        for (event_type, _), bindings in zip(_EVENT_GROUPS, batches):
+            all_events += self._events_from_bindings(bindings, seen, event_type)
+            logger.info("Events after %s sub-query: %d", event_type, len(all_events))
         return all_events
 
     # ------------------------------------------------------------------
@@ -823,16 +1090,16 @@ class WikidataClient:
 
     def fetch_legislatures(self) -> list[Legislature]:
         """Fetch Brazilian legislative term metadata from Wikidata."""
-        sparql = """
+        sparql = f"""
         SELECT ?item ?itemLabel ?startDate ?endDate ?ordinal
-        WHERE {
+        WHERE {{
           ?item wdt:P31 wd:Q15238777 ;
                 wdt:P17 wd:Q155 .
-          OPTIONAL { ?item wdt:P580 ?startDate }
-          OPTIONAL { ?item wdt:P582 ?endDate }
-          OPTIONAL { ?item wdt:P1545 ?ordinal }
-          SERVICE wikibase:label { bd:serviceParam wikibase:language "pt,en" }
-        }
+          OPTIONAL {{ ?item wdt:P580 ?startDate }}
+          OPTIONAL {{ ?item wdt:P582 ?endDate }}
+          OPTIONAL {{ ?item wdt:P1545 ?ordinal }}
+          {_label_clause("item")}
+        }}
         ORDER BY ?startDate
         """
         bindings = self._query(sparql)
@@ -841,15 +1108,15 @@ class WikidataClient:
         counter = 1
 
         for b in bindings:
-            wid = self._wid(self._val(b, "item") or "")
+            wid = _wid(_val(b, "item") or "")
             if not wid or wid in seen:
                 continue
             seen.add(wid)
-            start_raw = self._val(b, "startDate")
+            start_raw = _val(b, "startDate")
             if not start_raw:
                 continue
-            end_raw = self._val(b, "endDate")
-            ordinal_raw = self._val(b, "ordinal")
+            end_raw = _val(b, "endDate")
+            ordinal_raw = _val(b, "ordinal")
             try:
                 leg_id = int(ordinal_raw) if ordinal_raw and ordinal_raw.isdigit() else counter
                 legislatures.append(
@@ -857,16 +1124,46 @@ class WikidataClient:
                         id=leg_id,
                         start_date=start_raw[:10],
                         end_date=end_raw[:10] if end_raw else None,
-                        description=self._val(b, "itemLabel") or f"Legislatura {leg_id}",
+                        description=_val(b, "itemLabel") or f"Legislatura {leg_id}",
                     )
                 )
                 counter += 1
             except Exception as exc:
                 logger.debug("Skipping legislature record: %s", exc)
-
-        time.sleep(_SLEEP)
         return legislatures
 
+    # ------------------------------------------------------------------
+    # Concurrent fetch
+    # ------------------------------------------------------------------
+
+    def fetch_all(self, limit: int = 500) -> dict[str, list]:
+        """
+        Run the independent top-level fetchers concurrently.
+
+        Returns a dict keyed ``stf``, ``positions`` (see
+        :meth:`fetch_all_political_positions`), ``governors``, ``events`` and
+        ``legislatures``.  The queries share the client's connection and slot
+        limit, so total wall time approaches that of the slowest query.
+        A fetcher that fails is logged and its key is left out.
+        """
+        jobs: dict[str, Callable[[], list]] = {
+            "stf": self.fetch_stf_ministers,
+            "positions": lambda: self.fetch_all_political_positions(limit=limit),
+            "governors": lambda: self.fetch_governors(limit=limit),
+            "events": lambda: self.fetch_political_events(limit=limit),
+            "legislatures": self.fetch_legislatures,
+        }
+        with ThreadPoolExecutor(max_workers=_MAX_IN_FLIGHT) as pool:
+            futures = {key: pool.submit(fn) for key, fn in jobs.items()}
+
+        results: dict[str, list] = {}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as exc:
+                logger.warning("Wikidata %s fetch failed: %s", key, exc)
+        return results
+
     # ------------------------------------------------------------------
     # Context manager
     # ------------------------------------------------------------------
@@ -6,6 +6,7 @@ HTTP requests are mocked; no live downloads.
 from __future__ import annotations
 
 import csv
+import functools
 import io
 import zipfile
 from unittest.mock import MagicMock, patch
@@ -35,6 +36,15 @@ def _make_csv_zip(rows: list[dict], filename: str = "data.csv") -> bytes:
     return zip_buf.getvalue()
 
 
+def _streaming_client(payload: bytes) -> MagicMock:
+    """Mock httpx.Client whose stream() yields *payload* in two chunks."""
+    response = MagicMock()
+    response.iter_bytes.return_value = [payload[:10], payload[10:]]
+    http = MagicMock()
+    http.stream.return_value.__enter__.return_value = response
+    return http
+
+
 def _candidate_row(
     name: str = "CANDIDATO TESTE",
     party: str = "PT",
@@ -98,7 +108,7 @@ class TestIterCsvRows:
         rows = [_candidate_row("Alice"), _candidate_row("Bob", party="PL")]
         zip_bytes = _make_csv_zip(rows)
         client = TSEClient()
-        parsed = list(client._iter_csv_rows(zip_bytes))
+        parsed = list(client._iter_csv_rows(io.BytesIO(zip_bytes)))
         assert len(parsed) == 2
         assert parsed[0]["NM_CANDIDATO"] == "Alice"
 
@@ -108,7 +118,7 @@ class TestIterCsvRows:
             pass
         client = TSEClient()
         with pytest.raises(TSEError, match="No CSV"):
-            list(client._iter_csv_rows(empty_zip.getvalue()))
+            list(client._iter_csv_rows(empty_zip))
 
 
 # ---------------------------------------------------------------------------
@@ -118,9 +128,9 @@ class TestIterCsvRows:
 
 class TestFetchCandidates:
     def _client_with_zip(self, rows: list[dict]) -> TSEClient:
-        """Create a TSEClient whose _download method returns a fake ZIP."""
+        """Create a TSEClient whose HTTP client streams a fake ZIP."""
         client = TSEClient()
-        client._download = MagicMock(return_value=_make_csv_zip(rows))
+        client._client = _streaming_client(_make_csv_zip(rows))
         return client
 
     def test_basic_fetch(self) -> None:
@@ -155,6 +165,17 @@ class TestFetchCandidates:
         assert len(results) == 1
         assert results[0].position == "DEPUTADO FEDERAL"
 
+    def test_position_filter_is_substring_and_case_insensitive(self) -> None:
+        rows = [
+            _candidate_row("DEP FED 1", cargo="DEPUTADO FEDERAL"),
+            _candidate_row("SENADOR", cargo="SENADOR"),
+            _candidate_row("DEP FED 2", cargo="Deputado Federal"),
+            _candidate_row("DEP EST", cargo="DEPUTADO ESTADUAL"),
+        ]
+        client = self._client_with_zip(rows)
+        results = client.fetch_candidates(2022, position="deputado")
+        assert [r.candidate_name for r in results] == ["DEP FED 1", "DEP FED 2", "DEP EST"]
+
     def test_limit_respected(self) -> None:
         rows = [_candidate_row(f"PESSOA {i}") for i in range(10)]
         client = self._client_with_zip(rows)
@@ -186,6 +207,38 @@ class TestFetchCandidates:
         assert len(elected) == 2
         assert len(not_elected) == 1
 
+    def test_older_column_names_and_fallbacks(self) -> None:
+        rows = [
+            {"UF_CANDIDATO": "MG", "NM_CARGO": "SENADOR", "NM_CANDIDATO": "",
+             "NM_URNA_CANDIDATO": "URNA NAME", "NM_PARTIDO": "PARTIDO X",
+             "CD_SIT_TOT_TURNO": "ELEITO"},
+        ]
+        client = self._client_with_zip(rows)
+        [result] = client.fetch_candidates(2002)
+        assert (result.state, result.position) == ("MG", "SENADOR")
+        assert (result.candidate_name, result.party) == ("URNA NAME", "PARTIDO X")
+        assert result.elected is True
+        assert result.candidate_number is None
+        assert result.tse_seq_candidate is None
+
+    def test_extra_cells_do_not_fill_missing_columns(self) -> None:
+        # Header lacks NR_CANDIDATO and friends; the row carries one cell more
+        # than the header (trailing ";"), which must not leak into them.
+        csv_bytes = (
+            "NM_CANDIDATO;SG_PARTIDO;SG_UF;DS_CARGO;DS_SIT_TOT_TURNO\r\n"
+            "PESSOA;PT;SP;DEPUTADO FEDERAL;ELEITO;EXTRA\r\n"
+        ).encode("latin-1")
+        zip_buf = io.BytesIO()
+        with zipfile.ZipFile(zip_buf, "w") as zf:
+            zf.writestr("data.csv", csv_bytes)
+        client = TSEClient()
+        client._client = _streaming_client(zip_buf.getvalue())
+
+        [result] = client.fetch_candidates(2022)
+        assert (result.candidate_name, result.party, result.state) == ("PESSOA", "PT", "SP")
+        assert result.candidate_number is None
+        assert result.tse_seq_candidate is None
+
     def test_result_id_stable(self) -> None:
         """Same candidate data across two fetches → same ID."""
         rows = [_candidate_row("STABLE PERSON", party="PT", uf="SP")]
@@ -199,7 +252,241 @@ class TestFetchCandidates:
 
         client = TSEClient()
         client._client = MagicMock()
-        client._client.get.side_effect = httpx.ConnectError("Connection refused")
+        client._client.stream.side_effect = httpx.ConnectError("Connection refused")
 
         with pytest.raises(TSEError, match="Download failed"):
             client.fetch_candidates(2022)
+
+
+# ---------------------------------------------------------------------------
+# Download to disk
+# ---------------------------------------------------------------------------
+
+
+class TestDownloadToPath:
+    def test_cache_dir_receives_file_and_is_reused(self, tmp_path) -> None:
+        payload = _make_csv_zip([_candidate_row("CACHED")])
+        client = TSEClient(cache_dir=tmp_path)
+        client._client = _streaming_client(payload)
+
+        assert client.fetch_candidates(2022)[0].candidate_name == "CACHED"
+        assert (tmp_path / "tse_cand_2022.zip").read_bytes() == payload
+        assert client.fetch_candidates(2022)[0].candidate_name == "CACHED"
+        assert client._client.stream.call_count == 1
+
+    def test_failed_download_leaves_no_partial_file(self, tmp_path) -> None:
+        import httpx
+
+        client = TSEClient(cache_dir=tmp_path)
+        client._client = _streaming_client(b"")
+        response = client._client.stream.return_value.__enter__.return_value
+        response.iter_bytes.side_effect = httpx.ReadError("reset")
+
+        with pytest.raises(TSEError):
+            client.fetch_candidates(2022)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestOpenZipReuse:
+    def test_cached_archive_opened_once_across_fetches(self, tmp_path) -> None:
+        rows = [_candidate_row("PESSOA SP", uf="SP"), _candidate_row("PESSOA RJ", uf="RJ")]
+        (tmp_path / "tse_cand_2018.zip").write_bytes(_make_csv_zip(rows))
+        client = TSEClient(cache_dir=tmp_path)
+
+        with patch("src.sources.tse.zipfile.ZipFile", wraps=zipfile.ZipFile) as opened:
+            sp = client.fetch_candidates(2018, state="SP")
+            rj = client.fetch_candidates(2018, state="RJ")
+
+        assert [r.candidate_name for r in sp + rj] == ["PESSOA SP", "PESSOA RJ"]
+        assert opened.call_count == 1
+
+    def test_replaced_archive_is_reopened(self, tmp_path) -> None:
+        import os
+
+        path = tmp_path / "tse_cand_2014.zip"
+        path.write_bytes(_make_csv_zip([_candidate_row("ANTES")]))
+        client = TSEClient(cache_dir=tmp_path)
+        assert client.fetch_candidates(2014)[0].candidate_name == "ANTES"
+
+        path.write_bytes(_make_csv_zip([_candidate_row("DEPOIS DA TROCA")]))
+        os.utime(path, ns=(1, 1))
+        assert client.fetch_candidates(2014)[0].candidate_name == "DEPOIS DA TROCA"
+
+
+class TestFastInflate:
+    @staticmethod
+    def _deflated_zip(rows: list[dict]) -> bytes:
+        stored = zipfile.ZipFile(io.BytesIO(_make_csv_zip(rows)))
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("data.csv", stored.read("data.csv"))
+        return buf.getvalue()
+
+    def test_deflated_member_uses_fast_zlib_when_available(self, tmp_path) -> None:
+        import zlib
+
+        fast = MagicMock(wraps=zlib)
+        (tmp_path / "tse_cand_2010.zip").write_bytes(
+            self._deflated_zip([_candidate_row(f"PESSOA {i}") for i in range(50)])
+        )
+        with patch("src.sources.tse._fast_zlib", fast):
+            results = TSEClient(cache_dir=tmp_path).fetch_candidates(2010)
+
+        assert len(results) == 50
+        fast.decompressobj.assert_called_once_with(-15)
+
+    def test_fast_path_reads_spooled_archive_and_checks_crc(self) -> None:
+        import zlib
+
+        from src.sources.tse import _open_member
+
+        payload = self._deflated_zip([_candidate_row(f"PESSOA {i}") for i in range(50)])
+        archive = io.BytesIO(payload)
+        with zipfile.ZipFile(archive) as zf, patch("src.sources.tse._fast_zlib", zlib):
+            expected = zf.read("data.csv")
+            with _open_member(zf, "data.csv", archive) as raw:
+                assert raw.read() == expected
+
+            zf.getinfo("data.csv").CRC ^= 1
+            with _open_member(zf, "data.csv", archive) as raw:
+                with pytest.raises(TSEError, match="CRC"):
+                    raw.read()
+
+    def test_stored_member_keeps_stdlib_reader(self, tmp_path) -> None:
+        fast = MagicMock()
+        (tmp_path / "tse_cand_2006.zip").write_bytes(_make_csv_zip([_candidate_row()]))
+        with patch("src.sources.tse._fast_zlib", fast):
+            results = TSEClient(cache_dir=tmp_path).fetch_candidates(2006)
+
+        assert len(results) == 1
+        fast.decompressobj.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Ranged download
+# ---------------------------------------------------------------------------
+
+
+class _RangeServer:
+    """httpx MockTransport handler serving *payload* with byte-range support."""
+
+    def __init__(self, payload: bytes, etag: str = '"v1"', honour_ranges: bool = True):
+        self.payload = payload
+        self.etag = etag
+        self.honour_ranges = honour_ranges
+        self.ranges: list[str] = []
+
+    def __call__(self, request):
+        import httpx
+
+        headers = {"accept-ranges": "bytes", "etag": self.etag}
+        if request.method == "HEAD":
+            headers["content-length"] = str(len(self.payload))
+            return httpx.Response(200, headers=headers)
+        spec = request.headers.get("range")
+        if spec and self.honour_ranges and request.headers.get("if-range") == self.etag:
+            self.ranges.append(spec)
+            start, end = map(int, spec.removeprefix("bytes=").split("-"))
+            return httpx.Response(206, headers=headers, content=self.payload[start : end + 1])
+        return httpx.Response(200, headers=headers, content=self.payload)
+
+
+def _ranged_client(server: _RangeServer, tmp_path) -> TSEClient:
+    import httpx
+
+    client = TSEClient(cache_dir=tmp_path)
+    client._client = httpx.Client(transport=httpx.MockTransport(server))
+    return client
+
+
+class TestRangedDownload:
+    @patch("src.sources.tse._RANGE_PART", 64)
+    def test_parts_are_reassembled_in_order(self, tmp_path) -> None:
+        import httpx
+
+        payload = _make_csv_zip([_candidate_row(f"PESSOA {i}") for i in range(20)])
+        server = _RangeServer(payload)
+        client = _ranged_client(server, tmp_path)
+        async_client = functools.partial(
+            httpx.AsyncClient, transport=httpx.MockTransport(server)
+        )
+
+        with patch("src.sources.tse.httpx.AsyncClient", async_client):
+            results = client.fetch_candidates(2022)
+
+        assert len(results) == 20
+        assert (tmp_path / "tse_cand_2022.zip").read_bytes() == payload
+        assert len(server.ranges) == len(payload) // 64
+
+    @patch("src.sources.tse._RANGE_PART", 64)
+    def test_falls_back_to_single_get_when_ranges_ignored(self, tmp_path) -> None:
+        import httpx
+
+        payload = _make_csv_zip([_candidate_row("FULL BODY")])
+        server = _RangeServer(payload, honour_ranges=False)
+        client = _ranged_client(server, tmp_path)
+        async_client = functools.partial(
+            httpx.AsyncClient, transport=httpx.MockTransport(server)
+        )
+
+        with patch("src.sources.tse.httpx.AsyncClient", async_client):
+            results = client.fetch_candidates(2022)
+
+        assert results[0].candidate_name == "FULL BODY"
+        assert (tmp_path / "tse_cand_2022.zip").read_bytes() == payload
+
+    @patch("src.sources.tse._RANGE_PART", 64)
+    async def test_running_event_loop_uses_single_get(self, tmp_path) -> None:
+        payload = _make_csv_zip([_candidate_row(f"PESSOA {i}") for i in range(20)])
+        server = _RangeServer(payload)
+        client = _ranged_client(server, tmp_path)
+
+        assert len(client.fetch_candidates(2022)) == 20
+        assert server.ranges == []
+
+    def test_small_files_use_single_get(self, tmp_path) -> None:
+        payload = _make_csv_zip([_candidate_row("SMALL")])
+        server = _RangeServer(payload)
+        client = _ranged_client(server, tmp_path)
+
+        assert client.fetch_candidates(2022)[0].candidate_name == "SMALL"
+        assert server.ranges == []
+
+    def test_refused_range_cancels_other_parts(self, tmp_path) -> None:
+        import asyncio
+
+        import httpx
+
+        from src.sources.tse import _RangeNotHonouredError
+
+        cancelled: list[str] = []
+
+        async def handler(request):
+            spec = request.headers["range"]
+            if spec.startswith("bytes=0-"):
+                return httpx.Response(200, content=b"whole file")
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(spec)
+                raise
+            return httpx.Response(206, content=b"")
+
+        async def download() -> set:
+            with pytest.raises(_RangeNotHonouredError):
+                await TSEClient()._download_ranges(
+                    "https://cdn.example/f.zip", io.BytesIO(), 256, '"v1"'
+                )
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+        async_client = functools.partial(
+            httpx.AsyncClient, transport=httpx.MockTransport(handler)
+        )
+        with (
+            patch("src.sources.tse._RANGE_PART", 64),
+            patch("src.sources.tse.httpx.AsyncClient", async_client),
+        ):
+            leftover = asyncio.run(download())
+
+        assert leftover == set()
+        assert len(cancelled) == 3
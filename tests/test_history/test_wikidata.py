@@ -6,6 +6,7 @@ All HTTP requests are mocked; no live network calls.
 from __future__ import annotations
 
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -38,20 +39,34 @@ def _event_binding(event_uri: str, label: str, **extra) -> dict:
     return b
 
 
+def _pos(qid: str) -> dict:
+    return {"type": "uri", "value": f"http://www.wikidata.org/entity/{qid}"}
+
+
 def _sparql_response(bindings: list[dict]) -> dict:
     return {"results": {"bindings": bindings}}
 
 
+def _sparql_body(bindings: list[dict]) -> bytes:
+    return json.dumps(_sparql_response(bindings)).encode()
+
+
 # ---------------------------------------------------------------------------
 # WikidataClient._query
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _no_rate_limit_sleep():
+    with patch("src.sources.wikidata.time.sleep") as sleep:
+        yield sleep
+
+
 class TestWikidataQuery:
     def test_returns_bindings(self) -> None:
         bindings = [_binding("Q1", "Test Person")]
         mock_resp = MagicMock()
-        mock_resp.json.return_value = _sparql_response(bindings)
+        mock_resp.content = _sparql_body(bindings)
         mock_resp.raise_for_status.return_value = None
 
         client = WikidataClient()
@@ -76,6 +91,154 @@ class TestWikidataQuery:
                 client._query("SELECT * WHERE { }")
 
 
+    def test_takes_a_rate_token_without_trailing_pause(self, _no_rate_limit_sleep) -> None:
+        client = WikidataClient()
+        client._client = MagicMock()
+        client._client.get.return_value.content = _sparql_body([])
+        client._limiter = MagicMock()
+        client._query("SELECT * WHERE { }")
+        client._query("SELECT ?x WHERE { }")
+        assert client._limiter.acquire.call_count == 2
+        _no_rate_limit_sleep.assert_not_called()
+
+    def test_concurrent_queries_are_capped(self) -> None:
+        import threading
+
+        from src.sources import wikidata
+
+        in_flight = peak = 0
+        lock = threading.Lock()
+
+        def slow_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            threading.Event().wait(0.02)  # time.sleep is patched out
+            with lock:
+                in_flight -= 1
+            return MagicMock(content=_sparql_body([]))
+
+        client = WikidataClient()
+        client._client = MagicMock()
+        client._client.get.side_effect = slow_get
+        client._limiter = MagicMock()  # pacing is covered by TestRateLimiter
+        threads = [threading.Thread(target=client._query, args=("q",)) for _ in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert 1 < peak <= wikidata._MAX_IN_FLIGHT
+
+
+class TestRateLimiter:
+    def _limiter(self, clock: list[float], rate: float = 5.0, burst: int = 2):
+        from src.sources.wikidata import _RateLimiter
+
+        with patch("src.sources.wikidata.time.monotonic", lambda: clock[0]):
+            return _RateLimiter(rate, burst)
+
+    def test_burst_passes_then_waits_for_next_token(self, _no_rate_limit_sleep) -> None:
+        clock = [100.0]
+
+        def sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        _no_rate_limit_sleep.side_effect = sleep
+        limiter = self._limiter(clock)
+        with patch("src.sources.wikidata.time.monotonic", lambda: clock[0]):
+            limiter.acquire()
+            limiter.acquire()
+            _no_rate_limit_sleep.assert_not_called()
+            limiter.acquire()
+
+        _no_rate_limit_sleep.assert_called_once()
+        assert _no_rate_limit_sleep.call_args[0][0] == pytest.approx(0.2)
+
+    def test_no_wait_after_a_slow_query(self, _no_rate_limit_sleep) -> None:
+        clock = [100.0]
+        limiter = self._limiter(clock, burst=1)
+        with patch("src.sources.wikidata.time.monotonic", lambda: clock[0]):
+            limiter.acquire()
+            clock[0] += 60.0  # a minute-long query
+            limiter.acquire()
+        _no_rate_limit_sleep.assert_not_called()
+
+
+class TestQueryCache:
+    def _client(self, tmp_path, bindings=None) -> WikidataClient:
+        from src.sources.cache import APICache
+
+        client = WikidataClient(cache=APICache(db_path=tmp_path / "cache.db"))
+        client._client = MagicMock()
+        client._client.get.return_value.content = _sparql_body(bindings or [])
+        return client
+
+    def test_fresh_hit_skips_endpoint_and_rate_limit(self, tmp_path) -> None:
+        client = self._client(tmp_path, [_binding("Q1", "Cached")])
+        client._limiter = MagicMock()
+        first = client._query("SELECT ?x WHERE { }")
+        second = client._query("SELECT ?x WHERE { }")
+
+        assert second == first
+        assert client._client.get.call_count == 1
+        assert client._limiter.acquire.call_count == 1
+
+    def test_different_queries_have_different_keys(self, tmp_path) -> None:
+        client = self._client(tmp_path)
+        client._query("SELECT ?a WHERE { }")
+        client._query("SELECT ?b WHERE { }")
+        assert client._client.get.call_count == 2
+
+    def test_stale_entry_used_when_endpoint_fails(self, tmp_path) -> None:
+        import datetime as dt
+
+        import httpx
+
+        client = self._client(tmp_path, [_binding("Q1", "Old")])
+        sparql = "SELECT ?x WHERE { }"
+        client._query(sparql)
+        entry = client._cache.get(client._cache_key(sparql))
+        entry.fetched_at -= dt.timedelta(days=30)
+        client._client.get.side_effect = httpx.ConnectError("down")
+
+        assert client._query(sparql)[0]["personLabel"]["value"] == "Old"
+
+
+class TestQueryText:
+    """Queries resolve labels with rdfs:label joins, not the label SERVICE."""
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda c: c.fetch_stf_ministers(),
+            lambda c: c.fetch_politicians_by_position("Q1", "r", "i", []),
+            lambda c: c.fetch_all_political_positions(),
+            lambda c: c.fetch_governors(),
+            lambda c: c.fetch_government_ministers(),
+            lambda c: c.fetch_politicians_broad(),
+            lambda c: c.search_person("Lula"),
+            lambda c: c._event_query("wd:Q1", set()),
+            lambda c: c.fetch_legislatures(),
+        ],
+    )
+    def test_no_label_service(self, call) -> None:
+        client = WikidataClient()
+        client._query = MagicMock(return_value=[])
+        call(client)
+        for args, _ in client._query.call_args_list:
+            assert "SERVICE wikibase:label" not in args[0]
+            assert "rdfs:label" in args[0]
+
+    def test_optional_entity_labels_are_nested(self) -> None:
+        client = WikidataClient()
+        client._query = MagicMock(return_value=[])
+        client.fetch_politicians_by_position("Q1", "r", "i", [])
+        sparql = " ".join(client._query.call_args[0][0].split())
+        assert "?person wdt:P19 ?birthPlace . OPTIONAL { ?birthPlace rdfs:label" in sparql
+        assert "?person wdt:P102 ?party . OPTIONAL { ?party rdfs:label" in sparql
+
+
 # ---------------------------------------------------------------------------
 # Helper methods
 # ---------------------------------------------------------------------------
@@ -140,6 +303,16 @@ class TestFetchSTFMinisters:
         assert len(result[0].roles) == 1
         assert result[0].roles[0].institution == "stf"
 
+    def test_undated_duplicate_row_is_dropped(self) -> None:
+        """The truthy wdt:P39 branch adds a qualifier-less row per person."""
+        bindings = [
+            _binding("Q1", "Person A"),
+            _binding("Q1", "Person A", startDate="2010-01-01T00:00:00Z"),
+        ]
+        client = self._make_client(bindings)
+        [person] = client.fetch_stf_ministers()
+        assert [r.start_date for r in person.roles] == ["2010-01-01"]
+
     def test_skips_qid_labels(self) -> None:
         bindings = [_binding("Q99", "Q99")]  # label = QID → skip
         client = self._make_client(bindings)
@@ -147,6 +320,13 @@ class TestFetchSTFMinisters:
             result = client.fetch_stf_ministers()
         assert result == []
 
+    def test_skips_people_without_label(self) -> None:
+        binding = _binding("Q5", "")
+        del binding["personLabel"]
+        client = self._make_client([binding])
+        with patch.object(client, "_fetch_by_description_filter", return_value=[]):
+            assert client.fetch_stf_ministers() == []
+
     def test_multiple_terms_same_person(self) -> None:
         """Two bindings for the same person → one politician with two roles."""
         bindings = [
@@ -160,6 +340,197 @@ class TestFetchSTFMinisters:
         assert len(result[0].roles) == 2
 
 
+class TestFetchPoliticiansByPosition:
+    def test_groups_terms_per_person(self) -> None:
+        bindings = [
+            _binding("Q1", "Pessoa A", startDate="2015-02-01T00:00:00Z", partyLabel="PT"),
+            _binding("Q2", "Pessoa B", startDate="2019-02-01T00:00:00Z"),
+            _binding("Q1", "Pessoa A", startDate="2019-02-01T00:00:00Z", partyLabel="PT"),
+            # Same term repeated (e.g. two parties on the person) → one role
+            _binding("Q1", "Pessoa A", startDate="2019-02-01T00:00:00Z", partyLabel="PSB"),
+        ]
+        for b in bindings:
+            b["pos"] = _pos("Q21609546")
+        client = WikidataClient()
+        client._query = MagicMock(return_value=bindings)
+        result = client.fetch_politicians_by_position(
+            "Q21609546", "Deputado Federal", "camara-deputados", ["câmara"]
+        )
+
+        assert [p.wikidata_id for p in result] == ["Q1", "Q2"]
+        assert result[0].party == "PT"
+        assert [r.start_date for r in result[0].roles] == ["2015-02-01", "2019-02-01"]
+        assert result[0].tags == ["câmara"]
+        assert result[0].tags is not result[1].tags
+
+
+class TestPositionQidFallback:
+    def _client(self, bindings: list[dict]) -> WikidataClient:
+        client = WikidataClient()
+        client._query = MagicMock(return_value=bindings)
+        return client
+
+    def test_alternative_qids_share_one_query(self) -> None:
+        client = self._client([{**_binding("Q1", "Pessoa"), "pos": _pos("Q21609546")}])
+        client.fetch_federal_deputies()
+        client._query.assert_called_once()
+        sparql = client._query.call_args[0][0]
+        for qid in ("Q21609546", "Q23903549", "Q25028988"):
+            assert f"VALUES ?pos {{ wd:{qid} }}" in sparql
+        assert sparql.count("LIMIT 600") == 3
+
+    def test_first_qid_with_results_wins(self) -> None:
+        client = self._client([
+            {**_binding("Q3", "Terceira"), "pos": _pos("Q25028988")},
+            {**_binding("Q2", "Segunda"), "pos": _pos("Q23903549")},
+        ])
+        assert [p.wikidata_id for p in client.fetch_federal_deputies()] == ["Q2"]
+
+    def test_unlabelled_rows_do_not_win(self) -> None:
+        client = self._client([
+            {**_binding("Q1", "Q1"), "pos": _pos("Q35137")},
+            {**_binding("Q9", "Presidente"), "pos": _pos("Q2801132")},
+        ])
+        assert [p.wikidata_id for p in client.fetch_presidents()] == ["Q9"]
+
+
+# ---------------------------------------------------------------------------
+# fetch_all_political_positions
+# ---------------------------------------------------------------------------
+
+
+class TestFetchAllPoliticalPositions:
+    def test_single_query_dispatches_by_position(self) -> None:
+        bindings = [
+            {**_binding("Q1", "Deputada", startDate="2019-02-01T00:00:00Z"), "pos": _pos("Q21609546")},
+            {**_binding("Q2", "Presidente"), "pos": _pos("Q35137")},
+            {**_binding("Q3", "Outro"), "pos": _pos("Q999")},
+        ]
+        client = WikidataClient()
+        client._query = MagicMock(return_value=bindings)
+        client.fetch_senators = MagicMock(return_value=[])
+        with patch("src.sources.wikidata.time.sleep"):
+            result = client.fetch_all_political_positions()
+
+        client._query.assert_called_once()
+        client.fetch_senators.assert_called_once_with(since_year=2019)
+        by_id = {p.wikidata_id: p for p in result}
+        assert set(by_id) == {"Q1", "Q2"}
+        assert by_id["Q1"].roles[0].institution == "camara-deputados"
+        assert by_id["Q1"].roles[0].start_date == "2019-02-01"
+        assert by_id["Q2"].roles[0].role == "Presidente da República"
+
+    def test_since_year_is_per_position(self) -> None:
+        client = WikidataClient()
+        client._query = MagicMock(return_value=[])
+        with patch("src.sources.wikidata.time.sleep"):
+            client.fetch_all_political_positions()
+        sparql = client._query.call_args_list[0][0][0]
+        assert '(wd:Q21609546 "2019-01-01"^^xsd:dateTime)' in sparql
+        assert "(wd:Q35137 UNDEF)" in sparql
+        assert "LIMIT" not in sparql
+
+    def test_limit_is_per_position(self) -> None:
+        client = WikidataClient()
+        client._query = MagicMock(return_value=[{**_binding("Q1", "P"), "pos": _pos("Q35137")}])
+        client.fetch_federal_deputies = MagicMock(return_value=[])
+        client.fetch_senators = MagicMock(return_value=[])
+        with patch("src.sources.wikidata.time.sleep"):
+            client.fetch_all_political_positions(limit=40)
+        sparql = client._query.call_args[0][0]
+        assert sparql.count("LIMIT 40") == 3
+        assert "LIMIT 120" not in sparql
+        client.fetch_federal_deputies.assert_called_once_with(since_year=2019, limit=40)
+
+    def test_position_filling_its_limit_does_not_crowd_out_others(self) -> None:
+        import re
+
+        # Fake endpoint honouring each sub-select's own LIMIT: deputies have
+        # far more rows than the limit, and sort before the president.
+        rows = {
+            "Q21609546": [
+                {**_binding(f"Q{i}", f"A{i:03}"), "pos": _pos("Q21609546")}
+                for i in range(100, 200)
+            ],
+            "Q18611017": [{**_binding("Q2", "B"), "pos": _pos("Q18611017")}],
+            "Q35137": [{**_binding("Q3", "Z"), "pos": _pos("Q35137")}],
+        }
+
+        def query(sparql: str) -> list[dict]:
+            result: list[dict] = []
+            for qid, limit in re.findall(r"VALUES \(\?pos \?since\) \{ \(wd:(Q\d+) .*?LIMIT (\d+)",
+                                         sparql, re.S):
+                result += rows[qid][: int(limit)]
+            return result
+
+        client = WikidataClient()
+        client._query = MagicMock(side_effect=query)
+        client.fetch_presidents = MagicMock(return_value=[])
+        result = client.fetch_all_political_positions(limit=10)
+
+        by_id = {p.wikidata_id: p for p in result}
+        assert len(by_id) == 12
+        assert by_id["Q3"].roles[0].institution == "presidencia-da-republica"
+        client.fetch_presidents.assert_not_called()
+
+    def test_empty_positions_fall_back_to_their_own_fetchers(self) -> None:
+        from src.history.models import Politician, PoliticianRole
+
+        def politician(wid: str, role: str, tags: list[str]) -> Politician:
+            return Politician(
+                name=wid, wikidata_id=wid, tags=tags,
+                roles=[PoliticianRole(role=role, institution="x")],
+            )
+
+        client = WikidataClient()
+        client._query = MagicMock(return_value=[
+            {**_binding("Q7", "Pessoa"), "pos": _pos("Q18611017")},
+        ])
+        client.fetch_federal_deputies = MagicMock(return_value=[
+            politician("Q7", "Deputado Federal", ["deputado-federal", "legislativo"]),
+            politician("Q8", "Deputado Federal", ["deputado-federal"]),
+        ])
+        client.fetch_presidents = MagicMock(return_value=[])
+        with patch("src.sources.wikidata.time.sleep"):
+            result = client.fetch_all_political_positions()
+
+        client.fetch_presidents.assert_called_once_with()
+        by_id = {p.wikidata_id: p for p in result}
+        assert set(by_id) == {"Q7", "Q8"}
+        assert [r.role for r in by_id["Q7"].roles] == ["Senador Federal", "Deputado Federal"]
+        assert by_id["Q7"].tags.count("legislativo") == 1
+
+    def test_person_with_several_positions_is_merged(self) -> None:
+        bindings = [
+            {**_binding("Q7", "Pessoa", startDate="2011-02-01T00:00:00Z"), "pos": _pos("Q21609546")},
+            {**_binding("Q7", "Pessoa", startDate="2019-02-01T00:00:00Z"), "pos": _pos("Q18611017")},
+        ]
+        client = WikidataClient()
+        client._query = MagicMock(return_value=bindings)
+        client.fetch_presidents = MagicMock(return_value=[])
+        with patch("src.sources.wikidata.time.sleep"):
+            [person] = client.fetch_all_political_positions()
+        assert [r.institution for r in person.roles] == ["camara-deputados", "senado-federal"]
+        assert "deputado-federal" in person.tags and "senador" in person.tags
+        assert person.tags.count("legislativo") == 1
+
+
+class TestFetchAll:
+    def test_runs_every_category_and_drops_failures(self) -> None:
+        client = WikidataClient()
+        client.fetch_stf_ministers = MagicMock(return_value=["stf"])
+        client.fetch_all_political_positions = MagicMock(return_value=["pos"])
+        client.fetch_governors = MagicMock(side_effect=WikidataError("boom"))
+        client.fetch_political_events = MagicMock(return_value=["ev"])
+        client.fetch_legislatures = MagicMock(return_value=[])
+
+        result = client.fetch_all(limit=7)
+
+        assert result == {"stf": ["stf"], "positions": ["pos"], "events": ["ev"], "legislatures": []}
+        client.fetch_political_events.assert_called_once_with(limit=7)
+        client.fetch_all_political_positions.assert_called_once_with(limit=7)
+
+
 # ---------------------------------------------------------------------------
 # fetch_political_events
 # ---------------------------------------------------------------------------
@@ -194,6 +565,36 @@ class TestFetchPoliticalEvents:
             result = client.fetch_political_events()
         assert len(result) == 1
 
+    def test_sub_queries_run_concurrently(self) -> None:
+        barrier = threading.Barrier(4, timeout=5)
+
+        def query(sparql: str) -> list[dict]:
+            barrier.wait()  # raises BrokenBarrierError unless all four are in flight
+            return []
+
+        client = WikidataClient()
+        client._query = MagicMock(side_effect=query)
+        assert client.fetch_political_events() == []
+        assert client._query.call_count == 4
+
+    def test_merge_order_is_independent_of_completion_order(self) -> None:
+        elections_done = threading.Event()
+
+        def query(sparql: str) -> list[dict]:
+            if "wd:Q2334719" in sparql:  # scandals — finishes after elections
+                elections_done.wait(5)
+                return [_event_binding("Q1", "Mensalão")]
+            if "wd:Q40231" in sparql:  # elections — also lists Q1
+                elections_done.set()
+                return [_event_binding("Q1", "Mensalão"), _event_binding("Q2", "Eleição 2022")]
+            return []
+
+        client = WikidataClient()
+        client._query = MagicMock(side_effect=query)
+        result = client.fetch_political_events()
+
+        assert [(e.wikidata_id, e.type) for e in result] == [("Q1", "scandal"), ("Q2", "election")]
+
 
 # ---------------------------------------------------------------------------
 # search_person
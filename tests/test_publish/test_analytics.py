@@ -51,6 +51,16 @@ class TestMetricRecord:
         )
         assert abs(delta.total_seconds()) < 5
 
+    def test_default_fetched_at_is_per_instance(self) -> None:
+        first = MetricRecord(
+            post_id="P", platform="twitter", draft_id="D", metric_name="likes", metric_value=1.0
+        )
+        second = MetricRecord(
+            post_id="P", platform="twitter", draft_id="D", metric_name="likes", metric_value=1.0
+        )
+        assert second.fetched_at >= first.fetched_at
+        assert first.fetched_at.tzinfo is not None
+
 
 # ---------------------------------------------------------------------------
 # store / store_batch
@@ -92,6 +102,72 @@ class TestAnalyticsStoreWrite:
         result = store.get_post_metrics("P3", "twitter")
         assert result["like_count"] == 25
 
+    def test_store_batch_stores_ints_as_real(self, store: AnalyticsStore) -> None:
+        store.store_batch("P4", "instagram", "D4", {"likes": 7})
+
+        result = store.get_post_metrics("P4", "instagram")
+        assert isinstance(result["likes"], float)
+
+    def test_prune_deletes_old_snapshots(self, store: AnalyticsStore) -> None:
+        old = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=120)
+        store.store(
+            MetricRecord(
+                post_id="OLD",
+                platform="instagram",
+                draft_id="D",
+                metric_name="reach",
+                metric_value=1.0,
+                fetched_at=old,
+            )
+        )
+        store.store_batch("NEW", "instagram", "D", {"reach": 2})
+
+        deleted = store.prune(dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=90))
+
+        assert deleted == 1
+        assert store.get_post_metrics("OLD", "instagram") == {}
+        assert store.get_post_metrics("NEW", "instagram") == {"reach": 2.0}
+
+    @staticmethod
+    def _store_old_rows(store: AnalyticsStore, n: int) -> dt.datetime:
+        old = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=120)
+        for i in range(n):
+            store.store(
+                MetricRecord(
+                    post_id=f"OLD{i}",
+                    platform="instagram",
+                    draft_id="D" * 200,
+                    metric_name="reach",
+                    metric_value=float(i),
+                    fetched_at=old,
+                )
+            )
+        return old + dt.timedelta(days=1)
+
+    def test_prune_returns_freed_pages(self, store: AnalyticsStore) -> None:
+        cutoff = self._store_old_rows(store, 3000)
+        pages_before = store._db.conn.execute("PRAGMA page_count").fetchone()[0]
+
+        store.prune(cutoff)
+
+        conn = store._db.conn
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] <= 1
+        assert conn.execute("PRAGMA page_count").fetchone()[0] < pages_before // 4
+
+    def test_prune_switches_legacy_file_to_incremental(self, tmp_path: Path) -> None:
+        import sqlite3
+
+        path = tmp_path / "legacy.db"
+        sqlite3.connect(path).execute("CREATE TABLE placeholder (x)").connection.close()
+        store = AnalyticsStore(path)
+        assert store._db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+        store.prune(self._store_old_rows(store, 500))
+
+        conn = store._db.conn
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
 
 # ---------------------------------------------------------------------------
 # Queries
@@ -131,3 +207,30 @@ class TestAnalyticsStoreRead:
         assert summary["total_metric_records"] == 3
         assert summary["distinct_posts"] == 2
         assert summary["platform"] == "instagram"
+
+    def test_top_posts_uses_composite_index(self, store: AnalyticsStore) -> None:
+        plan = store._db.execute(
+            "EXPLAIN QUERY PLAN SELECT post_id FROM metrics "
+            "WHERE platform = ? AND metric_name = ? ORDER BY metric_value DESC LIMIT 5",
+            ["instagram", "impressions"],
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "idx_metrics_top" in detail
+        assert "TEMP B-TREE" not in detail
+
+    def test_summary_without_platform_counts_all(self, store: AnalyticsStore) -> None:
+        store.store_batch("IG1", "instagram", "D1", {"impressions": 100})
+        store.store_batch("TW1", "twitter", "D1", {"like_count": 3, "retweet_count": 1})
+
+        summary = store.summary()
+        assert summary == {"platform": "all", "total_metric_records": 3, "distinct_posts": 2}
+
+    def test_draft_metrics_need_no_sort_step(self, store: AnalyticsStore) -> None:
+        plan = store._db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM metrics WHERE draft_id = ? "
+            "ORDER BY platform, metric_name",
+            ["D1"],
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "idx_metrics_draft" in detail
+        assert "TEMP B-TREE" not in detail
@@ -6,12 +6,14 @@ All HTTP calls are mocked — no real API credentials needed.
 
 from __future__ import annotations
 
+import json
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.publish.instagram import InstagramClient, InstagramError
+from src.publish import instagram
+from src.publish.instagram import InstagramClient, InstagramError, _ContainerBudget
 
 
 # ---------------------------------------------------------------------------
@@ -19,6 +21,14 @@ from src.publish.instagram import InstagramClient, InstagramError
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _fresh_container_budgets():
+    """Container budgets are process-wide; give every test its own."""
+    instagram._budgets.clear()
+    yield
+    instagram._budgets.clear()
+
+
 def _make_client(account_id: str = "ACC123") -> InstagramClient:
     """Return a client with a dummy token/account and mocked httpx."""
     client = InstagramClient(
@@ -29,15 +39,15 @@ def _make_client(account_id: str = "ACC123") -> InstagramClient:
     return client
 
 
-def _ok_response(payload: dict) -> MagicMock:
+def _ok_response(payload: Any) -> MagicMock:
     mock = MagicMock()
-    mock.json.return_value = payload
+    mock.content = json.dumps(payload).encode()
     return mock
 
 
 def _err_response(message: str) -> MagicMock:
     mock = MagicMock()
-    mock.json.return_value = {"error": {"message": message}}
+    mock.content = json.dumps({"error": {"message": message}}).encode()
     return mock
 
 
@@ -134,6 +144,43 @@ class TestPublishContainer:
             client.publish_container("CONTAINER1")
 
 
+# ---------------------------------------------------------------------------
+# wait_until_ready
+# ---------------------------------------------------------------------------
+
+
+class TestWaitUntilReady:
+    def test_polls_until_finished(self) -> None:
+        client = _make_client()
+        client._http.get = MagicMock(
+            side_effect=[
+                _ok_response({"status_code": "IN_PROGRESS"}),
+                _ok_response({"status_code": "IN_PROGRESS"}),
+                _ok_response({"status_code": "FINISHED"}),
+            ]
+        )
+
+        with patch("time.sleep") as sleep:
+            client.wait_until_ready("C1")
+
+        assert client._http.get.call_count == 3
+        assert [c[0][0] for c in sleep.call_args_list] == [0.25, 0.5]
+
+    def test_raises_on_error_status(self) -> None:
+        client = _make_client()
+        client._http.get = MagicMock(return_value=_ok_response({"status_code": "ERROR"}))
+
+        with pytest.raises(InstagramError, match="ERROR"):
+            client.wait_until_ready("C1")
+
+    def test_raises_when_not_ready_in_time(self) -> None:
+        client = _make_client()
+        client._http.get = MagicMock(return_value=_ok_response({"status_code": "IN_PROGRESS"}))
+
+        with patch("time.sleep"), pytest.raises(InstagramError, match="not ready"):
+            client.wait_until_ready("C1", max_wait=0.1)
+
+
 # ---------------------------------------------------------------------------
 # post_image (high-level)
 # ---------------------------------------------------------------------------
@@ -147,12 +194,14 @@ class TestPostImage:
             _ok_response({"id": "POST1"}),        # publish_container
         ]
         client._http.post = MagicMock(side_effect=responses)
+        client._http.get = MagicMock(return_value=_ok_response({"status_code": "FINISHED"}))
 
         with patch("time.sleep"):
             result = client.post_image("https://example.com/img.jpg", "Caption")
 
         assert result == "POST1"
         assert client._http.post.call_count == 2
+        assert client._http.get.call_args[0][0] == "/CONTAINER1"
 
 
 # ---------------------------------------------------------------------------
@@ -170,6 +219,7 @@ class TestPostCarousel:
             _ok_response({"id": "POST1"}),     # publish
         ]
         client._http.post = MagicMock(side_effect=responses)
+        client._http.get = MagicMock(return_value=_ok_response({"status_code": "FINISHED"}))
 
         with patch("time.sleep"):
             result = client.post_carousel(
@@ -180,6 +230,111 @@ class TestPostCarousel:
         assert result == "POST1"
         assert client._http.post.call_count == 4
 
+    def test_children_keep_slide_order(self) -> None:
+        client = _make_client()
+
+        def fake_post(path: str, data: dict) -> MagicMock:
+            if "image_url" in data:
+                return _ok_response({"id": "CHILD-" + data["image_url"][-5]})
+            if data.get("media_type") == "CAROUSEL":
+                fake_post.children = data["children"]  # type: ignore[attr-defined]
+                return _ok_response({"id": "PARENT1"})
+            return _ok_response({"id": "POST1"})
+
+        client._http.post = MagicMock(side_effect=fake_post)
+        client._http.get = MagicMock(return_value=_ok_response({"status_code": "FINISHED"}))
+
+        with patch("time.sleep") as sleep:
+            client.post_carousel(
+                [f"https://example.com/{i}.jpg" for i in range(1, 7)],
+                caption="Six slides",
+            )
+
+        assert fake_post.children == ",".join(f"CHILD-{i}" for i in range(1, 7))  # type: ignore[attr-defined]
+        sleep.assert_not_called()
+
+    def test_rejects_carousel_over_hourly_container_budget(self) -> None:
+        client = _make_client()
+        client._containers = _ContainerBudget(limit=12)
+        client._containers.reserve(2)
+        client._http.post = MagicMock()
+
+        with pytest.raises(InstagramError, match="need 11, 10 left"):
+            client.post_carousel(
+                [f"https://example.com/{i}.jpg" for i in range(10)],
+                caption="Ten slides",
+            )
+
+        client._http.post.assert_not_called()
+
+    def test_failed_child_releases_slots_of_uncreated_containers(self) -> None:
+        client = _make_client()
+        client._containers = _ContainerBudget(limit=4)
+
+        def fake_post(path: str, data: dict) -> MagicMock:
+            if data.get("image_url", "").endswith("bad.jpg"):
+                return _err_response("Invalid image")
+            return _ok_response({"id": "CHILD"})
+
+        client._http.post = MagicMock(side_effect=fake_post)
+        with pytest.raises(InstagramError, match="Invalid image"):
+            client.post_carousel(
+                ["https://example.com/ok.jpg", "https://example.com/bad.jpg"],
+                caption="Two slides",
+            )
+
+        # Only the one child the API created still counts
+        client._containers.reserve(3)
+        with pytest.raises(InstagramError, match="exhausted"):
+            client._containers.reserve(1)
+
+    def test_failed_parent_releases_its_slot(self) -> None:
+        client = _make_client()
+        client._containers = _ContainerBudget(limit=3)
+        client._http.post = MagicMock(side_effect=[
+            _ok_response({"id": "CHILD1"}),
+            _ok_response({"id": "CHILD2"}),
+            _err_response("Carousel rejected"),
+        ])
+        with pytest.raises(InstagramError, match="Carousel rejected"):
+            client.post_carousel(
+                ["https://example.com/1.jpg", "https://example.com/2.jpg"],
+                caption="Two slides",
+            )
+        client._containers.reserve(1)
+
+    def test_failed_image_post_releases_its_slot(self) -> None:
+        client = _make_client()
+        client._containers = _ContainerBudget(limit=1)
+        client._http.post = MagicMock(return_value=_err_response("Invalid image"))
+        with pytest.raises(InstagramError):
+            client.post_image("https://example.com/img.jpg", "Caption")
+        client._containers.reserve(1)
+
+    def test_clients_for_one_account_share_the_budget(self) -> None:
+        first, second = _make_client(), _make_client()
+        other_account = _make_client(account_id="ACC999")
+
+        first._containers.reserve(50)
+
+        with pytest.raises(InstagramError, match="exhausted"):
+            second._containers.reserve(1)
+        other_account._containers.reserve(1)
+
+    def test_container_budget_rejects_request_over_the_limit(self) -> None:
+        with pytest.raises(InstagramError, match="at most 3 per hour"):
+            _ContainerBudget(limit=3).reserve(5)
+
+    def test_container_budget_frees_slots_after_an_hour(self) -> None:
+        clock = [1000.0]
+        budget = _ContainerBudget(limit=2)
+        with patch("src.publish.instagram.time.monotonic", lambda: clock[0]):
+            budget.reserve(2)
+            with pytest.raises(InstagramError):
+                budget.reserve(1)
+            clock[0] += 3600.0
+            budget.reserve(2)
+
     def test_raises_on_empty_urls(self) -> None:
         client = _make_client()
         with pytest.raises(ValueError, match="at least one"):
@@ -226,3 +381,54 @@ class TestGetMediaInsights:
 
         with pytest.raises(InstagramError, match="Insufficient permissions"):
             client.get_media_insights("POST123")
+
+
+# ---------------------------------------------------------------------------
+# get_media_insights_batch
+# ---------------------------------------------------------------------------
+
+
+def _batch_item(media_id: str, value: int) -> dict:
+    body = {"data": [{"name": "impressions", "values": [{"value": value}]}]}
+    return {"code": 200, "body": json.dumps(body)}
+
+
+class TestGetMediaInsightsBatch:
+    def test_returns_metrics_per_media(self) -> None:
+        client = _make_client()
+        client._http.post = MagicMock(
+            return_value=_ok_response([_batch_item("M1", 10), _batch_item("M2", 20)])
+        )
+
+        result = client.get_media_insights_batch(["M1", "M2"], metrics=("impressions",))
+
+        assert result == {"M1": {"impressions": 10}, "M2": {"impressions": 20}}
+        data = client._http.post.call_args[1]["data"]
+        subrequests = json.loads(data["batch"])
+        assert subrequests[0]["relative_url"] == "M1/insights?metric=impressions"
+
+    def test_skips_failed_subrequests(self) -> None:
+        client = _make_client()
+        failed = {"code": 400, "body": json.dumps({"error": {"message": "bad id"}})}
+        client._http.post = MagicMock(
+            return_value=_ok_response([_batch_item("M1", 10), failed])
+        )
+
+        result = client.get_media_insights_batch(["M1", "BAD"])
+
+        assert list(result) == ["M1"]
+
+    def test_chunks_into_batches_of_50(self) -> None:
+        client = _make_client()
+        ids = [f"M{i}" for i in range(60)]
+        client._http.post = MagicMock(
+            side_effect=[
+                _ok_response([_batch_item(m, 1) for m in ids[:50]]),
+                _ok_response([_batch_item(m, 1) for m in ids[50:]]),
+            ]
+        )
+
+        result = client.get_media_insights_batch(ids)
+
+        assert client._http.post.call_count == 2
+        assert len(result) == 60
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import datetime as dt
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -52,6 +53,11 @@ class TestScheduledPostModel:
         post = _make_post()
         assert len(post.id) == 8
 
+    def test_created_at_defaults_to_now(self) -> None:
+        post = _make_post()
+        delta = dt.datetime.now(dt.timezone.utc) - post.created_at
+        assert abs(delta.total_seconds()) < 5
+
     def test_explicit_id_preserved(self) -> None:
         post = ScheduledPost(
             id="myid",
@@ -79,6 +85,16 @@ class TestScheduledPostModel:
         post = _make_post(scheduled_at=_past(5))
         assert post.is_due is True
 
+    def test_naive_scheduled_at_treated_as_utc(self) -> None:
+        post = _make_post(scheduled_at=dt.datetime(2026, 3, 1, 10, 0))
+        assert post.scheduled_at == dt.datetime(2026, 3, 1, 10, 0, tzinfo=dt.timezone.utc)
+
+    def test_scheduled_at_normalised_to_utc(self) -> None:
+        brt = dt.timezone(dt.timedelta(hours=-3))
+        post = _make_post(scheduled_at=dt.datetime(2026, 3, 1, 7, 0, tzinfo=brt))
+        assert post.scheduled_at.utcoffset() == dt.timedelta(0)
+        assert post.scheduled_at.hour == 10
+
     def test_is_due_false_for_non_pending_status(self) -> None:
         post = _make_post(scheduled_at=_past(5), status="done")
         assert post.is_due is False
@@ -110,6 +126,15 @@ class TestPostSchedulerCRUD:
         assert retrieved is not None
         assert retrieved.image_urls == ["https://a.com/1.jpg", "https://a.com/2.jpg"]
 
+    def test_add_existing_id_updates_in_place(self, scheduler: PostScheduler) -> None:
+        post = scheduler.add(_make_post(caption="first"))
+        scheduler.add(post.model_copy(update={"caption": "second"}))
+
+        retrieved = scheduler.get(post.id)
+        assert retrieved is not None
+        assert retrieved.caption == "second"
+        assert len(scheduler.list_all()) == 1
+
     def test_update_status_to_done(self, scheduler: PostScheduler) -> None:
         post = scheduler.add(_make_post())
         scheduler.update_status(post.id, "done")
@@ -164,6 +189,51 @@ class TestPostSchedulerQueries:
         assert len(due) == 1
         assert due[0].id == past_post.id
 
+    def test_list_due_handles_non_utc_offsets(self, scheduler: PostScheduler) -> None:
+        # 1h in the future, expressed in UTC+5 — a naive text comparison of
+        # the original offset string would wrongly consider it due.
+        plus5 = dt.timezone(dt.timedelta(hours=5))
+        scheduler.add(_make_post(scheduled_at=_future(60).astimezone(plus5)))
+
+        assert scheduler.list_due() == []
+
+    def test_sub_second_schedule_time_preserved(self, scheduler: PostScheduler) -> None:
+        when = dt.datetime(2026, 3, 1, 10, 0, 0, 250000, tzinfo=dt.timezone.utc)
+        post = scheduler.add(_make_post(scheduled_at=when))
+        assert scheduler.get(post.id).scheduled_at == when
+
+    def test_legacy_rows_normalised_on_open(self, tmp_path: Path) -> None:
+        path = tmp_path / "legacy.db"
+        with PostScheduler(path) as sched:
+            naive = sched.add(_make_post(id="naive0001", scheduled_at=_past(5)))
+            offset = sched.add(_make_post(id="offset001", scheduled_at=_future(60)))
+            legacy = {
+                naive.id: _past(5).replace(tzinfo=None).isoformat(),
+                offset.id: _future(60).astimezone(dt.timezone(dt.timedelta(hours=5))).isoformat(),
+            }
+            with sched._db.conn:
+                for post_id, raw in legacy.items():
+                    sched._db.conn.execute(
+                        "UPDATE schedule SET scheduled_at = ? WHERE id = ?", [raw, post_id]
+                    )
+            # Files written before the migration existed carry no version
+            sched._db.conn.execute("PRAGMA user_version = 0")
+
+        with PostScheduler(path) as sched:
+            due = sched.list_due()
+            assert [p.id for p in due] == [naive.id]
+            assert due[0].is_due is True
+            assert sched.get(offset.id).is_due is False
+
+    def test_migrated_file_skips_the_scan_on_open(self, tmp_path: Path) -> None:
+        path = tmp_path / "schedule.db"
+        PostScheduler(path).close()
+
+        with patch.object(PostScheduler, "_canonicalise_scheduled_at") as scan:
+            PostScheduler(path).close()
+
+        scan.assert_not_called()
+
     def test_list_all_returns_everything(self, scheduler: PostScheduler) -> None:
         for i in range(3):
             scheduler.add(_make_post(draft_id=f"d{i}"))
@@ -179,3 +249,29 @@ class TestPostSchedulerQueries:
         stats = scheduler.stats()
         assert stats.get("pending", 0) == 1
         assert stats.get("done", 0) == 1
+
+
+class TestPostSchedulerConnection:
+    def test_file_database_uses_wal(self, scheduler: PostScheduler) -> None:
+        mode = scheduler._db.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_reads_use_read_only_connection(self, scheduler: PostScheduler) -> None:
+        with scheduler._readers.connection() as db:
+            assert db is not scheduler._db
+            assert db.execute("PRAGMA query_only").fetchone()[0] == 1
+
+    def test_reader_sees_committed_writes(self, scheduler: PostScheduler) -> None:
+        post = scheduler.add(_make_post())
+        scheduler.update_status(post.id, "done")
+        assert scheduler.stats() == {"done": 1}
+
+    def test_list_due_uses_composite_index(self, scheduler: PostScheduler) -> None:
+        plan = scheduler._db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM schedule "
+            "WHERE status = 'pending' AND scheduled_at <= ? ORDER BY scheduled_at ASC",
+            ["2030-01-01"],
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "idx_schedule_due" in detail
+        assert "TEMP B-TREE" not in detail
@@ -6,6 +6,7 @@ Tweepy internals are mocked — no real API credentials needed.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -13,7 +14,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.publish.twitter import TweetResult, TwitterClient, TwitterError
+from src.publish.twitter import TweetResult, TwitterClient, TwitterError, _RateLimiter
 
 
 # ---------------------------------------------------------------------------
@@ -97,6 +98,19 @@ class TestPostTweet:
         kwargs = mock_v2.create_tweet.call_args[1]
         assert kwargs["media_ids"] == ["MEDIA1"]
 
+    def test_uploads_multiple_media_in_order(self, tmp_path: Path) -> None:
+        client = _make_client()
+        mock_v2 = MagicMock()
+        mock_v2.create_tweet.return_value = _FakeTweetResponse(data={"id": "T2"})
+        client._client = mock_v2
+        client.upload_media = MagicMock(side_effect=lambda p: f"M-{p.stem}")  # type: ignore[method-assign]
+
+        paths = [tmp_path / f"{i}.png" for i in range(4)]
+        result = client.post_tweet("Four images", media_paths=paths)
+
+        assert result.media_ids == ["M-0", "M-1", "M-2", "M-3"]
+        assert client.upload_media.call_count == 4
+
     def test_passes_reply_to_id(self) -> None:
         client = _make_client()
         mock_v2 = MagicMock()
@@ -151,6 +165,45 @@ class TestPostThread:
         with pytest.raises(ValueError, match="at least one"):
             client.post_thread([])
 
+    def test_media_attached_to_matching_tweets(self) -> None:
+        client = _make_client()
+        tweet_ids = iter(["T1", "T2", "T3"])
+        mock_v2 = MagicMock()
+        mock_v2.create_tweet.side_effect = lambda **kw: _FakeTweetResponse(
+            data={"id": next(tweet_ids)}
+        )
+        client._client = mock_v2
+        client.upload_media = MagicMock(side_effect=lambda p: f"M-{p.stem}")  # type: ignore[method-assign]
+
+        results = client.post_thread(
+            ["First", "Second", "Third"],
+            media_paths=[[Path("a.png")], None, [Path("c.png")]],
+        )
+
+        assert [r.media_ids for r in results] == [["M-a"], [], ["M-c"]]
+        calls = mock_v2.create_tweet.call_args_list
+        assert calls[0][1]["media_ids"] == ["M-a"]
+        assert "media_ids" not in calls[1][1]
+        assert calls[2][1]["in_reply_to_tweet_id"] == "T2"
+
+    def test_stops_at_failed_upload(self) -> None:
+        client = _make_client()
+        mock_v2 = MagicMock()
+        mock_v2.create_tweet.return_value = _FakeTweetResponse(data={"id": "T1"})
+        client._client = mock_v2
+
+        def fake_upload(path: Path) -> str:
+            if path.stem == "bad":
+                raise TwitterError("Media upload failed: boom")
+            return "M1"
+
+        client.upload_media = MagicMock(side_effect=fake_upload)  # type: ignore[method-assign]
+
+        with pytest.raises(TwitterError, match="boom"):
+            client.post_thread(["First", "Second"], media_paths=[[Path("ok.png")], [Path("bad.png")]])
+
+        assert mock_v2.create_tweet.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # get_tweet_metrics
@@ -185,6 +238,182 @@ class TestGetTweetMetrics:
             client.get_tweet_metrics("TWEET123")
 
 
+class TestGetTweetsMetrics:
+    def test_returns_metrics_keyed_by_id(self) -> None:
+        client = _make_client()
+        mock_v2 = MagicMock()
+        mock_v2.get_tweets.return_value = MagicMock(
+            data=[
+                {"id": 1, "public_metrics": {"like_count": 3}},
+                {"id": 2, "public_metrics": {"like_count": 7}},
+            ]
+        )
+        client._client = mock_v2
+
+        metrics = client.get_tweets_metrics(["1", "2"])
+
+        assert metrics == {"1": {"like_count": 3}, "2": {"like_count": 7}}
+
+    def test_chunks_ids_by_100(self) -> None:
+        client = _make_client()
+        mock_v2 = MagicMock()
+        mock_v2.get_tweets.return_value = MagicMock(data=None)
+        client._client = mock_v2
+
+        client.get_tweets_metrics([str(i) for i in range(250)])
+
+        sizes = [len(c[1]["ids"]) for c in mock_v2.get_tweets.call_args_list]
+        assert sizes == [100, 100, 50]
+
+
+# ---------------------------------------------------------------------------
+# upload_media
+# ---------------------------------------------------------------------------
+
+
+class TestUploadMedia:
+    def _upload(self, path: Path) -> MagicMock:
+        client = _make_client()
+        api = MagicMock()
+        api.media_upload.return_value = MagicMock(media_id_string="MEDIA1")
+        client._v1.api = api
+
+        assert client.upload_media(path) == "MEDIA1"
+        return api.media_upload
+
+    def test_small_image_uses_simple_upload(self, tmp_path: Path) -> None:
+        img = tmp_path / "small.png"
+        img.write_bytes(b"x" * 1024)
+
+        upload = self._upload(img)
+
+        upload.assert_called_once_with(str(img))
+
+    def test_large_image_uses_chunked_upload(self, tmp_path: Path) -> None:
+        img = tmp_path / "large.jpg"
+        img.write_bytes(b"x" * (4 * 1024 * 1024 + 1))
+
+        upload = self._upload(img)
+
+        kwargs = upload.call_args[1]
+        assert kwargs["chunked"] is True
+        assert kwargs["media_category"] == "tweet_image"
+        assert kwargs["wait_for_async_finalize"] is True
+
+    def test_gif_uses_chunked_upload(self, tmp_path: Path) -> None:
+        gif = tmp_path / "anim.gif"
+        gif.write_bytes(b"GIF89a")
+
+        upload = self._upload(gif)
+
+        assert upload.call_args[1]["media_category"] == "tweet_gif"
+
+    def test_missing_file_raises_twitter_error(self, tmp_path: Path) -> None:
+        client = _make_client()
+        client._v1.api = MagicMock()
+
+        with pytest.raises(TwitterError, match="Media upload failed"):
+            client.upload_media(tmp_path / "missing.png")
+
+        client._v1.api.media_upload.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP session
+# ---------------------------------------------------------------------------
+
+
+class TestSharedSession:
+    def test_v2_uses_pooled_session_and_v1_keeps_its_own(self) -> None:
+        client = _make_client()
+
+        v2 = client._get_client()
+        v1 = client._get_v1_api()
+
+        assert v2.session is client._session
+        assert v1.session is not client._session
+        assert client._sync_rate_limit in v1.session.hooks["response"]
+
+    def test_each_upload_thread_gets_its_own_v1_api(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = _make_client()
+        barrier = threading.Barrier(2)
+
+        def get_api(_: int) -> object:
+            barrier.wait()  # both calls run at once, on different threads
+            return client._get_v1_api()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first, second = pool.map(get_api, range(2))
+
+        assert first is not second
+        assert first.session is not second.session
+        assert client._get_v1_api() is client._get_v1_api()
+
+    def test_pool_survives_media_upload(self, tmp_path: Path) -> None:
+        import requests
+
+        client = _make_client()
+        client._get_client()
+        v1 = client._get_v1_api()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"media_id": 1, "media_id_string": "1"}'
+        img = tmp_path / "small.png"
+        img.write_bytes(b"x" * 1024)
+
+        with patch.object(v1.session, "request", return_value=response), \
+                patch.object(client._session, "close") as close:
+            assert client.upload_media(img) == "1"
+
+        close.assert_not_called()
+
+    def test_close_releases_session(self) -> None:
+        with _make_client() as client:
+            client._get_client()
+            session = client._session
+        assert client._session is None
+        assert session is not None
+
+
+# ---------------------------------------------------------------------------
+# Client-side rate limiting
+# ---------------------------------------------------------------------------
+
+
+class TestRateLimiter:
+    def test_acquire_within_budget_does_not_wait(self) -> None:
+        limiter = _RateLimiter(limit=2, window=900.0)
+        with patch("src.publish.twitter.time.sleep") as sleep:
+            limiter.acquire()
+            limiter.acquire()
+        sleep.assert_not_called()
+
+    def test_acquire_waits_when_budget_exhausted(self) -> None:
+        limiter = _RateLimiter(limit=1, window=900.0)
+        limiter.acquire()
+
+        def _pass_window(seconds: float) -> None:
+            limiter._reset_at = 0.0
+
+        with patch("src.publish.twitter.time.sleep", side_effect=_pass_window) as sleep:
+            limiter.acquire()
+        assert sleep.call_count == 1
+        assert sleep.call_args[0][0] > 800
+
+    def test_sync_from_headers(self) -> None:
+        client = _make_client()
+        response = MagicMock()
+        response.request.method = "POST"
+        response.request.url = "https://api.twitter.com/2/tweets"
+        response.headers = {"x-rate-limit-remaining": "0", "x-rate-limit-reset": "0"}
+
+        client._sync_rate_limit(response)
+
+        assert client._limits["create_tweet"]._remaining == 0
+
+
 # ---------------------------------------------------------------------------
 # tweepy unavailable
 # ---------------------------------------------------------------------------
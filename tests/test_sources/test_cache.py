@@ -66,6 +66,31 @@ class TestCacheEntry:
         assert restored.data == {"x": 1}
         assert restored.source == "s"
 
+    def test_large_payload_is_compressed(self):
+        data = {"votos": [{"deputado": i, "voto": "Sim"} for i in range(200)]}
+        entry = CacheEntry(key="k", source="s", data=data, fetched_at=dt.datetime.now(dt.timezone.utc))
+        row = entry.to_dict()
+        assert isinstance(row["data_json"], bytes)
+        assert CacheEntry.from_row(row).data == data
+
+    def test_small_payload_stays_text(self):
+        entry = CacheEntry(key="k", source="s", data={"x": 1}, fetched_at=dt.datetime.now(dt.timezone.utc))
+        stored = entry.to_dict()["data_json"]
+        assert isinstance(stored, str)
+        assert json.loads(stored) == {"x": 1}
+
+    def test_non_str_keys_are_coerced(self):
+        entry = CacheEntry(key="k", source="s", data={1: "a"}, fetched_at=dt.datetime.now(dt.timezone.utc))
+        assert CacheEntry.from_row(entry.to_dict()).data == {"1": "a"}
+
+    def test_from_row_decodes_lazily(self):
+        row = CacheEntry(key="k", source="s", data={"x": 1}, fetched_at=dt.datetime.now(dt.timezone.utc)).to_dict()
+        row["data_json"] = "not json"  # would raise if decoded eagerly
+        entry = CacheEntry.from_row(row)
+        assert entry.is_fresh(ttl_seconds=3600) is True
+        with pytest.raises(json.JSONDecodeError):
+            entry.data
+
     def test_naive_datetime_still_fresh(self):
         """Naive datetimes (no tzinfo) should be treated as UTC."""
         naive = dt.datetime.utcnow()
@@ -94,6 +119,49 @@ class TestAPICacheCRUD:
         entry = cache.get("k")
         assert entry.data == {"v": 2}
 
+    def test_overwrite_updates_row_in_place(self, cache):
+        cache.set("k", data={"v": 1}, source="s")
+        rowid = cache._db.execute("SELECT rowid FROM api_cache WHERE key = 'k'").fetchone()[0]
+        cache.set("later", data={}, source="s")
+        cache.set("k", data={"v": 2}, source="other")
+        row = cache._db.execute("SELECT rowid, source FROM api_cache WHERE key = 'k'").fetchone()
+        assert row == (rowid, "other")
+
+    def test_database_uses_wal(self, cache):
+        assert cache._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert cache._db.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+    def test_hot_get_skips_sqlite(self, cache):
+        cache.set("k", data={"v": 1}, source="s")
+        cache._db["api_cache"].update("k", {"data_json": '{"v": 2}'})
+        assert cache.get("k").data == {"v": 1}
+
+    @pytest.mark.parametrize("size", [10, 100_000])  # inline text and compressed BLOB
+    def test_callers_get_independent_payloads(self, cache, size):
+        data = {"deputados": [{"id": 1, "nome": "x" * size}]}
+        cache.set("k", data=data, source="s")
+        data["deputados"].clear()  # the caller's own object is not cached
+
+        first = cache.get("k").data
+        first["deputados"][0]["nome"] = "mutated"
+        first["deputados"].append({"id": 2})
+
+        assert cache.get("k").data == {"deputados": [{"id": 1, "nome": "x" * size}]}
+        assert cache.get("k").data is not cache.get("k").data
+
+    def test_stale_memory_entry_rereads_sqlite(self, cache):
+        cache.set("k", data={"v": 1}, source="s")
+        cache._mem["k"].fetched_at -= dt.timedelta(days=1)
+        cache._db["api_cache"].update("k", {"data_json": '{"v": 2}'})
+        assert cache.get("k").data == {"v": 2}
+
+    def test_memory_layer_is_bounded(self, tmp_path):
+        cache = APICache(db_path=tmp_path / "lru.db", mem_maxsize=2)
+        for i in range(3):
+            cache.set(f"k{i}", data={}, source="s")
+        assert list(cache._mem) == ["k1", "k2"]
+        assert cache.get("k0") is not None  # still in SQLite
+
     def test_delete(self, cache):
         cache.set("k", data={}, source="s")
         cache.delete("k")
@@ -112,6 +180,13 @@ class TestAPICacheCRUD:
         assert cache.get("s1/b") is None
         assert cache.get("s2/a") is not None  # other source untouched
 
+    def test_import_snapshot_clears_memory_layer(self, cache, tmp_path):
+        cache.set("k", data={"v": 1}, source="s")
+        out = cache.export_snapshot(output_path=tmp_path / "snap.json.gz")
+        cache.set("k", data={"v": 2}, source="s")
+        cache.import_snapshot(out)
+        assert cache.get("k").data == {"v": 1}
+
 
 # ---------------------------------------------------------------------------
 # APICache query tests
@@ -139,18 +214,61 @@ class TestAPICacheQueries:
         assert stats["camara_deputados"]["count"] == 2
         assert stats["senado_senadores"]["count"] == 1
 
+    def test_stats_oldest_newest(self, cache):
+        cache.set("a/1", data={}, source="s")
+        cache.set("a/2", data={}, source="s")
+        cache._db["api_cache"].update("a/1", {"fetched_at": "2020-01-01T00:00:00+00:00"})
+
+        info = cache.stats()["s"]
+        assert info["oldest"] == "2020-01-01T00:00:00+00:00"
+        assert info["newest"] > info["oldest"]
+
     def test_stale_keys(self, cache):
         old = dt.datetime.now(dt.timezone.utc) - dt.timedelta(hours=48)
         fresh = dt.datetime.now(dt.timezone.utc)
         cache.set("old/key", data={}, source="camara_deputados")
         # Manually overwrite with old timestamp
-        cache._db["api_cache"].update("old/key", {"fetched_at": old.isoformat()})
+        cache._db["api_cache"].update(
+            "old/key",
+            {"fetched_at": old.isoformat(), "fetched_at_epoch": int(old.timestamp())},
+        )
         cache.set("fresh/key", data={}, source="camara_deputados")
 
         stale = cache.stale_keys("camara_deputados", ttl_seconds=3600)
         assert "old/key" in stale
         assert "fresh/key" not in stale
 
+    def test_stale_keys_is_index_only(self, cache):
+        plan = cache._db.execute(
+            "EXPLAIN QUERY PLAN SELECT key FROM api_cache WHERE source = ? AND fetched_at_epoch <= ?",
+            ["s", 0],
+        ).fetchall()
+        assert "COVERING INDEX idx_api_cache_src_fetched" in plan[0][3]
+
+    def test_stale_keys_after_legacy_migration(self, tmp_path):
+        import sqlite_utils
+
+        db_path = tmp_path / "legacy.db"
+        old = dt.datetime.now(dt.timezone.utc) - dt.timedelta(hours=48)
+        legacy = sqlite_utils.Database(str(db_path))
+        legacy["api_cache"].insert(
+            {
+                "key": "old/key",
+                "source": "s",
+                "data_json": "{}",
+                "fetched_at": old.isoformat(),
+                "schema_version": "1",
+            },
+            pk="key",
+        )
+        legacy["api_cache"].create_index(["source"])
+        legacy.close()
+
+        cache = APICache(db_path=db_path)
+        assert cache.stale_keys("s", ttl_seconds=3600) == ["old/key"]
+        names = {i.name for i in cache._db["api_cache"].indexes if i.origin == "c"}
+        assert names == {"idx_api_cache_src_fetched"}
+
 
 # ---------------------------------------------------------------------------
 # Snapshot tests
@@ -161,14 +279,47 @@ class TestAPICacheSnapshot:
         cache.set("k1", data={"x": 1}, source="s")
         cache.set("k2", data={"x": 2}, source="s")
 
-        out = tmp_path / "snap.json.gz"
+        out = tmp_path / "snap.jsonl.gz"
         path = cache.export_snapshot(output_path=out)
         assert path.exists()
 
         with gzip.open(str(path), "rt") as f:
-            payload = json.load(f)
-        assert payload["total_records"] == 2
-        assert len(payload["records"]) == 2
+            records = [json.loads(line) for line in f]
+        assert sorted(r["key"] for r in records) == ["k1", "k2"]
+
+    def test_export_import_roundtrip(self, cache, tmp_path):
+        cache.set("k1", data={"nome": "São Paulo"}, source="s")
+        cache.set("k2", data=[1, 2, 3], source="s")
+        out = cache.export_snapshot(output_path=tmp_path / "snap.jsonl.gz")
+
+        other = APICache(db_path=tmp_path / "other.db")
+        assert other.import_snapshot(out) == 2
+        assert other.get("k1").data == {"nome": "São Paulo"}
+        assert other.get("k2").data == [1, 2, 3]
+
+    def test_export_inflates_compressed_payloads(self, cache, tmp_path):
+        data = {"itens": list(range(1000))}
+        cache.set("big", data=data, source="s")
+        out = cache.export_snapshot(output_path=tmp_path / "snap.jsonl.gz")
+
+        with gzip.open(str(out), "rt") as f:
+            record = json.loads(f.readline())
+        assert json.loads(record["data_json"]) == data
+
+    def test_export_empty_cache(self, cache, tmp_path):
+        out = cache.export_snapshot(output_path=tmp_path / "empty.jsonl.gz")
+        with gzip.open(str(out), "rb") as f:
+            assert f.read() == b""
+        assert cache.import_snapshot(out) == 0
+
+    def test_zstd_roundtrip(self, cache, tmp_path):
+        pytest.importorskip("zstandard")
+        cache.set("k1", data={"x": 1}, source="s")
+        out = cache.export_snapshot(output_path=tmp_path / "snap.jsonl.zst")
+
+        other = APICache(db_path=tmp_path / "other.db")
+        assert other.import_snapshot(out) == 1
+        assert other.get("k1").data == {"x": 1}
 
     def test_import_snapshot(self, cache, tmp_path):
         # Build a snapshot manually
@@ -185,6 +336,15 @@ class TestAPICacheSnapshot:
         assert cache.get("x/1") is not None
         assert cache.get("x/1").data == {"a": 1}
 
+    def test_import_legacy_pretty_printed_snapshot(self, cache, tmp_path):
+        records = [{"key": "x/1", "source": "s", "data_json": '{"a":1}', "fetched_at": dt.datetime.now(dt.timezone.utc).isoformat(), "schema_version": "1"}]
+        snap = tmp_path / "snap.json.gz"
+        with gzip.open(str(snap), "wt") as f:
+            json.dump({"exported_at": "2026-01-01T00:00:00", "total_records": 1, "records": records}, f, indent=2)
+
+        assert cache.import_snapshot(snap) == 1
+        assert cache.get("x/1").data == {"a": 1}
+
     def test_export_creates_snapshots_dir(self, tmp_path):
         db_path = tmp_path / "cache.db"
         cache = APICache(db_path=db_path)
@@ -193,6 +353,88 @@ class TestAPICacheSnapshot:
         assert path.exists()
 
 
+# ---------------------------------------------------------------------------
+# Adaptive TTL
+# ---------------------------------------------------------------------------
+
+class TestAdaptiveTTL:
+    def test_unchanged_payload_increments_count(self, cache):
+        assert cache.set("k", data=SAMPLE_DATA, source="s").unchanged_count == 0
+        assert cache.set("k", data=dict(SAMPLE_DATA), source="s").unchanged_count == 1
+        assert cache.set("k", data=SAMPLE_DATA, source="s").unchanged_count == 2
+
+    def test_changed_payload_resets_count(self, cache):
+        cache.set("k", data=SAMPLE_DATA, source="s")
+        cache.set("k", data=SAMPLE_DATA, source="s")
+        assert cache.set("k", data={"id": 124}, source="s").unchanged_count == 0
+
+    def test_count_is_persisted(self, cache, tmp_path):
+        for _ in range(3):
+            cache.set("k", data=SAMPLE_DATA, source="s")
+        reopened = APICache(db_path=tmp_path / "test_cache.db")
+        assert reopened.get("k").unchanged_count == 2
+
+    def test_adaptive_ttl_doubles_up_to_16x(self):
+        entry = CacheEntry("k", "s", {}, dt.datetime.now(dt.timezone.utc))
+        ttls = []
+        for count in (0, 1, 2, 4, 10):
+            entry.unchanged_count = count
+            ttls.append(entry.adaptive_ttl(3600))
+        assert ttls == [3600, 7200, 14400, 57600, 57600]
+
+    def test_legacy_table_gains_columns(self, tmp_path):
+        import sqlite_utils
+
+        db_path = tmp_path / "legacy.db"
+        legacy = sqlite_utils.Database(str(db_path))
+        legacy["api_cache"].insert(
+            {
+                "key": "k",
+                "source": "s",
+                "data_json": "{}",
+                "fetched_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+                "schema_version": "1",
+                "fetched_at_epoch": 0,
+            },
+            pk="key",
+        )
+        legacy.close()
+
+        cache = APICache(db_path=db_path)
+        assert cache.get("k").unchanged_count == 0
+        assert cache.set("k", data={}, source="s").unchanged_count == 0
+        assert cache.set("k", data={}, source="s").unchanged_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Maintenance
+# ---------------------------------------------------------------------------
+
+class TestAPICacheMaintenance:
+    def test_maintenance_analyzes_without_vacuum(self, cache):
+        cache.set("k", data={}, source="s")
+        assert cache.maintenance() is False
+        assert "sqlite_stat1" in cache._db.table_names()
+
+    def test_maintenance_vacuums_after_large_purge(self, cache):
+        for i in range(200):
+            cache.set(f"k{i}", data={"itens": list(range(i, i + 500))}, source="s")
+        cache.invalidate_source("s")
+        assert cache.maintenance() is True
+        assert cache._db.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    def test_maintenance_waits_for_the_connection_lock(self, cache):
+        import threading
+
+        done = threading.Event()
+        worker = threading.Thread(target=lambda: (cache.maintenance(), done.set()))
+        with cache._lock:
+            worker.start()
+            assert not done.wait(0.2)
+        worker.join(5)
+        assert done.is_set()
+
+
 # ---------------------------------------------------------------------------
 # Context manager
 # ---------------------------------------------------------------------------
@@ -0,0 +1,273 @@
+"""Tests for src/sources/camara_api.py — all HTTP calls mocked."""
+
+from __future__ import annotations
+
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.sources import camara_api
+from src.sources.cache import APICache
+from src.sources.camara_api import CamaraAPI, CamaraAPIError, DeputyLoader
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return APICache(db_path=tmp_path / "cache.db")
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_clients():
+    yield
+    CamaraAPI.shutdown()
+
+
+def _response(payload) -> MagicMock:
+    resp = MagicMock()
+    resp.json.return_value = {"dados": payload}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP client
+# ---------------------------------------------------------------------------
+
+
+class TestSharedClient:
+    def test_instances_share_client(self, cache):
+        with CamaraAPI(cache=cache) as first:
+            pass
+        second = CamaraAPI(cache=cache)
+
+        assert first._client is second._client
+        assert not second._client.is_closed
+
+    def test_different_timeouts_get_separate_clients(self, cache):
+        assert CamaraAPI(cache=cache, timeout=5.0)._client is not CamaraAPI(cache=cache)._client
+
+    def test_shutdown_closes_shared_client(self, cache):
+        client = CamaraAPI(cache=cache)._client
+        CamaraAPI.shutdown()
+
+        assert client.is_closed
+        assert CamaraAPI(cache=cache)._client is not client
+
+
+# ---------------------------------------------------------------------------
+# Pagination
+# ---------------------------------------------------------------------------
+
+
+def _paged_client(total: int, page_size: int) -> MagicMock:
+    """Fake client serving *total* records split into pages of *page_size*."""
+
+    def fake_get(endpoint, params=None):
+        start = (params["pagina"] - 1) * page_size
+        return _response([{"id": i} for i in range(start, min(start + page_size, total))])
+
+    client = MagicMock()
+    client.get.side_effect = fake_get
+    return client
+
+
+class TestPagination:
+    def test_list_deputies_collects_pages_in_order(self, cache):
+        api = CamaraAPI(cache=cache)
+        api._client = _paged_client(total=513, page_size=100)
+
+        deputies = api.list_deputies()
+
+        assert [d["id"] for d in deputies] == list(range(513))
+
+    def test_page_keys_match_cache_key(self, cache):
+        api = CamaraAPI(cache=cache)
+        api._client = _paged_client(total=150, page_size=100)
+
+        api.list_deputies(state="SP")
+
+        for page in (1, 2):
+            params = {"itens": 100, "ordem": "ASC", "ordenarPor": "nome", "siglaUf": "SP", "pagina": page}
+            assert cache.get(api._cache_key("/deputados", params)) is not None
+
+    def test_single_short_page_makes_one_request(self, cache):
+        api = CamaraAPI(cache=cache)
+        api._client = _paged_client(total=40, page_size=100)
+
+        assert len(api.list_deputies()) == 40
+        assert api._client.get.call_count == 1
+
+    def test_expenses_stop_at_exact_multiple(self, cache):
+        api = CamaraAPI(cache=cache)
+        api._client = _paged_client(total=400, page_size=200)
+
+        expenses = api.get_deputy_expenses(1, year=2024)
+
+        assert len(expenses) == 400
+        assert len({e["id"] for e in expenses}) == 400
+
+
+# ---------------------------------------------------------------------------
+# Stale-while-revalidate
+# ---------------------------------------------------------------------------
+
+
+def _age(cache: APICache, key: str, seconds: float) -> None:
+    """Backdate a cached entry (both SQLite and the in-memory layer)."""
+    cache._mem.pop(key, None)
+    old = dt.datetime.now(dt.timezone.utc) - dt.timedelta(seconds=seconds)
+    cache._db["api_cache"].update(key, {"fetched_at": old.isoformat()})
+
+
+class TestStaleWhileRevalidate:
+    def _api(self, cache) -> CamaraAPI:
+        api = CamaraAPI(cache=cache)
+        api._client = MagicMock()
+        api._client.get.return_value = _response([{"sigla": "NEW"}])
+        return api
+
+    def test_stale_within_window_served_then_refreshed(self, cache, monkeypatch):
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(camara_api, "_BG_EXEC", executor)
+        cache.set("camara:/partidos", [{"sigla": "OLD"}], source="camara")
+        _age(cache, "camara:/partidos", 3_600 + 60)
+        api = self._api(cache)
+
+        assert api._fetch("/partidos") == [{"sigla": "OLD"}]
+
+        executor.shutdown(wait=True)  # let the background refresh finish
+        assert cache.get("camara:/partidos").data == [{"sigla": "NEW"}]
+
+    def test_stale_beyond_window_fetches_inline(self, cache):
+        cache.set("camara:/partidos", [{"sigla": "OLD"}], source="camara")
+        _age(cache, "camara:/partidos", 3_600 + 3_600)
+        api = self._api(cache)
+
+        assert api._fetch("/partidos") == [{"sigla": "NEW"}]
+
+    def test_unchanged_payload_extends_ttl(self, cache):
+        cache.set("camara:/partidos", [{"sigla": "PT"}], source="camara")
+        cache.set("camara:/partidos", [{"sigla": "PT"}], source="camara")
+        _age(cache, "camara:/partidos", 3_600 + 1_800)  # past SWR, within 2x TTL
+        api = self._api(cache)
+
+        assert api._fetch("/partidos") == [{"sigla": "PT"}]
+        api._client.get.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Bulk session votes
+# ---------------------------------------------------------------------------
+
+
+class TestSessionVotesBulk:
+    @patch("src.sources.camara_api.httpx.AsyncClient")
+    def test_fetches_missing_sessions_and_uses_cache(self, mock_client_cls, cache):
+        cache.set("camara:/votacoes/S1/votos", [{"tipoVoto": "Sim"}], source="camara_votos")
+
+        async def fake_get(endpoint, params=None):
+            return _response([{"tipoVoto": endpoint.split("/")[2]}])
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=fake_get)
+        mock_client_cls.return_value.__aenter__.return_value = client
+
+        result = CamaraAPI(cache=cache).get_session_votes_bulk(["S2", "S1", "S3"])
+
+        assert list(result) == ["S2", "S1", "S3"]
+        assert result["S1"] == [{"tipoVoto": "Sim"}]
+        assert result["S3"] == [{"tipoVoto": "S3"}]
+        assert client.get.await_count == 2
+        assert cache.get("camara:/votacoes/S2/votos").data == [{"tipoVoto": "S2"}]
+
+    async def test_sync_wrapper_inside_running_loop_points_to_async_api(self, cache):
+        api = CamaraAPI(cache=cache)
+        with patch.object(api, "get_session_votes_bulk_async") as bulk_async:
+            with pytest.raises(RuntimeError, match="get_session_votes_bulk_async"):
+                api.get_session_votes_bulk(["S1"])
+        bulk_async.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# BatchLoader
+# ---------------------------------------------------------------------------
+
+
+class TestDeputyLoader:
+    def test_coalesces_and_dedupes_ids(self):
+        api = MagicMock()
+        api.get_deputy.side_effect = lambda dep_id: {"id": dep_id}
+
+        with DeputyLoader(api) as loader:
+            futures = [loader.load(i) for i in (1, 2, 1, 3, 2)]
+            results = [f.result(timeout=5) for f in futures]
+            again = loader.load(1).result(timeout=5)
+
+        assert results == [{"id": i} for i in (1, 2, 1, 3, 2)]
+        assert again == {"id": 1}
+        # The in-flight batch is deduplicated; the later load fetches again
+        assert sorted(c.args[0] for c in api.get_deputy.call_args_list) == [1, 1, 2, 3]
+
+    def test_later_loads_get_independent_results(self):
+        api = MagicMock()
+        api.get_deputy.side_effect = lambda dep_id: {"id": dep_id}
+
+        with DeputyLoader(api) as loader:
+            first = loader.load(2).result(timeout=5)
+            first["id"] = "mutated"
+            second = loader.load(2).result(timeout=5)
+
+        assert second == {"id": 2}
+
+    def test_propagates_errors(self):
+        api = MagicMock()
+        api.get_deputy.side_effect = CamaraAPIError("down")
+
+        with DeputyLoader(api) as loader:
+            future = loader.load(7)
+            with pytest.raises(CamaraAPIError):
+                future.result(timeout=5)
+
+    def test_close_flushes_pending_batch(self):
+        api = MagicMock()
+        api.get_deputy.return_value = {"id": 9}
+        loader = DeputyLoader(api, window=60)
+
+        future = loader.load(9)
+        loader.close()
+
+        assert future.result(timeout=0) == {"id": 9}
+
+    def test_load_after_close_raises(self):
+        loader = DeputyLoader(MagicMock())
+        loader.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            loader.load(3)
+
+    def test_failed_dispatch_fails_its_futures(self):
+        loader = DeputyLoader(MagicMock(), window=60)
+        future = loader.load(4)
+        loader._timer.cancel()
+        loader._pool.shutdown()
+
+        loader._dispatch()
+
+        with pytest.raises(RuntimeError):
+            future.result(timeout=0)
+        loader.close()
+
+
+@pytest.mark.parametrize(
+    "endpoint, source",
+    [
+        ("/deputados/1/despesas", "camara_deputados"),
+        ("/votacoes/S1/votos", "camara_votos"),
+        ("/proposicoes/99", "camara_proposicoes"),
+        ("/partidos", "camara"),
+    ],
+)
+def test_source_name(endpoint, source):
+    assert camara_api._source_name(endpoint) == source
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import hashlib
+import subprocess
+import sys
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.sources.rss import FEEDS, FeedArticle, RSSFetcher
+from src.sources.cache import APICache
+from src.sources.rss import FEEDS, FeedArticle, FeedSpec, RSSFetcher
 
 
 # ---------------------------------------------------------------------------
@@ -38,21 +41,24 @@ class TestFeedArticle:
         entry.content = content
         return entry
 
-    def _meta(
+    def _spec(
         self,
+        key: str = "k",
         source_name: str = "Test Source",
         language: str = "pt-BR",
-        tags: list | None = None,
-    ) -> dict:
-        return {
-            "source_name": source_name,
-            "language": language,
-            "tags": tags or ["política"],
-        }
+        tags: tuple = ("política",),
+    ) -> FeedSpec:
+        return FeedSpec(
+            key=key,
+            url="https://example.com/feed",
+            source_name=source_name,
+            language=language,
+            tags=tags,
+        )
 
     def test_from_entry_basic(self):
         entry = self._make_entry()
-        article = FeedArticle.from_entry(entry, "test_key", self._meta())
+        article = FeedArticle.from_entry(entry, self._spec(key="test_key"))
 
         assert article.url == "https://example.com/article"
         assert article.title == "Lula sanciona nova lei"
@@ -61,15 +67,29 @@ class TestFeedArticle:
         assert article.language == "pt-BR"
         assert "política" in article.tags
 
-    def test_id_is_sha256_of_url(self):
+    def test_articles_share_spec_strings(self):
+        spec = self._spec()
+        first = FeedArticle.from_entry(self._make_entry(link="https://example.com/1"), spec)
+        second = FeedArticle.from_entry(self._make_entry(link="https://example.com/2"), spec)
+        assert first.tags is second.tags is spec.tags
+        assert first.source_name is second.source_name
+
+    def test_spec_strings_are_interned(self):
+        spec = FeedSpec.from_dict(
+            "k", {"url": "u", "source_name": "".join(["Fo", "lha"]), "language": "pt-BR"}
+        )
+        assert spec.source_name is sys.intern("Folha")
+
+    def test_id_is_blake2b_of_url(self):
         entry = self._make_entry(link="https://example.com/unique")
-        article = FeedArticle.from_entry(entry, "k", self._meta())
-        expected_id = hashlib.sha256(b"https://example.com/unique").hexdigest()[:16]
+        article = FeedArticle.from_entry(entry, self._spec())
+        expected_id = hashlib.blake2b(b"https://example.com/unique", digest_size=8).hexdigest()
         assert article.id == expected_id
+        assert len(article.id) == 16
 
     def test_published_at_parsed_correctly(self):
         entry = self._make_entry(published_parsed=(2024, 3, 15, 10, 30, 0, 0, 0, 0))
-        article = FeedArticle.from_entry(entry, "k", self._meta())
+        article = FeedArticle.from_entry(entry, self._spec())
         assert article.published_at is not None
         assert article.published_at.year == 2024
         assert article.published_at.month == 3
@@ -78,27 +98,44 @@ class TestFeedArticle:
     def test_published_at_none_when_missing(self):
         entry = self._make_entry(published_parsed=None)
         entry.published_parsed = None
-        article = FeedArticle.from_entry(entry, "k", self._meta())
+        article = FeedArticle.from_entry(entry, self._spec())
         assert article.published_at is None
 
+    def test_published_at_none_when_truncated(self):
+        entry = self._make_entry(published_parsed=(2024, 3, 15))
+        article = FeedArticle.from_entry(entry, self._spec())
+        assert article.published_at is None
+
+    def test_published_at_is_utc(self):
+        article = FeedArticle.from_entry(self._make_entry(), self._spec())
+        assert article.published_at == datetime(2024, 3, 15, 10, 0, tzinfo=timezone.utc)
+
     def test_content_field_preferred_over_summary(self):
         entry = self._make_entry(
             content=[{"value": "Full article content here."}]
         )
-        article = FeedArticle.from_entry(entry, "k", self._meta())
+        article = FeedArticle.from_entry(entry, self._spec())
         assert article.summary == "Full article content here."
 
     def test_to_dict_keys(self):
         entry = self._make_entry()
-        article = FeedArticle.from_entry(entry, "k", self._meta())
+        article = FeedArticle.from_entry(entry, self._spec())
         d = article.to_dict()
         required_keys = {"id", "url", "title", "summary", "published_at",
                          "source_key", "source_name", "language", "tags", "full_text"}
         assert required_keys == set(d.keys())
 
+    def test_from_dict_roundtrip(self):
+        article = FeedArticle.from_entry(self._make_entry(), self._spec())
+        assert FeedArticle.from_dict(article.to_dict()) == article
+
+    def test_has_no_instance_dict(self):
+        article = FeedArticle.from_entry(self._make_entry(), self._spec())
+        assert not hasattr(article, "__dict__")
+
     def test_full_text_default_none(self):
         entry = self._make_entry()
-        article = FeedArticle.from_entry(entry, "k", self._meta())
+        article = FeedArticle.from_entry(entry, self._spec())
         assert article.full_text is None
 
 
@@ -114,23 +151,24 @@ class TestFeedsRegistry:
         assert len(FEEDS) == 10
 
     def test_each_feed_has_url(self):
-        for key, meta in FEEDS.items():
-            assert "url" in meta, f"Feed '{key}' missing 'url'"
-            assert meta["url"].startswith("http"), f"Feed '{key}' URL not HTTP"
+        for key, spec in FEEDS.items():
+            assert spec.url.startswith("http"), f"Feed '{key}' URL not HTTP"
 
     def test_each_feed_has_source_name(self):
-        for key, meta in FEEDS.items():
-            assert "source_name" in meta
-            assert len(meta["source_name"]) > 0
+        for key, spec in FEEDS.items():
+            assert len(spec.source_name) > 0
 
     def test_each_feed_has_language(self):
-        for key, meta in FEEDS.items():
-            assert "language" in meta
+        for key, spec in FEEDS.items():
+            assert spec.language
 
     def test_each_feed_has_tags(self):
-        for key, meta in FEEDS.items():
-            assert "tags" in meta
-            assert isinstance(meta["tags"], list)
+        for key, spec in FEEDS.items():
+            assert isinstance(spec.tags, tuple)
+
+    def test_registry_keys_match_specs(self):
+        for key, spec in FEEDS.items():
+            assert spec.key == key
 
     def test_known_feeds_present(self):
         assert "agencia_brasil" in FEEDS
@@ -168,8 +206,8 @@ class TestRSSFetcher:
         resp.raise_for_status = MagicMock()
         return resp
 
-    @patch("src.sources.rss.feedparser.parse")
-    @patch("src.sources.rss.httpx.get")
+    @patch("feedparser.parse")
+    @patch("src.sources.rss.httpx.Client.get")
     def test_fetch_feed_returns_articles(self, mock_httpx_get, mock_parse):
         entries = [
             self._make_entry("https://ex.com/1", "Notícia 1"),
@@ -184,8 +222,8 @@ class TestRSSFetcher:
         assert len(articles) == 2
         assert all(isinstance(a, FeedArticle) for a in articles)
 
-    @patch("src.sources.rss.feedparser.parse")
-    @patch("src.sources.rss.httpx.get")
+    @patch("feedparser.parse")
+    @patch("src.sources.rss.httpx.Client.get")
     def test_fetch_feed_applies_max_articles(self, mock_httpx_get, mock_parse):
         entries = [
             self._make_entry(f"https://ex.com/{i}", f"Notícia {i}")
@@ -198,15 +236,15 @@ class TestRSSFetcher:
         articles = fetcher.fetch_feed("agencia_brasil")
         assert len(articles) == 10
 
-    @patch("src.sources.rss.feedparser.parse")
-    @patch("src.sources.rss.httpx.get")
+    @patch("feedparser.parse")
+    @patch("src.sources.rss.httpx.Client.get")
     def test_fetch_feed_unknown_key_raises(self, mock_httpx_get, mock_parse):
         fetcher = RSSFetcher()
         with pytest.raises(KeyError):
             fetcher.fetch_feed("nonexistent_feed")
 
-    @patch("src.sources.rss.feedparser.parse")
-    @patch("src.sources.rss.httpx.get")
+    @patch("feedparser.parse")
+    @patch("src.sources.rss.httpx.Client.get")
     def test_fetch_feed_empty_entries_returns_empty(self, mock_httpx_get, mock_parse):
         mock_httpx_get.return_value = self._mock_httpx_response()
         mock_parse.return_value = self._mock_feed_dict([])
@@ -215,8 +253,8 @@ class TestRSSFetcher:
         articles = fetcher.fetch_feed("agencia_brasil")
         assert articles == []
 
-    @patch("src.sources.rss.feedparser.parse")
-    @patch("src.sources.rss.httpx.get")
+    @patch("feedparser.parse")
+    @patch("src.sources.rss.httpx.Client.get")
     def test_fetch_all_aggregates_all_feeds(self, mock_httpx_get, mock_parse):
         entries = [self._make_entry("https://ex.com/x", "X")]
         mock_httpx_get.return_value = self._mock_httpx_response()
@@ -229,3 +267,66 @@ class TestRSSFetcher:
         assert len(all_articles) > 0
         source_keys = {a.source_key for a in all_articles}
         assert len(source_keys) > 1
+
+    @patch("feedparser.parse")
+    @patch("src.sources.rss.httpx.Client.get")
+    def test_fetch_all_keeps_feed_order_and_skips_failures(self, mock_httpx_get, mock_parse):
+        feeds = {
+            key: {"url": f"https://ex.com/{key}", "source_name": key, "language": "pt-BR"}
+            for key in ("a", "b", "c")
+        }
+
+        def fake_get(url, **kwargs):
+            if url.endswith("/b"):
+                raise RuntimeError("boom")
+            return self._mock_httpx_response(url.encode())
+
+        mock_httpx_get.side_effect = fake_get
+        mock_parse.side_effect = lambda content: self._mock_feed_dict(
+            [self._make_entry(content.decode(), "T")]
+        )
+
+        articles = RSSFetcher(feeds=feeds).fetch_all()
+
+        assert [a.source_key for a in articles] == ["a", "c"]
+
+    def test_fetchers_share_one_client(self):
+        with RSSFetcher() as first:
+            client = first._client
+        assert not client.is_closed
+        assert RSSFetcher(timeout=5)._client is client
+
+    def test_shutdown_closes_shared_client(self):
+        client = RSSFetcher()._client
+        RSSFetcher.shutdown()
+        assert client.is_closed
+        assert RSSFetcher()._client is not client
+
+    @patch("feedparser.parse")
+    @patch("src.sources.rss.httpx.Client.get")
+    def test_conditional_get_reuses_cached_articles(self, mock_get, mock_parse, tmp_path):
+        cache = APICache(db_path=tmp_path / "cache.db")
+        first = self._mock_httpx_response()
+        first.status_code = 200
+        first.headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        not_modified = MagicMock(status_code=304)
+        mock_get.side_effect = [first, not_modified]
+        mock_parse.return_value = self._mock_feed_dict([self._make_entry("https://ex.com/1", "Um")])
+
+        fetcher = RSSFetcher(cache=cache)
+        fresh = fetcher.fetch_feed("agencia_brasil")
+        again = fetcher.fetch_feed("agencia_brasil")
+
+        assert again == fresh
+        assert mock_parse.call_count == 1
+        headers = mock_get.call_args_list[1][1]["headers"]
+        assert headers == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+
+def test_import_does_not_load_feedparser():
+    code = "import sys, src.sources.rss; print('feedparser' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.sources.scraper import ArticleScraper, ExtractedArticle
+from src.sources.scraper import ArticleScraper, ExtractedArticle, _parse_html
 
 
 # ---------------------------------------------------------------------------
@@ -88,6 +90,59 @@ do tribunal. O governo federal também manifestou apoio à maior transparência.
 """
 
 
+def _doc(text, **meta):
+    """Stand-in for the trafilatura Document returned by bare_extraction."""
+    from trafilatura.settings import Document
+
+    fields = {"title": None, "author": None, "date": None, "language": None, **meta}
+    return MagicMock(spec=Document, text=text, **fields)
+
+
+ARTICLE_HTML = "<html><body><article>{}</article></body></html>".format(
+    "".join(f"<p>{p}</p>" for p in LONG_ARTICLE_TEXT.strip().split("\n\n"))
+)
+
+
+def _stream_response(html: str = ARTICLE_HTML, content_type: str = "text/html; charset=utf-8"):
+    """Mock streamed response usable from both Client.stream and AsyncClient.stream."""
+    body = html.encode()
+    resp = MagicMock()
+    resp.headers = {"content-type": content_type, "content-length": str(len(body))}
+    resp.encoding = "utf-8"
+    resp.raise_for_status = MagicMock()
+    resp.iter_bytes.return_value = [body]
+    resp.aiter_bytes.return_value.__aiter__.return_value = [body]
+    return resp
+
+
+def _mock_sync_stream(mock_client_cls, resp=None, side_effect=None):
+    mock_client = MagicMock()
+    if side_effect is not None:
+        mock_client.stream.side_effect = side_effect
+    else:
+        mock_client.stream.return_value.__enter__.return_value = resp
+    mock_client_cls.return_value = mock_client
+    return mock_client
+
+
+def _mock_async_stream(mock_client_cls, responses):
+    """*responses* is one response for every url, or a callable url -> response/exception."""
+    mock_client = MagicMock()
+
+    def stream(method, url):
+        result = responses if isinstance(responses, MagicMock) else responses(url)
+        ctx = MagicMock()
+        if isinstance(result, Exception):
+            ctx.__aenter__.side_effect = result
+        else:
+            ctx.__aenter__.return_value = result
+        return ctx
+
+    mock_client.stream = stream
+    mock_client_cls.return_value.__aenter__.return_value = mock_client
+    return mock_client
+
+
 class TestArticleScraper:
     """Tests for ArticleScraper — network calls fully mocked."""
 
@@ -97,18 +152,11 @@ class TestArticleScraper:
             assert scraper is not None
 
     @patch("src.sources.scraper.httpx.Client")
-    @patch("src.sources.scraper.trafilatura.extract")
+    @patch("trafilatura.bare_extraction")
     def test_extract_success(self, mock_extract, mock_client_cls):
         """extract() returns usable ExtractedArticle when text is found."""
-        mock_extract.return_value = LONG_ARTICLE_TEXT
-
-        mock_response = MagicMock()
-        mock_response.text = "<html><body>article</body></html>"
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+        mock_extract.return_value = _doc(LONG_ARTICLE_TEXT)
+        _mock_sync_stream(mock_client_cls, _stream_response())
 
         scraper = ArticleScraper()
         result = scraper.extract("https://example.com/article")
@@ -118,20 +166,14 @@ class TestArticleScraper:
         assert result.text is not None
         assert "Supremo Tribunal Federal" in result.text
         assert result.url == "https://example.com/article"
+        assert result.html == ARTICLE_HTML
 
     @patch("src.sources.scraper.httpx.Client")
-    @patch("src.sources.scraper.trafilatura.extract")
+    @patch("trafilatura.bare_extraction")
     def test_extract_failure_returns_failed_article(self, mock_extract, mock_client_cls):
         """extract() returns success=False when trafilatura returns None."""
         mock_extract.return_value = None
-
-        mock_response = MagicMock()
-        mock_response.text = "<html></html>"
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+        _mock_sync_stream(mock_client_cls, _stream_response())
 
         scraper = ArticleScraper()
         result = scraper.extract("https://example.com/empty")
@@ -144,9 +186,9 @@ class TestArticleScraper:
         """extract() returns success=False on HTTP error."""
         import httpx
 
-        mock_client = MagicMock()
-        mock_client.get.side_effect = httpx.RequestError("timeout", request=MagicMock())
-        mock_client_cls.return_value = mock_client
+        _mock_sync_stream(
+            mock_client_cls, side_effect=httpx.RequestError("timeout", request=MagicMock())
+        )
 
         scraper = ArticleScraper()
         result = scraper.extract("https://example.com/timeout")
@@ -155,26 +197,161 @@ class TestArticleScraper:
         assert result.error is not None
 
     @patch("src.sources.scraper.httpx.Client")
-    @patch("src.sources.scraper.trafilatura.extract")
-    def test_extract_batch_returns_list(self, mock_extract, mock_client_cls):
-        """extract_batch() returns a list of ExtractedArticle objects."""
-        mock_extract.return_value = LONG_ARTICLE_TEXT
+    @patch("trafilatura.bare_extraction")
+    def test_extract_skips_non_html(self, mock_extract, mock_client_cls):
+        resp = _stream_response(content_type="application/pdf")
+        _mock_sync_stream(mock_client_cls, resp)
+
+        result = ArticleScraper().extract("https://example.com/report.pdf")
 
-        mock_response = MagicMock()
-        mock_response.text = "<html></html>"
-        mock_response.raise_for_status = MagicMock()
+        assert result.success is False
+        assert "non-html" in result.error
+        resp.iter_bytes.assert_not_called()
+        mock_extract.assert_not_called()
+
+    @patch("src.sources.scraper.httpx.Client")
+    @patch("trafilatura.bare_extraction")
+    def test_extract_skips_tiny_body(self, mock_extract, mock_client_cls):
+        _mock_sync_stream(mock_client_cls, _stream_response("<html>404</html>"))
 
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+        result = ArticleScraper().extract("https://example.com/gone")
+
+        assert "too small" in result.error
+        mock_extract.assert_not_called()
+
+    @patch("src.sources.scraper._MAX_BODY_BYTES", 1000)
+    @patch("src.sources.scraper.httpx.Client")
+    @patch("trafilatura.bare_extraction")
+    def test_extract_stops_reading_oversized_body(self, mock_extract, mock_client_cls):
+        resp = _stream_response()
+        resp.headers.pop("content-length")
+        resp.iter_bytes.return_value = iter([b"x" * 600, b"x" * 600, b"never read"])
+        _mock_sync_stream(mock_client_cls, resp)
+
+        result = ArticleScraper().extract("https://example.com/huge")
+
+        assert "too large" in result.error
+        assert list(resp.iter_bytes.return_value) == [b"never read"]
+        mock_extract.assert_not_called()
+
+    @patch("src.sources.scraper.httpx.AsyncClient")
+    @patch("trafilatura.bare_extraction")
+    def test_extract_batch_returns_list(self, mock_extract, mock_client_cls):
+        """extract_batch() returns a list of ExtractedArticle objects."""
+        mock_extract.return_value = _doc(LONG_ARTICLE_TEXT)
+        _mock_async_stream(mock_client_cls, _stream_response())
 
         urls = [
             "https://example.com/1",
             "https://example.com/2",
             "https://example.com/3",
         ]
-        scraper = ArticleScraper()
+        scraper = ArticleScraper(parse_workers=0)
         results = scraper.extract_batch(urls)
 
         assert len(results) == 3
         assert all(isinstance(r, ExtractedArticle) for r in results)
+        assert all(r.success for r in results)
+
+    @patch("src.sources.scraper.httpx.AsyncClient")
+    @patch("trafilatura.bare_extraction")
+    def test_extract_batch_keeps_order_and_isolates_errors(self, mock_extract, mock_client_cls):
+        """A failing URL yields a failed article without affecting the others."""
+        import httpx
+
+        mock_extract.side_effect = lambda html, **kw: _doc(LONG_ARTICLE_TEXT + html)
+
+        def responses(url):
+            if url.endswith("/bad"):
+                return httpx.ConnectError("refused", request=MagicMock())
+            if url.endswith(".pdf"):
+                return _stream_response(content_type="application/pdf")
+            return _stream_response(ARTICLE_HTML + url)
+
+        _mock_async_stream(mock_client_cls, responses)
+
+        urls = [
+            "https://example.com/1",
+            "https://example.com/bad",
+            "https://example.com/3",
+            "https://example.com/4.pdf",
+        ]
+        results = ArticleScraper(parse_workers=0).extract_batch(urls)
+
+        assert [r.url for r in results] == urls
+        assert [r.success for r in results] == [True, False, True, False]
+        assert results[2].text.endswith("https://example.com/3")
+        assert "non-html" in results[3].error
+
+    @patch("trafilatura.bare_extraction")
+    def test_parse_reads_text_and_metadata_from_one_document(self, mock_extract):
+        mock_extract.return_value = _doc(
+            LONG_ARTICLE_TEXT, title="STF", author="Ana; Bia", date="2024-03-01"
+        )
+
+        result = _parse_html("https://example.com/a", "<html></html>")
+
+        assert mock_extract.call_count == 1
+        assert mock_extract.call_args.kwargs["with_metadata"] is True
+        assert mock_extract.call_args.kwargs["fast"] is False
+        assert "as_dict" not in mock_extract.call_args.kwargs
+        assert (result.title, result.author, result.date) == ("STF", "Ana; Bia", "2024-03-01")
+        assert result.is_usable
+
+    @patch("src.sources.scraper.httpx.AsyncClient")
+    def test_extract_batch_parses_in_worker_processes(self, mock_client_cls):
+        _mock_async_stream(mock_client_cls, _stream_response())
+
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        with ArticleScraper(parse_workers=2) as scraper:
+            results = scraper.extract_batch(urls)
+
+        assert [r.url for r in results] == urls
+        assert all(r.is_usable for r in results)
+        assert all(r.html == ARTICLE_HTML for r in results)
+
+    async def test_extract_batch_inside_running_loop_points_to_async_api(self):
+        scraper = ArticleScraper(parse_workers=0)
+        with patch.object(scraper, "extract_batch_async") as extract_async:
+            with pytest.raises(RuntimeError, match="extract_batch_async"):
+                scraper.extract_batch(["https://example.com/1"])
+        extract_async.assert_not_called()
+        scraper.close()
+
+    @patch("src.sources.scraper.ProcessPoolExecutor")
+    @patch("trafilatura.bare_extraction")
+    @patch("src.sources.scraper.httpx.AsyncClient")
+    def test_small_batch_parses_without_worker_processes(
+        self, mock_client_cls, mock_extract, mock_pool
+    ):
+        _mock_async_stream(mock_client_cls, _stream_response())
+        mock_extract.return_value = _doc(LONG_ARTICLE_TEXT)
+
+        urls = ["https://example.com/1", "https://example.com/2"]
+        results = ArticleScraper(parse_workers=8).extract_batch(urls)
+
+        assert all(r.is_usable for r in results)
+        mock_pool.assert_not_called()
+
+    @patch("src.sources.scraper.ProcessPoolExecutor")
+    @patch("src.sources.scraper.httpx.AsyncClient")
+    def test_process_pool_is_reused_across_batches_and_closed(
+        self, mock_client_cls, mock_pool
+    ):
+        _mock_async_stream(mock_client_cls, _stream_response(content_type="application/pdf"))
+        urls = [f"https://example.com/{i}" for i in range(5)]
+
+        with ArticleScraper(parse_workers=3) as scraper:
+            scraper.extract_batch(urls)
+            scraper.extract_batch(urls)
+
+        mock_pool.assert_called_once()
+        assert mock_pool.call_args.kwargs["max_workers"] == 3
+        assert mock_pool.call_args.kwargs["mp_context"].get_start_method() != "fork"
+        mock_pool.return_value.shutdown.assert_called_once_with(cancel_futures=True)
+
+
+def test_import_does_not_load_trafilatura():
+    code = "import sys, src.sources.scraper; print('trafilatura' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"